@@ -0,0 +1,39 @@
+"""add_invite_todo_filter_indexes
+
+Revision ID: a7b3c0d6e1f9
+Revises: f6a1b8c5d9e7
+Create Date: 2025-08-09 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b3c0d6e1f9'
+down_revision: Union[str, None] = 'f6a1b8c5d9e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 사용자별 대기 중 초대 조회용 부분 인덱스
+    op.create_index(
+        'ix_invites_user_pending', 'invites', ['user_id'],
+        postgresql_where=sa.text("status = 'pending'"), sqlite_where=sa.text("status = 'pending'"),
+    )
+    # 팀+사용자 초대 조회용 복합 인덱스
+    op.create_index('ix_invites_team_user', 'invites', ['team_id', 'user_id'])
+    # 마감일이 지난 미완료 할일 조회용 부분 인덱스
+    op.create_index(
+        'ix_todos_due_incomplete', 'todos', ['due_date'],
+        postgresql_where=sa.text('is_completed = false'), sqlite_where=sa.text('is_completed = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_todos_due_incomplete', table_name='todos')
+    op.drop_index('ix_invites_team_user', table_name='invites')
+    op.drop_index('ix_invites_user_pending', table_name='invites')
@@ -0,0 +1,27 @@
+"""add_team_members_team_user_index
+
+Revision ID: b7c2d9e4f1a3
+Revises: extend_roles_migration
+Create Date: 2025-08-05 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c2d9e4f1a3'
+down_revision: Union[str, None] = 'extend_roles_migration'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 권한 확인 쿼리 (team_id, user_id) 조회용 복합 유니크 인덱스
+    op.create_index('ix_team_members_team_user', 'team_members', ['team_id', 'user_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_team_members_team_user', table_name='team_members')
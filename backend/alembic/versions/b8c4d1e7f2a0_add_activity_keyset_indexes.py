@@ -0,0 +1,47 @@
+"""add_activity_keyset_indexes
+
+Revision ID: b8c4d1e7f2a0
+Revises: a7b3c0d6e1f9
+Create Date: 2025-08-10 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c4d1e7f2a0'
+down_revision: Union[str, None] = 'a7b3c0d6e1f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('activities', 'notifications')
+
+
+def _set_sqlite_now_default(expression: str) -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'created_at', existing_type=sa.DateTime(timezone=True), server_default=sa.text(expression)
+            )
+
+
+def upgrade() -> None:
+    # SQLite: created_at 기본값을 마이크로초 6자리로 저장해
+    # 바인딩된 datetime(키셋 커서)과의 문자열 비교가 올바르도록 함 (models의 kst_now와 동일)
+    if op.get_bind().dialect.name == 'sqlite':
+        _set_sqlite_now_default("(strftime('%Y-%m-%d %H:%M:%f', 'now', '+9 hours') || '000')")
+    # 필터별 최신순 조회/키셋 페이지네이션용 복합 인덱스
+    op.create_index('ix_activities_user_created', 'activities', ['user_id', 'created_at'])
+    op.create_index('ix_activities_resource_created', 'activities', ['resource_type', 'resource_id', 'created_at'])
+    op.create_index('ix_activities_action_created', 'activities', ['action', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_activities_action_created', table_name='activities')
+    op.drop_index('ix_activities_resource_created', table_name='activities')
+    op.drop_index('ix_activities_user_created', table_name='activities')
+    if op.get_bind().dialect.name == 'sqlite':
+        _set_sqlite_now_default("(strftime('%Y-%m-%d %H:%M:%f', 'now', '+9 hours'))")
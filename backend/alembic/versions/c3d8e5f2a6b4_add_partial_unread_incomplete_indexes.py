@@ -0,0 +1,36 @@
+"""add_partial_unread_incomplete_indexes
+
+Revision ID: c3d8e5f2a6b4
+Revises: b7c2d9e4f1a3
+Create Date: 2025-08-06 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8e5f2a6b4'
+down_revision: Union[str, None] = 'b7c2d9e4f1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 사용자별 읽지 않은 알림 조회용 부분 인덱스
+    op.create_index(
+        'ix_notifications_user_unread', 'notifications', ['user_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text('is_read = false'), sqlite_where=sa.text('is_read = 0'),
+    )
+    # 플래너별 미완료 할일 조회용 부분 인덱스
+    op.create_index(
+        'ix_todos_planner_incomplete', 'todos', ['planner_id', 'due_date'],
+        postgresql_where=sa.text('is_completed = false'), sqlite_where=sa.text('is_completed = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_todos_planner_incomplete', table_name='todos')
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
@@ -0,0 +1,35 @@
+"""add_covering_team_list_indexes
+
+Revision ID: d4e9f6a3b7c5
+Revises: c3d8e5f2a6b4
+Create Date: 2025-08-06 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e9f6a3b7c5'
+down_revision: Union[str, None] = 'c3d8e5f2a6b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 팀별 목록 조회용 인덱스 (PostgreSQL은 INCLUDE 컬럼으로 커버링 인덱스, SQLite는 무시됨)
+    op.create_index(
+        'ix_planners_team_created', 'planners', ['team_id', sa.text('created_at DESC')],
+        postgresql_include=['title', 'status'],
+    )
+    op.create_index(
+        'ix_posts_team_created', 'posts', ['team_id', sa.text('created_at DESC')],
+        postgresql_include=['title', 'author_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_team_created', table_name='posts')
+    op.drop_index('ix_planners_team_created', table_name='planners')
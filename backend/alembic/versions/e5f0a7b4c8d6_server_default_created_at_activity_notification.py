@@ -0,0 +1,45 @@
+"""server_default_created_at_activity_notification
+
+Revision ID: e5f0a7b4c8d6
+Revises: d4e9f6a3b7c5
+Create Date: 2025-08-06 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f0a7b4c8d6'
+down_revision: Union[str, None] = 'd4e9f6a3b7c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('activities', 'notifications')
+
+
+def _now_default() -> sa.TextClause:
+    # SQLite는 KST 시각을 타임존 없이 저장 (models의 kst_now와 동일)
+    if op.get_bind().dialect.name == 'sqlite':
+        return sa.text("(strftime('%Y-%m-%d %H:%M:%f', 'now', '+9 hours'))")
+    return sa.text('CURRENT_TIMESTAMP')
+
+
+def upgrade() -> None:
+    # 대량 기록 테이블의 created_at을 DB 서버 기본값으로 채움
+    # SQLite는 컬럼 기본값을 바로 변경할 수 없으므로 batch 모드(테이블 재생성) 사용
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'created_at', existing_type=sa.DateTime(timezone=True), server_default=_now_default()
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'created_at', existing_type=sa.DateTime(timezone=True), server_default=None
+            )
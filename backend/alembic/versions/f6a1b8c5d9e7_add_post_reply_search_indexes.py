@@ -0,0 +1,84 @@
+"""add_post_reply_search_indexes
+
+Revision ID: f6a1b8c5d9e7
+Revises: e5f0a7b4c8d6
+Create Date: 2025-08-08 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a1b8c5d9e7'
+down_revision: Union[str, None] = 'e5f0a7b4c8d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# FTS5 trigram 외부 콘텐츠 인덱스 + 동기화 트리거 (이 리비전 시점의 컬럼 목록으로 고정)
+SQLITE_FTS_UPGRADE = {
+    'posts': [
+        "CREATE VIRTUAL TABLE posts_fts USING fts5(title, content, "
+        "content='posts', content_rowid='id', tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN "
+        "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+        "CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+        "CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+        "INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+        "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')",
+    ],
+    'replies': [
+        "CREATE VIRTUAL TABLE replies_fts USING fts5(content, "
+        "content='replies', content_rowid='id', tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS replies_fts_ai AFTER INSERT ON replies BEGIN "
+        "INSERT INTO replies_fts(rowid, content) VALUES (new.id, new.content); END",
+        "CREATE TRIGGER IF NOT EXISTS replies_fts_ad AFTER DELETE ON replies BEGIN "
+        "INSERT INTO replies_fts(replies_fts, rowid, content) VALUES ('delete', old.id, old.content); END",
+        "CREATE TRIGGER IF NOT EXISTS replies_fts_au AFTER UPDATE ON replies BEGIN "
+        "INSERT INTO replies_fts(replies_fts, rowid, content) VALUES ('delete', old.id, old.content); "
+        "INSERT INTO replies_fts(rowid, content) VALUES (new.id, new.content); END",
+        "INSERT INTO replies_fts(replies_fts) VALUES ('rebuild')",
+    ],
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        # init_db가 이미 만든 인덱스는 건너뜀 (새로 만든 경우 기존 행으로 재구성)
+        for table_name, statements in SQLITE_FTS_UPGRADE.items():
+            exists = bind.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (f'{table_name}_fts',)
+            ).first()
+            if exists:
+                continue
+            for statement in statements:
+                op.execute(statement)
+    elif bind.dialect.name == 'postgresql':
+        # PostgreSQL은 pg_trgm GIN 인덱스로 기존 ILIKE 검색을 가속
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_posts_search_trgm', 'posts', ['title', 'content'], postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops', 'content': 'gin_trgm_ops'},
+        )
+        op.create_index(
+            'ix_replies_search_trgm', 'replies', ['content'], postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for table_name in ('posts', 'replies'):
+            op.execute(f'DROP TABLE IF EXISTS {table_name}_fts')
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f'DROP TRIGGER IF EXISTS {table_name}_fts_{suffix}')
+    elif bind.dialect.name == 'postgresql':
+        op.drop_index('ix_replies_search_trgm', table_name='replies')
+        op.drop_index('ix_posts_search_trgm', table_name='posts')
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import datetime
+from pydantic import TypeAdapter
 from schemas.activity import ActivityRead
 from models.activity import Activity
 from models.user import User
@@ -13,10 +15,15 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/activities", tags=["activities"])
 
+# 활동 목록을 한 번에 검증하는 어댑터 (모듈 로드 시 한 번만 생성)
+_ACTIVITIES_ADAPTER = TypeAdapter(List[ActivityRead])
+
 @router.get("/", response_model=List[ActivityRead])
 def read_activities(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    before: Optional[datetime] = Query(None, description="직전 페이지 마지막 항목의 created_at (키셋 페이지네이션)"),
+    before_id: Optional[int] = Query(None, description="직전 페이지 마지막 항목의 id"),
     user_id: Optional[int] = None,
     action: Optional[str] = None,
     resource_type: Optional[str] = None,
@@ -26,8 +33,8 @@ def read_activities(
     """활동 로그를 조회합니다."""
     try:
         activity_service = ActivityService(db)
-        activities = activity_service.get_activities(skip, limit, user_id, action, resource_type)
-        return [ActivityRead.model_validate(activity) for activity in activities]
+        activities = activity_service.get_activities(skip, limit, user_id, action, resource_type, before, before_id)
+        return _ACTIVITIES_ADAPTER.validate_python(activities, from_attributes=True)
     except Exception as e:
         logger.error(f"활동 로그 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"활동 로그 조회 오류: {str(e)}")
@@ -37,14 +44,16 @@ def read_user_activities(
     user_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    before: Optional[datetime] = Query(None, description="직전 페이지 마지막 항목의 created_at (키셋 페이지네이션)"),
+    before_id: Optional[int] = Query(None, description="직전 페이지 마지막 항목의 id"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> List[ActivityRead]:
     """특정 사용자의 활동 로그를 조회합니다."""
     try:
         activity_service = ActivityService(db)
-        activities = activity_service.get_user_activities(user_id, skip, limit)
-        return [ActivityRead.model_validate(activity) for activity in activities]
+        activities = activity_service.get_user_activities(user_id, skip, limit, before, before_id)
+        return _ACTIVITIES_ADAPTER.validate_python(activities, from_attributes=True)
     except Exception as e:
         logger.error(f"사용자 활동 로그 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"사용자 활동 로그 조회 오류: {str(e)}")
@@ -54,14 +63,16 @@ def read_team_activities(
     team_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    before: Optional[datetime] = Query(None, description="직전 페이지 마지막 항목의 created_at (키셋 페이지네이션)"),
+    before_id: Optional[int] = Query(None, description="직전 페이지 마지막 항목의 id"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> List[ActivityRead]:
     """팀 관련 활동 로그를 조회합니다."""
     try:
         activity_service = ActivityService(db)
-        activities = activity_service.get_team_activities(team_id, skip, limit)
-        return [ActivityRead.model_validate(activity) for activity in activities]
+        activities = activity_service.get_team_activities(team_id, skip, limit, before, before_id)
+        return _ACTIVITIES_ADAPTER.validate_python(activities, from_attributes=True)
     except Exception as e:
         logger.error(f"팀 활동 로그 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"팀 활동 로그 조회 오류: {str(e)}") 
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from database import get_db
 from models.user import User
+from repositories.user_repository import UserRepository
 from schemas.email_verification import (
     EmailVerificationCreate,
     EmailVerificationVerify,
@@ -39,11 +40,10 @@ def send_verification_email(
         expires_at = TimeService.now_kst() + timedelta(hours=24)
         
         # User 모델에 직접 저장
-        db.query(User).filter(User.id == user.id).update({
+        UserRepository(db).update_by_id(user.id, {
             "email_verification_token": verification_code,
             "email_verification_expires": expires_at
         })
-        db.commit()
         
         # 이메일 발송
         email_service = EmailService()
@@ -94,12 +94,11 @@ def verify_email(
             raise HTTPException(status_code=400, detail="인증 코드가 만료되었습니다.")
         
         # 인증 완료 처리
-        db.query(User).filter(User.id == user.id).update({
+        UserRepository(db).update_by_id(user.id, {
             "is_email_verified": True,
             "email_verification_token": None,
             "email_verification_expires": None
         })
-        db.commit()
         
         return EmailVerificationResponse(
             message="이메일 인증이 완료되었습니다.",
@@ -133,11 +132,10 @@ def resend_verification_email(
         expires_at = TimeService.now_kst() + timedelta(hours=24)
         
         # User 모델에 직접 저장
-        db.query(User).filter(User.id == user.id).update({
+        UserRepository(db).update_by_id(user.id, {
             "email_verification_token": verification_code,
             "email_verification_expires": expires_at
         })
-        db.commit()
         
         # 이메일 재발송
         email_service = EmailService()
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
+from pydantic import TypeAdapter
 from schemas.notification import NotificationRead, NotificationUpdate, NotificationCreate
 from models.notification import Notification
 from models.user import User
@@ -10,6 +11,9 @@ from services.notification_service import NotificationService
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+# 알림 목록을 한 번에 검증하는 어댑터 (모듈 로드 시 한 번만 생성)
+_NOTIFICATIONS_ADAPTER = TypeAdapter(List[NotificationRead])
+
 @router.post("/", response_model=NotificationRead)
 def create_notification_endpoint(
     notification: NotificationCreate,
@@ -42,7 +46,8 @@ def read_notifications(
     """사용자의 알림 목록 조회"""
     try:
         notification_service = NotificationService(db)
-        return [NotificationRead.model_validate(n) for n in notification_service.get_user_notifications(current_user, skip, limit)]
+        notifications = notification_service.get_user_notifications(current_user, skip, limit)
+        return _NOTIFICATIONS_ADAPTER.validate_python(notifications, from_attributes=True)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"알림 목록 조회 오류: {str(e)}")
 
@@ -28,7 +28,6 @@ from core.exceptions import AuthenticationError, NotFoundError, ConflictError, V
 from core.logging_config import get_logger
 from core.validators import input_validator
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from core.security import decode_access_token
 from fastapi.security import OAuth2PasswordRequestForm
 
@@ -235,7 +234,7 @@ def read_me(current_user: User = Depends(get_current_user)):
 def search_user_by_email(email: str, user_service: UserService = Depends(get_user_service)):
     """이메일로 사용자 검색"""
     try:
-        user = user_service.get_user_by_email(email)
+        user = user_service.get_user_summary_by_email(email)
         
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
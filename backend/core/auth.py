@@ -15,10 +15,10 @@ FastAPI의 의존성 주입 시스템을 활용하여 API 엔드포인트에서
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+import jwt
 from database import get_db
 from models import User
-from core.config import settings
+from core.security import JWT_SECRET_KEY, JWT_ALGORITHM
 from datetime import datetime
 
 # OAuth2 Password Bearer 스키마 설정
@@ -66,9 +66,9 @@ def get_current_user(
     try:
         # JWT 토큰 디코딩 및 검증
         token = credentials
-        # settings.secret_key로 토큰 서명 검증
-        # settings.algorithm으로 암호화 알고리즘 확인
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        # JWT_SECRET_KEY로 토큰 서명 검증
+        # JWT_ALGORITHM으로 암호화 알고리즘 확인
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM], options={"require": ["exp"]})
         
         # 토큰 페이로드에서 사용자 ID 추출
         user_id = payload.get("sub")  # JWT 표준에서 사용자 ID는 "sub" 필드에 저장
@@ -78,7 +78,7 @@ def get_current_user(
         # 문자열을 정수로 변환 (JWT는 모든 값을 문자열로 저장)
         user_id = int(user_id)
         
-    except JWTError:
+    except jwt.PyJWTError:
         # JWT 디코딩 실패 시 인증 실패
         raise credentials_exception
     
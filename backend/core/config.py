@@ -54,8 +54,8 @@ class Settings(BaseSettings):
     
     # 성능 최적화 설정
     # 데이터베이스 연결 풀 설정으로 성능과 안정성 향상
-    db_pool_size: int = 10  # 연결 풀 크기 (동시 연결 수)
-    db_max_overflow: int = 20  # 최대 오버플로우 연결 수
+    db_pool_size: int = 20  # 연결 풀 크기 (동시 연결 수)
+    db_max_overflow: int = 40  # 최대 오버플로우 연결 수
     db_pool_timeout: int = 30  # 연결 대기 시간 (초)
     db_pool_recycle: int = 1800  # 연결 재생성 주기 (30분)
     db_pool_pre_ping: bool = True  # 연결 전 상태 확인
@@ -70,6 +70,11 @@ class Settings(BaseSettings):
     rate_limit_per_minute: int = 100  # 분당 최대 요청 수
     rate_limit_per_hour: int = 1000  # 시간당 최대 요청 수
     
+    # CORS 설정
+    # 자격 증명(쿠키/인증 헤더)을 허용하므로 와일드카드 대신 명시적인 출처 목록 사용
+    cors_origins: list = ["http://localhost:3000", "http://127.0.0.1:3000"]  # 허용할 프론트엔드 출처
+    cors_max_age: int = 86400  # 브라우저의 preflight 응답 캐시 시간 (1일)
+    
     # 파일 업로드 설정
     # 사용자가 업로드할 수 있는 파일 제한
     max_file_size: int = 10 * 1024 * 1024  # 최대 파일 크기 (10MB)
@@ -1,18 +1,26 @@
 import logging
 import logging.handlers
 import os
-import json
+import sys
+import orjson
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
-from core.config import settings
 
-# 로그 디렉토리 생성
+# 로그 디렉토리 (setup_logging 호출 시 생성)
 log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
+
+# setup_logging 중복 호출 방지 플래그
+_configured = False
+
+# 구조화된 로그에 기록되는 컨텍스트 필드
+_CONTEXT_FIELDS = (
+    "user_id", "request_id", "endpoint", "method",
+    "ip_address", "execution_time", "status_code", "error_code"
+)
 
 class JSONFormatter(logging.Formatter):
-    """JSON 형식 로그 포맷터"""
+    """JSON 형식 로그 포맷터 (orjson 직렬화)"""
     
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
@@ -26,16 +34,19 @@ class JSONFormatter(logging.Formatter):
         }
         
         # 예외 정보가 있으면 추가
+        # 포맷된 traceback은 record.exc_text에 캐시하여 다른 핸들러와 공유
         if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry["exception"] = record.exc_text
         
-        # 추가 필드가 있으면 추가
-        if hasattr(record, 'extra_fields'):
-            extra_fields = getattr(record, 'extra_fields', None)
-            if extra_fields:
-                log_entry.update(extra_fields)
+        # 추가 필드가 있으면 추가 (None 값은 StructuredLogger에서 이미 제외됨)
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            log_entry.update(extra_fields)
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        # 직렬화할 수 없는 값은 문자열로 변환
+        return orjson.dumps(log_entry, default=str).decode()
 
 class ColoredFormatter(logging.Formatter):
     """컬러 로그 포맷터"""
@@ -49,11 +60,24 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'      # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 레벨별 컬러 문자열을 미리 만들어 매 로그마다 문자열 조합을 피함
+        reset = self.COLORS['RESET']
+        self._colored_levelnames = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
     def format(self, record):
         # 로그 레벨에 따른 색상 적용
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        record.levelname = f"{color}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        # 다른 핸들러가 같은 레코드를 사용하므로 포맷 후 원래 레벨명으로 복원
+        levelname = record.levelname
+        record.levelname = self._colored_levelnames.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 class StructuredLogger:
     """구조화된 로거 클래스"""
@@ -61,21 +85,22 @@ class StructuredLogger:
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """해당 레벨의 로그가 기록되는지 확인 (로그 필드 구성 전에 확인하는 용도)"""
+        return self.logger.isEnabledFor(level)
+    
     def _log_with_context(self, level: int, message: str, **kwargs):
         """컨텍스트 정보와 함께 로그 기록"""
-        extra_fields = {
-            "user_id": kwargs.get("user_id"),
-            "request_id": kwargs.get("request_id"),
-            "endpoint": kwargs.get("endpoint"),
-            "method": kwargs.get("method"),
-            "ip_address": kwargs.get("ip_address"),
-            "execution_time": kwargs.get("execution_time"),
-            "status_code": kwargs.get("status_code"),
-            "error_code": kwargs.get("error_code")
-        }
+        # 비활성화된 레벨이면 레코드를 만들지 않음
+        if not self.logger.isEnabledFor(level):
+            return
         
-        # None 값 제거
-        extra_fields = {k: v for k, v in extra_fields.items() if v is not None}
+        # None이 아닌 값만 한 번의 순회로 담음
+        extra_fields = {}
+        for key in _CONTEXT_FIELDS:
+            value = kwargs.get(key)
+            if value is not None:
+                extra_fields[key] = value
         
         record = self.logger.makeRecord(
             self.logger.name, level, "", 0, message, (), None
@@ -99,10 +124,18 @@ class StructuredLogger:
         self._log_with_context(logging.CRITICAL, message, **kwargs)
 
 def setup_logging():
-    """로깅 설정"""
+    """로깅 설정 (여러 번 호출되어도 최초 한 번만 적용)"""
+    global _configured
     
-    # 루트 로거 설정
     root_logger = logging.getLogger()
+    if _configured:
+        return root_logger
+    
+    # 설정 로드와 디렉토리 생성은 모듈 임포트 시점이 아닌 실제 설정 시점에 수행
+    from core.config import settings
+    log_dir.mkdir(exist_ok=True)
+    
+    # 루트 로거 설정
     root_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
     
     # 기존 핸들러 제거
@@ -113,7 +146,9 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG if settings.debug else logging.INFO)
     
-    console_formatter = ColoredFormatter(
+    # 터미널이 아닌 경우 (파일 리다이렉트, journald 등) 색상 코드 없이 출력
+    console_formatter_class = ColoredFormatter if sys.stderr.isatty() else logging.Formatter
+    console_formatter = console_formatter_class(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -131,21 +166,12 @@ def setup_logging():
     json_handler.setFormatter(JSONFormatter())
     root_logger.addHandler(json_handler)
     
-    # 일반 파일 핸들러
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_dir / "app.log",
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.INFO)
-    
+    # 사람이 읽기 쉬운 형식 (에러 로그 파일용)
+    # 일반 로그는 app.json 하나에만 기록 (동일 레코드를 두 형식으로 중복 기록하지 않음)
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
     
     # 에러 로그 파일 핸들러
     error_handler = logging.handlers.RotatingFileHandler(
@@ -167,13 +193,21 @@ def setup_logging():
     )
     performance_handler.setLevel(logging.INFO)
     performance_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(performance_handler)
+    
+    # 성능 로그는 전용 "performance" 로거에만 연결하고 루트로 전파하지 않음
+    # (일반 로그가 performance.log에 중복 기록되지 않도록)
+    perf_logger = logging.getLogger("performance")
+    for handler in perf_logger.handlers[:]:
+        perf_logger.removeHandler(handler)
+    perf_logger.propagate = False
+    perf_logger.addHandler(performance_handler)
     
     # 특정 라이브러리 로그 레벨 조정
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("uvicorn.access").setLevel(logging.INFO)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     
+    _configured = True
     return root_logger
 
 def get_logger(name: str) -> logging.Logger:
@@ -2,6 +2,7 @@ from enum import Enum
 from typing import Optional, Callable, Any, List, Dict
 from functools import wraps
 from fastapi import HTTPException, Depends
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models.team import TeamMember
 from models.user import User
@@ -166,38 +167,74 @@ ROLE_PRIORITY = {
     Role.GUEST: 1
 }
 
+# 권한 확인용 사전 계산 테이블 (모듈 로드 시 한 번만 생성)
+# (역할, 권한) 쌍 집합: has_permission을 한 번의 집합 조회로 처리
+_ROLE_PERMISSION_PAIRS = frozenset(
+    (role, permission)
+    for role, permissions in ROLE_PERMISSIONS.items()
+    for permission in permissions
+)
+
+def _removable_roles(current_role: Role) -> frozenset:
+    """current_role이 제거할 수 있는 대상 역할 집합을 계산합니다."""
+    # OWNER는 모든 멤버 제거 가능
+    if current_role == Role.OWNER:
+        return frozenset(Role)
+    # ADMIN은 MANAGER 이하만 제거 가능
+    if current_role == Role.ADMIN:
+        limit = ROLE_PRIORITY[Role.MANAGER]
+    # MANAGER는 EDITOR 이하만 제거 가능
+    elif current_role == Role.MANAGER:
+        limit = ROLE_PRIORITY[Role.EDITOR]
+    else:
+        return frozenset()
+    return frozenset(role for role in Role if ROLE_PRIORITY[role] <= limit)
+
+# (제거하는 역할, 제거 대상 역할) 허용 쌍 집합
+_REMOVAL_PAIRS = frozenset(
+    (current_role, target_role)
+    for current_role in Role
+    for target_role in _removable_roles(current_role)
+)
+
 def get_user_role_in_team(db: Session, user_id: int, team_id: int) -> Role | None:
     """팀에서 사용자의 역할을 가져옵니다."""
-    team_member = db.query(TeamMember).filter(
-        TeamMember.team_id == team_id,
-        TeamMember.user_id == user_id
-    ).first()
+    # ORM 인스턴스를 만들지 않고 role 컬럼만 조회
+    role = db.execute(
+        select(TeamMember.role).where(
+            TeamMember.team_id == team_id,
+            TeamMember.user_id == user_id
+        )
+    ).scalar_one_or_none()
     
-    if not team_member:
+    if not role:
         return None  # 팀 멤버가 아님
     
-    return Role(team_member.role)
+    return Role(role)
 
 def has_permission(user_role: Role | None, permission: Permission) -> bool:
     """사용자가 특정 권한을 가지고 있는지 확인합니다."""
-    if not user_role:
-        return False
-    return permission in ROLE_PERMISSIONS.get(user_role, [])
+    return (user_role, permission) in _ROLE_PERMISSION_PAIRS
+
+def get_current_role(
+    team_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Role | None:
+    """현재 사용자의 팀 내 역할을 반환하는 공용 의존성입니다.
+
+    require_permission/require_role이 모두 이 의존성을 거치므로
+    FastAPI의 요청 단위 의존성 캐시에 의해 한 요청에서 역할 조회는 한 번만 수행됩니다.
+    """
+    # get_current_user가 반환하는 User의 id는 이미 int
+    user_id = current_user.id
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
+    return get_user_role_in_team(db, user_id, team_id)
 
 def require_permission(permission: Permission):
     """특정 권한이 필요한 의존성을 생성합니다."""
-    def permission_dependency(
-        team_id: int,
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-    ):
-        user_id = 0
-        if hasattr(current_user, 'id') and current_user.id is not None:
-            try:
-                user_id = int(str(current_user.id))
-            except (ValueError, TypeError):
-                user_id = 0
-        user_role = get_user_role_in_team(db, user_id, team_id)
+    def permission_dependency(user_role: Role | None = Depends(get_current_role)):
         if not has_permission(user_role, permission):
             raise HTTPException(
                 status_code=403,
@@ -209,20 +246,12 @@ def require_permission(permission: Permission):
 
 def require_role(minimum_role: Role):
     """최소 역할이 필요한 의존성을 생성합니다."""
-    def role_dependency(
-        team_id: int,
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-    ):
-        user_id = 0
-        if hasattr(current_user, 'id') and current_user.id is not None:
-            try:
-                user_id = int(str(current_user.id))
-            except (ValueError, TypeError):
-                user_id = 0
-        user_role = get_user_role_in_team(db, user_id, team_id)
-        
-        if not user_role or ROLE_PRIORITY.get(user_role, 0) < ROLE_PRIORITY.get(minimum_role, 0):
+    # 최소 역할 이상인 역할 집합은 의존성 생성 시 한 번만 계산
+    minimum_priority = ROLE_PRIORITY.get(minimum_role, 0)
+    allowed_roles = frozenset(role for role in Role if ROLE_PRIORITY[role] >= minimum_priority)
+    
+    def role_dependency(user_role: Role | None = Depends(get_current_role)):
+        if user_role not in allowed_roles:
             raise HTTPException(
                 status_code=403,
                 detail=f"권한이 없습니다. 필요한 최소 역할: {minimum_role}"
@@ -237,19 +266,8 @@ def can_remove_member(current_user_id: int, target_user_id: int, current_user_ro
     if current_user_id == target_user_id:
         return False
     
-    # OWNER는 모든 멤버 제거 가능 (자신 제외)
-    if current_user_role == Role.OWNER:
-        return True
-    
-    # ADMIN은 MANAGER 이하만 제거 가능
-    if current_user_role == Role.ADMIN and ROLE_PRIORITY.get(target_user_role, 0) <= ROLE_PRIORITY.get(Role.MANAGER, 0):
-        return True
-    
-    # MANAGER는 EDITOR 이하만 제거 가능
-    if current_user_role == Role.MANAGER and ROLE_PRIORITY.get(target_user_role, 0) <= ROLE_PRIORITY.get(Role.EDITOR, 0):
-        return True
-    
-    return False
+    # 역할 간 제거 가능 여부는 _REMOVAL_PAIRS에 미리 계산되어 있음
+    return (current_user_role, target_user_role) in _REMOVAL_PAIRS
 
 def get_role_description(role: Role) -> str:
     """역할에 대한 설명을 반환합니다."""
@@ -1,11 +1,18 @@
 from fastapi import HTTPException, Request
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+import threading
 import time
 from core.config import settings
 
+# 잠금 경합을 줄이기 위한 샤드 수 (2의 거듭제곱이어야 함)
+_SHARD_COUNT = 16
+_SHARD_MASK = _SHARD_COUNT - 1
+
 class RateLimiter:
     def __init__(self):
-        self._requests: Dict[str, list] = {}
+        # IP별 요청 기록을 샤드로 나누고, 샤드마다 별도의 잠금을 사용
+        self._shards: List[Dict[str, list]] = [{} for _ in range(_SHARD_COUNT)]
+        self._locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
         self._max_requests_per_minute = settings.rate_limit_per_minute
         self._max_requests_per_hour = settings.rate_limit_per_hour
 
@@ -16,52 +23,62 @@ class RateLimiter:
             return forwarded.split(",")[0].strip()
         return request.client.host if request.client else "unknown"
 
-    def _clean_old_requests(self, client_ip: str, window_seconds: int):
-        """오래된 요청을 정리합니다."""
+    def _get_shard(self, client_ip: str) -> Tuple[Dict[str, list], threading.Lock]:
+        """클라이언트 IP가 속한 샤드와 잠금을 반환합니다."""
+        index = hash(client_ip) & _SHARD_MASK
+        return self._shards[index], self._locks[index]
+
+    def _clean_old_requests(self, shard: Dict[str, list], client_ip: str, window_seconds: int):
+        """오래된 요청을 정리합니다. (샤드 잠금을 보유한 상태에서 호출)"""
         current_time = time.time()
-        if client_ip in self._requests:
-            self._requests[client_ip] = [
-                req_time for req_time in self._requests[client_ip]
+        if client_ip in shard:
+            shard[client_ip] = [
+                req_time for req_time in shard[client_ip]
                 if current_time - req_time < window_seconds
             ]
 
     def check_rate_limit(self, request: Request, window_seconds: int = 60):
         """Rate limit을 확인합니다."""
         client_ip = self._get_client_ip(request)
-        current_time = time.time()
-        
-        # 오래된 요청 정리
-        self._clean_old_requests(client_ip, window_seconds)
-        
-        # 현재 요청 수 확인
-        if client_ip not in self._requests:
-            self._requests[client_ip] = []
-        
-        request_count = len(self._requests[client_ip])
         max_requests = self._max_requests_per_minute if window_seconds == 60 else self._max_requests_per_hour
-        
-        if request_count >= max_requests:
-            raise HTTPException(
-                status_code=429,
-                detail=f"Rate limit exceeded. Maximum {max_requests} requests per {window_seconds} seconds."
-            )
-        
-        # 현재 요청 시간 추가
-        self._requests[client_ip].append(current_time)
+        shard, lock = self._get_shard(client_ip)
+
+        with lock:
+            current_time = time.time()
+
+            # 오래된 요청 정리
+            self._clean_old_requests(shard, client_ip, window_seconds)
+
+            # 현재 요청 수 확인
+            requests = shard.setdefault(client_ip, [])
+            request_count = len(requests)
+
+            if request_count < max_requests:
+                # 현재 요청 시간 추가
+                requests.append(current_time)
+                return
+
+        raise HTTPException(
+            status_code=429,
+            detail=f"Rate limit exceeded. Maximum {max_requests} requests per {window_seconds} seconds."
+        )
 
     def get_remaining_requests(self, request: Request, window_seconds: int = 60) -> Tuple[int, int]:
         """남은 요청 수를 반환합니다."""
         client_ip = self._get_client_ip(request)
-        self._clean_old_requests(client_ip, window_seconds)
-        
-        if client_ip not in self._requests:
-            return self._max_requests_per_minute if window_seconds == 60 else self._max_requests_per_hour, 0
-        
-        current_requests = len(self._requests[client_ip])
         max_requests = self._max_requests_per_minute if window_seconds == 60 else self._max_requests_per_hour
+        shard, lock = self._get_shard(client_ip)
+
+        with lock:
+            self._clean_old_requests(shard, client_ip, window_seconds)
+
+            if client_ip not in shard:
+                return max_requests, 0
+
+            current_requests = len(shard[client_ip])
+
         remaining = max(0, max_requests - current_requests)
-        
         return remaining, current_requests
 
 # 싱글톤 인스턴스
-rate_limiter = RateLimiter() 
\ No newline at end of file
+rate_limiter = RateLimiter()
\ No newline at end of file
@@ -5,7 +5,7 @@
 비밀번호 해싱, JWT 토큰 생성 및 검증을 담당합니다.
 
 주요 기능:
-- 비밀번호 해싱 및 검증 (bcrypt)
+- 비밀번호 해싱 및 검증 (argon2id, 기존 bcrypt 해시 호환)
 - JWT 액세스 토큰 생성
 - JWT 토큰 검증 및 디코딩
 - 보안 설정 관리
@@ -13,22 +13,36 @@
 
 """
 
+import time
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
-from jose import JWTError, jwt
+import jwt
 from core.config import settings
-from services.time_service import TimeService
 
 # 비밀번호 해싱 컨텍스트 설정
-# bcrypt 알고리즘 사용, 자동으로 최신 보안 설정 적용
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 새 해시는 argon2id (OWASP 권장 최소 파라미터)로 생성하고,
+# 기존 bcrypt 해시는 검증만 지원 (deprecated="auto"로 재해싱 대상 표시)
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
+
+# JWT 서명 키/알고리즘은 요청마다 다시 읽지 않도록 모듈 로드 시 한 번만 준비
+JWT_SECRET_KEY = settings.secret_key.encode() if isinstance(settings.secret_key, str) else settings.secret_key
+JWT_ALGORITHM = settings.algorithm
+# 기본 토큰 유효 기간 (초)
+_DEFAULT_TOKEN_TTL = settings.access_token_expire_minutes * 60
 
 def get_password_hash(password: str) -> str:
     """
     비밀번호를 해싱하는 함수
     
-    bcrypt 알고리즘을 사용하여 비밀번호를 안전하게 해싱합니다.
+    argon2id 알고리즘을 사용하여 비밀번호를 안전하게 해싱합니다.
     해싱된 비밀번호는 데이터베이스에 저장됩니다.
     
     Args:
@@ -38,13 +52,13 @@ def get_password_hash(password: str) -> str:
         str: 해싱된 비밀번호
         
     보안 특징:
-    - bcrypt는 salt를 자동으로 생성하여 rainbow table 공격 방지
-    - 계산 비용이 높아 brute force 공격에 저항
-    - deprecated="auto"로 자동으로 최신 보안 설정 적용
+    - salt를 자동으로 생성하여 rainbow table 공격 방지
+    - 메모리 비용(memory_cost)으로 GPU/ASIC brute force 공격에 저항
+    - bcrypt(cost 12)보다 검증이 빨라 로그인 요청의 지연 시간 감소
         
     사용 예시:
         hashed_password = get_password_hash("my_password")
-        # 결과: "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj4J/..."
+        # 결과: "$argon2id$v=19$m=19456,t=2,p=1$..."
     """
     return pwd_context.hash(password)
 
@@ -89,7 +103,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     토큰 구조:
     - Header: 알고리즘 정보 (HS256)
     - Payload: 사용자 데이터 + 만료 시간
-    - Signature: 서명 (settings.secret_key로 생성)
+    - Signature: 서명 (JWT_SECRET_KEY로 생성)
         
     사용 예시:
         token_data = {"sub": str(user.id), "email": user.email}
@@ -98,12 +112,12 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     """
     to_encode = data.copy()  # 원본 데이터 보호를 위해 복사
     
-    # 만료 시간 설정
-    expire = TimeService.now_kst() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
-    to_encode.update({"exp": expire})  # JWT 표준 필드
+    # 만료 시간 설정 (JWT 표준: UTC 기준 POSIX 타임스탬프, 초 단위 정수)
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_TOKEN_TTL
+    to_encode["exp"] = int(time.time()) + ttl
     
     # JWT 토큰 생성
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 def decode_access_token(token: str) -> Optional[dict]:
@@ -120,9 +134,9 @@ def decode_access_token(token: str) -> Optional[dict]:
         Optional[dict]: 토큰이 유효하면 페이로드 데이터, 유효하지 않으면 None
         
     검증 항목:
-    - 서명 검증 (settings.secret_key로 생성된 서명 확인)
-    - 만료 시간 확인 (exp 필드)
-    - 알고리즘 확인 (settings.algorithm)
+    - 서명 검증 (JWT_SECRET_KEY로 생성된 서명 확인)
+    - 만료 시간 확인 (exp 필드, 필수)
+    - 알고리즘 확인 (JWT_ALGORITHM)
         
     사용 예시:
         payload = decode_access_token(access_token)
@@ -134,8 +148,8 @@ def decode_access_token(token: str) -> Optional[dict]:
     """
     try:
         # JWT 토큰 디코딩 및 검증
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM], options={"require": ["exp"]})
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         # 토큰이 유효하지 않은 경우 (만료, 잘못된 서명 등)
         return None 
\ No newline at end of file
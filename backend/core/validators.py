@@ -4,19 +4,54 @@
 """
 
 import re
-import html
+import string
+import functools
+import bleach
 from typing import Optional, List, Any, Dict
 from email_validator import validate_email, EmailNotValidError
 from core.exceptions import ValidationError
 from services.time_service import TimeService
 
+# 자주 호출되는 검증 함수용 정규식은 모듈 로드 시 한 번만 컴파일
+# 사용자명에 허용되는 ASCII 문자 (영문, 숫자)
+_USERNAME_ASCII_CHARS = frozenset(string.ascii_letters + string.digits)
+_RE_URL = re.compile(
+    r'^https?://'  # http:// 또는 https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # 도메인
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP 주소
+    r'(?::\d+)?'  # 포트
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+_RE_SEARCH_STRIP = re.compile(r'[<>"\']')
+# html.escape(quote=True)와 동일한 치환표 (str.translate로 한 번에 처리)
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+@functools.lru_cache(maxsize=32)
+def _normalize_extensions(extensions: tuple) -> frozenset:
+    """허용 확장자 목록을 소문자 집합으로 변환합니다. (동일한 목록은 캐시 재사용)"""
+    return frozenset(ext.lower() for ext in extensions)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_kst(value: str):
+    """ISO 날짜 문자열을 KST datetime으로 변환합니다. (반복되는 날짜 범위는 캐시 재사용)"""
+    return TimeService.parse_isoformat_kst(value)
+
+@functools.lru_cache(maxsize=4096)
+def _validate_email_cached(email: str) -> str:
+    """이메일 주소를 검증하고 정규화된 주소를 반환합니다. (같은 주소의 반복 검증은 캐시 재사용)"""
+    # 테스트용 이메일 도메인 허용
+    if email.endswith('@example.com'):
+        return email
+    
+    return validate_email(email, check_deliverability=False).email
+
 class InputValidator:
     """입력 검증 클래스"""
     
     # XSS 방지를 위한 허용된 HTML 태그
-    ALLOWED_HTML_TAGS = {
+    ALLOWED_HTML_TAGS = frozenset({
         'b', 'i', 'u', 'em', 'strong', 'br', 'p', 'div', 'span'
-    }
+    })
     
     # SQL 인젝션 방지를 위한 금지된 키워드
     SQL_KEYWORDS = {
@@ -24,6 +59,12 @@ class InputValidator:
         'UNION', 'EXEC', 'EXECUTE', 'SCRIPT', 'EVAL', 'FUNCTION'
     }
     
+    # 금지 키워드를 한 번의 스캔으로 찾는 대소문자 무시 정규식
+    _SQL_KEYWORDS_PATTERN = re.compile(
+        '|'.join(re.escape(keyword) for keyword in sorted(SQL_KEYWORDS, key=len, reverse=True)),
+        re.IGNORECASE
+    )
+    
     @staticmethod
     def sanitize_string(value: str, max_length: int = 1000) -> str:
         """문자열 정리 및 XSS 방지"""
@@ -35,12 +76,11 @@ class InputValidator:
             raise ValidationError(f"문자열이 너무 깁니다. (최대 {max_length}자)")
         
         # HTML 이스케이프
-        sanitized = html.escape(value)
+        sanitized = value.translate(_HTML_ESCAPE)
         
         # SQL 인젝션 키워드 검사
-        for keyword in InputValidator.SQL_KEYWORDS:
-            if keyword.lower() in sanitized.lower():
-                raise ValidationError("허용되지 않는 키워드가 포함되어 있습니다.")
+        if InputValidator._SQL_KEYWORDS_PATTERN.search(sanitized):
+            raise ValidationError("허용되지 않는 키워드가 포함되어 있습니다.")
         
         return sanitized.strip()
     
@@ -48,12 +88,7 @@ class InputValidator:
     def validate_email(email: str) -> str:
         """이메일 주소 검증"""
         try:
-            # 테스트용 이메일 도메인 허용
-            if email.endswith('@example.com'):
-                return email
-            
-            validated_email = validate_email(email, check_deliverability=False)
-            return validated_email.email
+            return _validate_email_cached(email)
         except EmailNotValidError as e:
             raise ValidationError(f"유효하지 않은 이메일 주소입니다: {str(e)}")
     
@@ -66,11 +101,19 @@ class InputValidator:
         if len(password) > 128:
             raise ValidationError("비밀번호는 최대 128자까지 가능합니다.")
         
-        # 복잡성 검사
-        has_upper = re.search(r'[A-Z]', password)
-        has_lower = re.search(r'[a-z]', password)
-        has_digit = re.search(r'\d', password)
-        has_special = re.search(r'[!@#$%^&*(),.?":{}|<>]', password)
+        # 복잡성 검사 (한 번의 순회로 문자 종류 확인, 모두 확인되면 조기 종료)
+        has_upper = has_lower = has_digit = False
+        for char in password:
+            if 'A' <= char <= 'Z':
+                has_upper = True
+            elif 'a' <= char <= 'z':
+                has_lower = True
+            elif char.isdecimal():
+                has_digit = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit:
+                break
         
         if not (has_upper and has_lower and has_digit):
             raise ValidationError("비밀번호는 대문자, 소문자, 숫자를 포함해야 합니다.")
@@ -90,7 +133,11 @@ class InputValidator:
             raise ValidationError("사용자명은 최대 50자까지 가능합니다.")
         
         # 허용된 문자만 사용
-        if not re.match(r'^[a-zA-Z0-9가-힣\s]+$', username):
+        # str.isalnum은 한자 등 다른 문자도 허용하므로 명시적으로 범위를 검사
+        if not all(
+            char in _USERNAME_ASCII_CHARS or '가' <= char <= '힣' or char.isspace()
+            for char in username
+        ):
             raise ValidationError("사용자명에는 영문, 숫자, 한글, 공백만 사용 가능합니다.")
         
         return username.strip()
@@ -101,16 +148,8 @@ class InputValidator:
         if not url:
             return ""
         
-        # 기본 URL 패턴 검사
-        url_pattern = re.compile(
-            r'^https?://'  # http:// 또는 https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # 도메인
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP 주소
-            r'(?::\d+)?'  # 포트
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(url):
+        # 모듈 로드 시 컴파일된 패턴으로 검사 (호출마다 re.compile 하지 않음)
+        if _RE_URL.match(url) is None:
             raise ValidationError("유효하지 않은 URL입니다.")
         
         return url
@@ -121,10 +160,11 @@ class InputValidator:
         if not filename:
             raise ValidationError("파일명이 없습니다.")
         
-        # 파일 확장자 추출
-        extension = filename.lower().split('.')[-1] if '.' in filename else ''
+        # 파일 확장자 추출 (마지막 '.' 이후만 소문자로 변환)
+        _, dot, extension = filename.rpartition('.')
+        extension = extension.lower() if dot else ''
         
-        if extension not in [ext.lower() for ext in allowed_extensions]:
+        if extension not in _normalize_extensions(tuple(allowed_extensions)):
             raise ValidationError(f"허용되지 않는 파일 형식입니다. 허용된 형식: {', '.join(allowed_extensions)}")
         
         return filename
@@ -144,8 +184,6 @@ class InputValidator:
             allowed_tags = InputValidator.ALLOWED_HTML_TAGS
         
         # 기본 HTML 태그만 허용
-        import bleach
-        
         cleaned = bleach.clean(
             html_content,
             tags=allowed_tags,
@@ -160,20 +198,17 @@ class InputValidator:
         if not isinstance(data, dict):
             raise ValidationError("데이터는 딕셔너리 형태여야 합니다.")
         
-        # 필수 필드 검사
-        for field in required_fields:
-            if field not in data:
-                raise ValidationError(f"필수 필드가 누락되었습니다: {field}")
-        
-        # 허용된 필드만 포함
-        allowed_fields = required_fields + (optional_fields if optional_fields else [])
-        cleaned_data = {}
-        
-        for field, value in data.items():
-            if field in allowed_fields:
-                cleaned_data[field] = value
-        
-        return cleaned_data
+        # 필수 필드 검사 (dict keys 뷰의 집합 연산으로 한 번에 확인)
+        required = frozenset(required_fields)
+        missing = required - data.keys()
+        if missing:
+            # 오류 메시지는 required_fields 순서상 첫 번째 누락 필드로 고정
+            field = next(field for field in required_fields if field in missing)
+            raise ValidationError(f"필수 필드가 누락되었습니다: {field}")
+        
+        # 허용된 필드만 포함 (입력 순서 유지)
+        allowed_fields = required.union(optional_fields or ())
+        return {field: value for field, value in data.items() if field in allowed_fields}
     
     @staticmethod
     def validate_pagination_params(page: int, size: int, max_size: int = 100) -> tuple:
@@ -200,7 +235,7 @@ class InputValidator:
             raise ValidationError(f"검색어가 너무 깁니다. (최대 {max_length}자)")
         
         # 특수 문자 필터링
-        sanitized = re.sub(r'[<>"\']', '', query)
+        sanitized = _RE_SEARCH_STRIP.sub('', query)
         
         return sanitized.strip()
     
@@ -208,8 +243,8 @@ class InputValidator:
     def validate_date_range(start_date: str, end_date: str) -> tuple:
         """날짜 범위 검증"""
         try:
-            start = TimeService.parse_isoformat_kst(start_date)
-            end = TimeService.parse_isoformat_kst(end_date)
+            start = _parse_kst(start_date)
+            end = _parse_kst(end_date)
             
             if start > end:
                 raise ValidationError("시작 날짜는 종료 날짜보다 이전이어야 합니다.")
@@ -14,12 +14,18 @@ SQLite 데이터베이스를 사용하며, 개발 및 프로덕션 환경에서
 """
 
 import os
+import hashlib
+import importlib
 from pathlib import Path
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, event, MetaData, DateTime, Integer, Table, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool
+from starlette.requests import Request
 import logging
+from core.config import settings
 
 # 데이터베이스 파일 경로 설정
 # 프로젝트 루트의 data 디렉토리에 SQLite 파일 저장
@@ -27,35 +33,167 @@ data_dir = Path(__file__).parent.parent / "data"
 data_dir.mkdir(exist_ok=True)  # data 디렉토리가 없으면 생성
 db_path = data_dir / "planner.db"
 
+# 테이블 생성을 위해 임포트할 모델 모듈 목록
+# 각 모델은 Base를 상속받아야 하며, 임포트해야 metadata에 테이블이 등록됨
+MODEL_NAMES = (
+    "user", "team", "planner", "todo", "post", "reply", "like",
+    "invite", "notification", "activity", "email_verification",
+)
+
 # 데이터베이스 URL 설정
 # SQLite 데이터베이스 파일의 절대 경로를 사용
 DATABASE_URL = f"sqlite:///{db_path.absolute()}"
 
 # SQLite 엔진 생성 및 성능 최적화 설정
-# StaticPool: 단일 연결을 재사용하여 메모리 사용량 최적화
+# QueuePool: 요청(스레드)마다 별도 연결을 사용하여 WAL 모드의 동시 읽기 활용
 engine = create_engine(
     DATABASE_URL,
     connect_args={
         "check_same_thread": False,  # 멀티스레드 환경에서 사용 가능
         "timeout": 30,  # 연결 타임아웃 (30초)
-        "isolation_level": "IMMEDIATE"  # 트랜잭션 격리 수준 (즉시 커밋)
     },
-    poolclass=StaticPool,  # 정적 연결 풀 사용
+    poolclass=QueuePool,  # 연결 풀 사용
+    pool_size=settings.db_pool_size,  # 유지할 연결 수
+    max_overflow=settings.db_max_overflow,  # 추가로 허용할 연결 수
+    pool_timeout=settings.db_pool_timeout,  # 풀이 가득 찼을 때 연결 대기 시간
     echo=False,  # SQL 쿼리 로그 비활성화 (성능 향상)
-    pool_pre_ping=True,  # 연결 전 상태 확인 (안정성 향상)
-    pool_recycle=3600,  # 1시간마다 연결 재생성 (메모리 누수 방지)
+    pool_pre_ping=settings.db_pool_pre_ping,  # 연결 전 상태 확인 (안정성 향상)
+    pool_recycle=settings.db_pool_recycle,  # 주기적으로 연결 재생성 (메모리 누수 방지)
+    query_cache_size=1200,  # 컴파일된 SQL 캐시 크기 (기본값 500)
+    insertmanyvalues_page_size=1000,  # bulk INSERT ... RETURNING 한 문장당 행 수
 )
 
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    새 SQLite 연결마다 성능 관련 PRAGMA를 설정합니다.
+    
+    - journal_mode=WAL: 쓰기 중에도 읽기가 가능하고 커밋 시 fsync 비용 감소
+    - synchronous=NORMAL: WAL 모드에서 안전하면서 fsync 횟수 감소
+    - cache_size=-65536: 페이지 캐시 64MB
+    - mmap_size=268435456: 256MB 메모리 맵 I/O
+    - temp_store=MEMORY: 임시 테이블/인덱스를 메모리에 저장
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 # 데이터베이스 세션 팩토리 생성
 # autocommit=False: 자동 커밋 비활성화 (트랜잭션 제어)
 # autoflush=False: 자동 플러시 비활성화 (성능 향상)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: 커밋 후 객체를 만료시키지 않음 (커밋 직후 재조회 SELECT 방지)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # SQLAlchemy 모델의 기본 클래스
 # 모든 모델 클래스는 이 Base를 상속받아야 함
 Base = declarative_base()
 
-def get_db():
+class kst_now(FunctionElement):
+    """
+    DB 서버 측에서 현재 시각을 채우는 기본값 (server_default용)
+    
+    쓰기가 많은 테이블에서 행마다 파이썬 datetime 객체를 만들지 않도록 사용합니다.
+    - SQLite: 타임존 정보 없이 KST 시각을 저장 (기존 now_kst 기본값과 같은 형태)
+      SQLAlchemy가 바인딩하는 datetime 문자열과 문자열 비교가 맞도록 마이크로초 6자리로 저장
+    - 그 외 (PostgreSQL 등): CURRENT_TIMESTAMP (timestamptz이므로 절대 시각이 보존됨)
+    """
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+@compiles(kst_now)
+def _compile_kst_now(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(kst_now, "sqlite")
+def _compile_kst_now_sqlite(element, compiler, **kw):
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now', '+9 hours') || '000')"
+
+# SQLite FTS5 검색 인덱스가 등록된 테이블 목록: (원본 테이블 이름, 검색 컬럼)
+FTS_TABLES: dict = {}
+
+# trigram 토크나이저는 3글자 이상의 검색어에만 인덱스를 사용할 수 있음
+FTS_MIN_QUERY_LENGTH = 3
+
+def _fts_name(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+def create_fts_index(connection, table_name: str) -> None:
+    """
+    SQLite FTS5(trigram) 외부 콘텐츠 인덱스와 동기화 트리거를 생성합니다.
+    
+    이미 존재하면 아무 작업도 하지 않으며, 새로 만든 경우 기존 행으로 인덱스를 재구성합니다.
+    """
+    fts = _fts_name(table_name)
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+    ).first()
+    if exists:
+        return
+    
+    columns = FTS_TABLES[table_name]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});"
+    
+    connection.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, "
+        f"content='{table_name}', content_rowid='id', tokenize='trigram')"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN {insert_new} END"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN {delete_old} END"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table_name} BEGIN {delete_old} {insert_new} END"
+    )
+    connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+def register_fts_index(table: Table, *columns: str) -> None:
+    """
+    테이블에 전문 검색(FTS5 trigram) 인덱스를 등록합니다. (SQLite 전용)
+    
+    테이블 생성/삭제 시 인덱스 테이블과 트리거도 함께 생성/삭제되며,
+    기존 데이터베이스에는 init_db에서 생성됩니다.
+    """
+    FTS_TABLES[table.name] = columns
+    
+    @event.listens_for(table, "after_create")
+    def _after_create(target, connection, **kw):
+        if connection.dialect.name == "sqlite":
+            create_fts_index(connection, target.name)
+    
+    @event.listens_for(table, "after_drop")
+    def _after_drop(target, connection, **kw):
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {_fts_name(target.name)}")
+
+def fts_match_ids(table_name: str, query: str):
+    """
+    검색어가 포함된 행의 id를 FTS 인덱스에서 찾는 서브쿼리를 반환합니다.
+    
+    검색어는 하나의 구문(phrase)으로 취급되며, trigram 토크나이저이므로
+    ILIKE '%검색어%'와 같은 부분 일치(대소문자 무시)로 동작합니다.
+    """
+    fts = _fts_name(table_name)
+    phrase = '"' + query.replace('"', '""') + '"'
+    return text(f"SELECT rowid FROM {fts} WHERE {fts} MATCH :phrase").bindparams(
+        phrase=phrase
+    ).columns(rowid=Integer)
+
+# 데이터를 변경하지 않는 HTTP 메서드 (하나의 읽기 트랜잭션으로 처리)
+_READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+def get_db(request: Request):
     """
     데이터베이스 세션 생성 및 관리 함수
     
@@ -63,6 +201,13 @@ def get_db():
     각 요청마다 새로운 데이터베이스 세션을 생성하고,
     요청 완료 후 자동으로 세션을 닫습니다.
     
+    읽기 요청(GET/HEAD/OPTIONS)은 세션 시작 시 트랜잭션을 열어 요청 내의 모든 조회가
+    하나의 스냅샷을 공유하도록 합니다. (pysqlite는 SELECT에 BEGIN을 보내지 않으므로
+    그대로 두면 조회마다 읽기 잠금을 따로 잡고 해제함) 트랜잭션은 세션 종료 시 롤백됩니다.
+    
+    Args:
+        request (Request): 현재 HTTP 요청 (메서드 확인용)
+    
     Yields:
         Session: SQLAlchemy 데이터베이스 세션
         
@@ -73,10 +218,27 @@ def get_db():
     """
     db = SessionLocal()
     try:
+        if request.method in _READ_ONLY_METHODS:
+            db.connection().exec_driver_sql("BEGIN")
         yield db  # 세션을 요청 핸들러에 제공
     finally:
         db.close()  # 요청 완료 후 세션 닫기
 
+def _schema_fingerprint() -> int:
+    """
+    등록된 테이블/인덱스 이름으로 스키마 지문을 계산합니다.
+    
+    SQLite의 PRAGMA user_version(부호 있는 32비트 정수)에 저장하기 위해
+    해시의 앞 7자리(28비트)만 사용합니다.
+    """
+    names = sorted(
+        [table.name for table in Base.metadata.sorted_tables]
+        + [index.name for table in Base.metadata.sorted_tables for index in table.indexes if index.name]
+        + [_fts_name(table_name) for table_name in FTS_TABLES]
+    )
+    digest = hashlib.md5(",".join(names).encode(), usedforsecurity=False).hexdigest()
+    return int(digest[:7], 16)
+
 async def init_db():
     """
     데이터베이스 초기화 함수
@@ -84,9 +246,9 @@ async def init_db():
     애플리케이션 시작 시 호출되어 데이터베이스와 테이블을 초기화합니다.
     
     주요 작업:
-    1. 데이터베이스 파일 존재 확인 및 생성
-    2. 모든 모델의 테이블 생성
-    3. 초기 데이터 설정 (필요시)
+    1. 모든 모델의 테이블 생성 (데이터베이스 파일은 SQLite가 자동 생성)
+       - 스키마 지문이 PRAGMA user_version과 같으면 생략
+    2. 초기 데이터 설정 (필요시)
     
     Raises:
         Exception: 데이터베이스 초기화 실패 시 예외 발생
@@ -96,18 +258,30 @@ async def init_db():
         await init_db()
     """
     try:
-        # 데이터베이스 파일이 없으면 생성
-        if not db_path.exists():
-            db_path.parent.mkdir(exist_ok=True)  # 상위 디렉토리 생성
-            db_path.touch()  # 빈 파일 생성
+        # 데이터베이스 파일은 첫 연결 시 SQLite가 자동으로 생성함
+        # (data 디렉토리는 모듈 임포트 시 이미 생성됨)
         
         # 모든 모델 임포트 (테이블 생성에 필요)
-        # 각 모델은 Base를 상속받아야 하며, 여기서 임포트해야 테이블이 생성됨
-        from models import user, team, planner, todo, post, reply, like, invite, notification, activity, email_verification
+        for name in MODEL_NAMES:
+            importlib.import_module(f"models.{name}")
+        
+        schema_version = _schema_fingerprint()
+        with engine.connect() as connection:
+            current_version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+            if current_version == schema_version:
+                # 스키마 지문이 같으면 모든 테이블이 이미 존재하므로 create_all 생략 (웜 스타트)
+                logging.info("✅ 데이터베이스 초기화 완료 (스키마 변경 없음)")
+                return
         
         # 모든 테이블 생성
         # Base.metadata.create_all()은 모든 등록된 모델의 테이블을 생성
         Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            # 이미 존재하던 테이블에는 after_create 이벤트가 발생하지 않으므로 검색 인덱스를 직접 생성
+            for table_name in FTS_TABLES:
+                create_fts_index(connection, table_name)
+            # PRAGMA는 바인딩 파라미터를 지원하지 않으므로 정수 값을 직접 사용
+            connection.exec_driver_sql(f"PRAGMA user_version = {schema_version}")
         logging.info("✅ 데이터베이스 초기화 완료")
     except Exception as e:
         logging.error(f"❌ 데이터베이스 초기화 실패: {e}")
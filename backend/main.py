@@ -6,7 +6,7 @@
 
 주요 기능:
 - FastAPI 애플리케이션 초기화 및 설정
-- 미들웨어 등록 (CORS, 로깅, 보안)
+- 미들웨어 등록 (CORS, 압축, 로깅, 보안)
 - API 라우터 등록
 - 헬스체크 및 상태 확인 엔드포인트
 - 애플리케이션 생명주기 관리
@@ -24,6 +24,8 @@ sys.path.insert(0, str(backend_dir))
 # FastAPI 및 관련 라이브러리 임포트
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from contextlib import asynccontextmanager
 import uvicorn
@@ -43,13 +45,17 @@ from api.v1 import users, teams, planners, todos, posts, replies, likes, invites
 from core.config import settings
 from core.logging_config import setup_logging
 from middleware.logging_middleware import LoggingMiddleware
-from middleware.security_middleware import SecurityMiddleware
+from middleware.security_middleware import SecurityMiddleware, periodic_rate_limit_cleanup
 from services.monitoring_service import MonitoringService
+from services.email_service import smtp_pool
 
 # 로깅 설정 초기화
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# 서버 시작 시각 (헬스체크의 uptime 계산용, monotonic 기준)
+APP_START_TIME = time.monotonic()
+
 # 보안 설정 - JWT 토큰 인증을 위한 Bearer 토큰 스키마
 security = HTTPBearer()
 
@@ -69,6 +75,7 @@ async def lifespan(app: FastAPI):
     시작 시 실행되는 작업:
     - 데이터베이스 초기화
     - 모니터링 서비스 시작
+    - Rate Limit 저장소 정리 작업 시작
     
     종료 시 실행되는 작업:
     - 리소스 정리
@@ -79,8 +86,7 @@ async def lifespan(app: FastAPI):
     
     # 데이터베이스 초기화
     try:
-        await init_db()
-        logger.info("✅ 데이터베이스 초기화 완료")
+        await init_db()  # 성공 로그는 init_db 내부에서 기록
     except Exception as e:
         logger.error(f"❌ 데이터베이스 초기화 실패: {e}")
         raise
@@ -90,11 +96,21 @@ async def lifespan(app: FastAPI):
     app.state.monitoring_service = monitoring_service
     logger.info("✅ 모니터링 서비스 시작")
     
+    # Rate Limit 저장소 주기적 정리 작업 시작 (IP별 항목 누적 방지)
+    rate_limit_cleanup_task = asyncio.create_task(periodic_rate_limit_cleanup())
+    
     # 애플리케이션 실행 중
     yield
     
     # 애플리케이션 종료 시 실행
     logger.info("🛑 서버 종료 중...")
+    rate_limit_cleanup_task.cancel()
+    try:
+        await rate_limit_cleanup_task
+    except asyncio.CancelledError:
+        pass
+    # 유지 중인 SMTP 연결 종료
+    smtp_pool.close_all()
     # 모니터링 서비스 종료 (현재 주석 처리됨)
     # if hasattr(app.state, 'monitoring_service'):
     #     await app.state.monitoring_service.shutdown()
@@ -113,20 +129,26 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # 모든 엔드포인트의 JSON 응답을 orjson으로 인코딩
 )
 
 # CORS (Cross-Origin Resource Sharing) 설정
 # 프론트엔드에서 백엔드 API에 접근할 수 있도록 허용
-# 프로덕션에서는 특정 도메인만 허용해야 함
+# 출처 목록은 설정(CORS_ORIGINS 환경 변수)에서 읽음
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 모든 도메인 허용 (개발 환경용)
+    allow_origins=settings.cors_origins,  # 허용된 프론트엔드 출처만 허용
     allow_credentials=True,  # 쿠키 및 인증 헤더 허용
     allow_methods=["*"],  # 모든 HTTP 메서드 허용
     allow_headers=["*"],  # 모든 헤더 허용
+    max_age=settings.cors_max_age,  # preflight 응답을 브라우저가 캐시하도록 함
 )
 
+# 응답 압축 미들웨어: 1KB 이상 JSON 응답을 gzip으로 압축 (목록/검색 응답 전송량 감소)
+# 로깅 미들웨어보다 먼저 등록하여 로깅 미들웨어 안쪽에서 압축되도록 함
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # 커스텀 미들웨어 추가
 # 로깅 미들웨어: 모든 요청/응답을 로깅
 app.add_middleware(LoggingMiddleware)
@@ -185,12 +207,12 @@ async def health_check():
         Dict[str, Any]: 서버 상태 정보
             - status: 서버 상태 ("healthy")
             - timestamp: 현재 시간
-            - uptime: 서버 시작 후 경과 시간
+            - uptime: 서버 시작 후 경과 시간 (초)
     """
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "uptime": time.time()
+        "uptime": round(time.monotonic() - APP_START_TIME, 3)
     }
 
 @app.get("/api")
@@ -15,15 +15,15 @@
 """
 
 import time
-import json
-import uuid
-from typing import Dict, Any, Optional
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import StreamingResponse
+import logging
+import secrets
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from core.logging_config import get_structured_logger
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+# 헬스체크/문서 등 로깅이 필요 없는 경로 (로드밸런서가 자주 호출)
+_UNLOGGED_PATHS = frozenset({"/health", "/", "/api", "/docs", "/redoc", "/openapi.json"})
+
+class LoggingMiddleware:
     """
     요청/응답 로깅 미들웨어
     
@@ -31,10 +31,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     요청 처리 시간, 상태 코드, 클라이언트 정보 등을 기록하여
     API 성능 모니터링과 디버깅을 지원합니다.
     
+    BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현하여
+    요청마다 생성되는 anyio 태스크 그룹/메모리 스트림 비용 없이
+    send 호출만 감싸서 응답 상태 코드를 수집합니다.
+    
     주요 기능:
     - 모든 API 요청/응답 로깅
     - 요청 처리 시간 측정
-    - 느린 요청 감지 (3초 이상)
+    - 느린 요청 감지 (3초/5초/10초 단계별)
     - 로그인 요청 특별 처리 (민감한 정보 제외)
     - 구조화된 로그 형식
     
@@ -42,17 +46,19 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         app.add_middleware(LoggingMiddleware)
     """
     
-    def __init__(self, app):
+    def __init__(self, app: ASGIApp):
         """
         LoggingMiddleware 초기화
         
         Args:
-            app: FastAPI 애플리케이션 인스턴스
+            app: 감싸는 ASGI 애플리케이션
         """
-        super().__init__(app)
+        self.app = app
         self.structured_logger = get_structured_logger("api.middleware")
+        # 느린 요청 경고는 performance.log 핸들러가 붙은 performance 로거로 기록
+        self.performance_logger = get_structured_logger("performance")
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """
         HTTP 요청을 처리하고 로깅하는 메서드
         
@@ -60,14 +66,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         응답 처리 후 결과를 로깅합니다.
         
         Args:
-            request (Request): FastAPI 요청 객체
-            call_next: 다음 미들웨어 또는 엔드포인트를 호출하는 함수
-            
-        Returns:
-            Response: HTTP 응답 객체
+            scope (Scope): ASGI 연결 스코프
+            receive (Receive): ASGI receive 호출
+            send (Send): ASGI send 호출
             
         로깅 정보:
-        - 요청 ID (UUID)
+        - 요청 ID (16자리 hex)
         - HTTP 메서드 (GET, POST 등)
         - 엔드포인트 경로
         - 클라이언트 IP 주소
@@ -75,76 +79,69 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         - 응답 상태 코드
         - 오류 메시지 (실패 시)
         """
-        # 로그인 요청은 최소한의 로깅만 (민감한 정보 보호)
-        is_login_request = request.url.path.endswith("/login")
+        # HTTP 외 요청(websocket, lifespan)과 헬스체크 등 단순 응답 경로는 로깅 없이 바로 처리
+        if scope["type"] != "http" or scope["path"] in _UNLOGGED_PATHS:
+            await self.app(scope, receive, send)
+            return
         
-        if is_login_request:
+        path = scope["path"]
+        status_code = 500  # 응답 시작 전에 예외가 나면 500으로 간주
+        
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        # 로그인 요청은 최소한의 로깅만 (민감한 정보 보호)
+        if path.endswith("/login"):
             # 로그인 요청은 간단한 로깅만 (비밀번호 등 민감한 정보 제외)
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
-                response = await call_next(request)
-                process_time = time.time() - start_time
-                
-                # 로그인 성공/실패만 간단히 로깅
-                if response.status_code == 200:
-                    self.structured_logger.info("로그인 성공", execution_time=round(process_time, 3))
-                else:
-                    self.structured_logger.warning("로그인 실패", status_code=response.status_code, execution_time=round(process_time, 3))
-                
-                return response
+                await self.app(scope, receive, send_wrapper)
             except Exception as e:
-                process_time = time.time() - start_time
+                process_time = time.perf_counter() - start_time
                 self.structured_logger.error("로그인 오류", error_message=str(e), execution_time=round(process_time, 3))
                 raise
+            process_time = time.perf_counter() - start_time
+            
+            # 로그인 성공/실패만 간단히 로깅
+            if status_code == 200:
+                self.structured_logger.info("로그인 성공", execution_time=round(process_time, 3))
+            else:
+                self.structured_logger.warning("로그인 실패", status_code=status_code, execution_time=round(process_time, 3))
+            return
         
         # 일반 요청은 상세한 로깅 수행
-        request_id = str(uuid.uuid4())  # 고유 요청 ID 생성
-        start_time = time.time()
+        # INFO 레벨이 꺼져 있으면 요청 ID 생성과 시작/완료 로그 필드 구성을 생략
+        log_info = self.structured_logger.isEnabledFor(logging.INFO)
+        method = scope["method"]
+        request_id = None
         
-        # 요청 정보 추출
-        client_ip = request.client.host if request.client else "unknown"
-        method = request.method
-        path = request.url.path
-        
-        # 요청 시작 로깅
-        self.structured_logger.info(
-            "API 요청 시작",
-            request_id=request_id,
-            method=method,
-            endpoint=path,
-            ip_address=client_ip
-        )
-        
-        try:
-            # 다음 미들웨어 또는 엔드포인트 호출
-            response = await call_next(request)
-            process_time = time.time() - start_time
+        if log_info:
+            request_id = secrets.token_hex(8)  # 고유 요청 ID 생성 (16자리 hex)
             
-            # 요청 완료 로깅
+            # 요청 정보 추출
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+            
+            # 요청 시작 로깅
             self.structured_logger.info(
-                "API 요청 완료",
+                "API 요청 시작",
                 request_id=request_id,
                 method=method,
                 endpoint=path,
-                status_code=response.status_code,
-                execution_time=round(process_time, 3)
+                ip_address=client_ip
             )
-            
-            # 느린 요청 감지 및 경고 (3초 이상)
-            if process_time > 3.0:
-                self.structured_logger.warning(
-                    "느린 API 요청 감지",
-                    request_id=request_id,
-                    method=method,
-                    endpoint=path,
-                    execution_time=round(process_time, 3)
-                )
-            
-            return response
-            
+        
+        start_time = time.perf_counter()
+        
+        try:
+            # 다음 미들웨어 또는 엔드포인트 호출
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # 요청 처리 중 오류 발생 시 로깅
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
             self.structured_logger.error(
                 "API 요청 실패",
                 request_id=request_id,
@@ -154,90 +151,34 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 execution_time=round(process_time, 3)
             )
             raise
-
-class PerformanceMiddleware(BaseHTTPMiddleware):
-    """
-    성능 모니터링 미들웨어
-    
-    이 클래스는 API 성능을 모니터링하고 느린 요청을 감지합니다.
-    로그인 요청은 성능 모니터링에서 제외하여 보안을 유지합니다.
-    
-    주요 기능:
-    - 요청 처리 시간 측정
-    - 느린 요청 감지 및 경고
-    - 성능 메트릭 수집
-    - 로그인 요청 제외
-    
-    사용 예시:
-        app.add_middleware(PerformanceMiddleware)
-    """
-    
-    def __init__(self, app):
-        """
-        PerformanceMiddleware 초기화
-        
-        Args:
-            app: FastAPI 애플리케이션 인스턴스
-        """
-        super().__init__(app)
-        self.structured_logger = get_structured_logger("performance")
-    
-    async def dispatch(self, request: Request, call_next):
-        """
-        성능 모니터링을 수행하는 메서드
-        
-        요청 처리 시간을 측정하고, 느린 요청을 감지하여 경고를 로깅합니다.
-        로그인 요청은 성능 모니터링에서 제외합니다.
         
-        Args:
-            request (Request): FastAPI 요청 객체
-            call_next: 다음 미들웨어 또는 엔드포인트를 호출하는 함수
-            
-        Returns:
-            Response: HTTP 응답 객체
-        """
-        # 로그인 요청은 성능 모니터링 제외 (보안상 민감한 정보 보호)
-        if request.url.path.endswith("/login"):
-            return await call_next(request)
+        process_time = time.perf_counter() - start_time
         
-        # 성능 측정 시작
-        start_time = time.time()
+        # 요청 완료 로깅
+        if log_info:
+            self.structured_logger.info(
+                "API 요청 완료",
+                request_id=request_id,
+                method=method,
+                endpoint=path,
+                status_code=status_code,
+                execution_time=round(process_time, 3)
+            )
         
-        try:
-            # 요청 처리
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            
-            # 느린 요청 감지 (5초 이상)
-            if process_time > 5.0:
-                self.structured_logger.warning(
-                    "느린 요청 감지",
-                    method=request.method,
-                    endpoint=request.url.path,
-                    execution_time=round(process_time, 3),
-                    status_code=response.status_code
-                )
-            
-            # 매우 느린 요청 감지 (10초 이상)
-            if process_time > 10.0:
-                self.structured_logger.error(
-                    "매우 느린 요청 감지",
-                    method=request.method,
-                    endpoint=request.url.path,
-                    execution_time=round(process_time, 3),
-                    status_code=response.status_code
-                )
-            
-            return response
-            
-        except Exception as e:
-            # 오류 발생 시 성능 정보와 함께 로깅
-            process_time = time.time() - start_time
-            self.structured_logger.error(
-                "요청 처리 오류",
-                method=request.method,
-                endpoint=request.url.path,
-                error_message=str(e),
+        # 느린 요청 감지 (단계별 임계값을 한 번만 비교하고 performance 로거에 한 번만 기록)
+        if process_time > 3.0:
+            fields = dict(
+                request_id=request_id,
+                method=method,
+                endpoint=path,
+                status_code=status_code,
                 execution_time=round(process_time, 3)
             )
-            raise 
\ No newline at end of file
+            if process_time > 10.0:
+                self.performance_logger.error("매우 느린 API 요청 감지", **fields)
+                # performance 로거는 전파하지 않으므로 콘솔/app.json/error.log에도 기록
+                self.structured_logger.error("매우 느린 API 요청 감지", **fields)
+            elif process_time > 5.0:
+                self.performance_logger.warning("느린 API 요청 감지 (5초 이상)", **fields)
+            else:
+                self.performance_logger.warning("느린 API 요청 감지", **fields)
@@ -4,208 +4,358 @@
 """
 
 import time
+import asyncio
+import weakref
+import hmac
 import hashlib
-import secrets
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import StreamingResponse
-from typing import Optional, Dict, Any
-import json
-from datetime import datetime, timedelta
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Dict, Tuple
+from core.config import settings
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-class SecurityMiddleware(BaseHTTPMiddleware):
-    """보안 미들웨어"""
+# Content Security Policy 기본 지시어 (두 미들웨어가 공유)
+_CSP_DIRECTIVES = {
+    "default-src": "'self'",
+    "script-src": "'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net https://fastapi.tiangolo.com",
+    "style-src": "'self' 'unsafe-inline' https://cdn.jsdelivr.net",
+    "img-src": "'self' data: https: https://fastapi.tiangolo.com",
+    "font-src": "'self'",
+    "connect-src": "'self'",
+    "frame-ancestors": "'none'",
+}
+
+def _build_csp(**extra_sources: str) -> bytes:
+    """기본 지시어에 추가 출처를 덧붙인 CSP 헤더 값을 만듭니다. (모듈 로드 시에만 호출)"""
+    directives = []
+    for directive, sources in _CSP_DIRECTIVES.items():
+        extra = extra_sources.get(directive.replace("-", "_"))
+        directives.append(f"{directive} {sources} {extra}" if extra else f"{directive} {sources}")
+    return ("; ".join(directives) + ";").encode("latin-1")
+
+# SecurityMiddleware용 CSP
+_CSP_POLICY = _build_csp()
+
+# ContentSecurityPolicyMiddleware용 CSP (구글 폰트/웹소켓 출처 추가 허용)
+_CSP_POLICY_WITH_FONTS_AND_WS = _build_csp(
+    style_src="https://fonts.googleapis.com",
+    font_src="https://fonts.gstatic.com",
+    connect_src="ws: wss:",
+)
+
+# 응답마다 같은 문자열을 다시 만들지 않도록 보안 헤더를 모듈 로드 시 한 번만 인코딩
+_SECURITY_HEADERS = (
+    # XSS 방지
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    # Content Security Policy
+    (b"content-security-policy", _CSP_POLICY),
+    # HSTS (HTTPS에서만)
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    # Referrer Policy
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    # Permissions Policy
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=(), payment=(), usb=()"),
+)
+
+_CSP_MIDDLEWARE_HEADER = (b"content-security-policy", _CSP_POLICY_WITH_FONTS_AND_WS)
+
+# Rate Limiting에서 제외할 경로 접두사 (API, 문서)
+_RATE_LIMIT_EXEMPT_PREFIXES = ("/api/", "/docs", "/redoc")
+
+# CSRF 토큰 검증 대상 메서드
+_CSRF_PROTECTED_METHODS = frozenset({"POST", "PUT", "DELETE", "PATCH"})
+
+# CSRF 토큰이 묶이는 세션 쿠키 이름
+CSRF_SESSION_COOKIE = "session_id"
+
+def _append_raw_headers(message: Message, headers: Tuple[Tuple[bytes, bytes], ...]):
+    """http.response.start 메시지에 미리 인코딩된 헤더를 덧붙입니다."""
+    # 응답 객체가 보유한 헤더 리스트를 직접 수정하지 않도록 한 번에 새 리스트로 교체
+    message["headers"] = [*message.get("headers", ()), *headers]
+
+def _snapshot_headers(scope: Scope) -> Dict[bytes, bytes]:
+    """ASGI 스코프의 헤더 목록을 한 번만 순회하여 딕셔너리로 만듭니다. (헤더 이름은 이미 소문자 bytes)"""
+    return dict(scope["headers"])
+
+def _client_ip_from_headers(headers: Dict[bytes, bytes], scope: Scope) -> str:
+    """헤더 스냅샷과 스코프에서 클라이언트 IP 주소 추출"""
+    # 프록시 헤더 확인 (첫 번째 주소만 필요하므로 리스트를 만들지 않고 잘라냄)
+    forwarded_for = headers.get(b"x-forwarded-for")
+    if forwarded_for:
+        comma = forwarded_for.find(b",")
+        return (forwarded_for if comma < 0 else forwarded_for[:comma]).strip().decode("latin-1")
+    
+    real_ip = headers.get(b"x-real-ip")
+    if real_ip:
+        return real_ip.decode("latin-1")
     
-    def __init__(self, app, enable_csrf: bool = True, enable_rate_limit: bool = True):
-        super().__init__(app)
+    # 기본 클라이언트 IP
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+def get_client_ip(request: Request) -> str:
+    """클라이언트 IP 주소 추출 (미들웨어 공용)"""
+    return _client_ip_from_headers(_snapshot_headers(request.scope), request.scope)
+
+# 생성된 SecurityMiddleware 인스턴스 (주기적 정리 작업에서 사용)
+_security_middlewares: "weakref.WeakSet[SecurityMiddleware]" = weakref.WeakSet()
+
+# Rate Limit 저장소 정리 주기 (초)
+RATE_LIMIT_CLEANUP_INTERVAL = 60
+
+async def periodic_rate_limit_cleanup(interval: float = RATE_LIMIT_CLEANUP_INTERVAL):
+    """
+    만료된 Rate Limit 항목을 주기적으로 정리하는 백그라운드 작업
+    
+    요청이 없는 기간에도 오래된 세대가 메모리에 남지 않도록 애플리케이션 lifespan에서 실행합니다.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        for middleware in list(_security_middlewares):
+            removed = middleware.cleanup_expired()
+            if removed:
+                logger.debug("Rate limit store cleanup: %d entries removed", removed)
+
+# Rate Limit 저장소 샤드 수 (2의 거듭제곱이어야 함)
+_SHARD_COUNT = 16
+_SHARD_MASK = _SHARD_COUNT - 1
+
+class _RateLimitShard:
+    """
+    Rate Limit 저장소 샤드
+    
+    IP별 (윈도우 번호, 이전 윈도우 요청 수, 현재 윈도우 요청 수)를
+    이전/현재 두 세대로 나누어 보관하고, 윈도우마다 이전 세대를 통째로 버립니다. (항목별 순회 없음)
+    """
+    
+    __slots__ = ("window_index", "prev", "curr")
+    
+    def __init__(self, window_index: int):
+        self.window_index = window_index
+        self.prev: Dict[str, Tuple[int, int, int]] = {}
+        self.curr: Dict[str, Tuple[int, int, int]] = {}
+    
+    def rotate(self, window_index: int) -> int:
+        """윈도우가 바뀌었으면 세대를 교체하고 버려진 항목 수를 반환합니다."""
+        if window_index == self.window_index:
+            return 0
+        
+        dropped = len(self.prev)
+        if window_index == self.window_index + 1:
+            self.prev = self.curr
+        else:
+            # 두 윈도우 이상 지난 항목은 카운트에 영향이 없으므로 함께 버림
+            dropped += len(self.curr)
+            self.prev = {}
+        self.curr = {}
+        self.window_index = window_index
+        return dropped
+
+class SecurityMiddleware:
+    """
+    보안 미들웨어
+    
+    BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현하여 요청마다 생성되는
+    anyio 태스크 그룹/메모리 스트림 비용을 없앴습니다.
+    거부 응답은 바로 전송하고, 보안 헤더는 send를 감싸서 응답 시작 메시지에 추가합니다.
+    """
+    
+    def __init__(self, app: ASGIApp, enable_csrf: bool = True, enable_rate_limit: bool = True):
+        self.app = app
         self.enable_csrf = enable_csrf
         self.enable_rate_limit = enable_rate_limit
-        self.rate_limit_store = {}  # 간단한 메모리 기반 저장소
+        self.window_size = 60  # 1분 윈도우
+        self.window_ns = self.window_size * 1_000_000_000  # 윈도우 크기 (나노초, 정수 연산용)
+        self.max_requests = 1000  # 윈도우당 최대 요청 수 (개발 환경에서는 더 관대하게)
+        # IP별 슬라이딩 윈도우 카운터를 IP 해시로 샤드에 나누어 저장 (샤드마다 딕셔너리 크기 감소)
+        window_index = time.monotonic_ns() // self.window_ns
+        self._shards = [_RateLimitShard(window_index) for _ in range(_SHARD_COUNT)]
+        # CSRF 토큰 서명 키 (여러 워커/재시작에서도 같은 토큰이 유효하도록 애플리케이션 시크릿에서 파생)
+        self._csrf_key = hmac.new(settings.secret_key.encode(), b"csrf-token", hashlib.sha256).digest()
+        _security_middlewares.add(self)
     
-    async def dispatch(self, request: Request, call_next):
-        # 요청 시작 시간
-        start_time = time.time()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # HTTP 외 요청(websocket, lifespan)은 그대로 전달
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # 클라이언트 IP 추출
-        client_ip = self._get_client_ip(request)
+        # 요청 시작 시간
+        start_time = time.perf_counter()
         
-        # API 요청과 로그인은 보안 검증 제외
-        is_api_request = request.url.path.startswith("/api/")
-        is_login_request = request.url.path.endswith("/login")
-        is_docs_request = request.url.path.startswith("/docs") or request.url.path.startswith("/redoc")
+        # 경로 관련 플래그를 한 번만 계산
+        path = scope["path"]
+        is_api_request = path.startswith("/api/")
+        headers = None  # 헤더가 필요한 경우에만 한 번 만들어 재사용
         
-        # Rate Limiting 체크 (API, 로그인, 문서는 제외)
-        if self.enable_rate_limit and not (is_api_request or is_login_request or is_docs_request):
+        # Rate Limiting 체크 (API, 문서는 접두사 튜플 한 번으로, 로그인은 접미사로 제외)
+        if self.enable_rate_limit and not (path.startswith(_RATE_LIMIT_EXEMPT_PREFIXES) or path.endswith("/login")):
+            headers = _snapshot_headers(scope)
+            client_ip = _client_ip_from_headers(headers, scope)
             rate_limit_result = self._check_rate_limit(client_ip)
             if not rate_limit_result:
-                logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-                return Response(
+                logger.warning("Rate limit exceeded for IP: %s", client_ip)
+                response = Response(
                     content="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
                     status_code=429,
                     media_type="text/plain"
                 )
+                await response(scope, receive, send)
+                return
         
         # CSRF 토큰 검증 (API 요청은 제외)
-        if self.enable_csrf and request.method in ["POST", "PUT", "DELETE", "PATCH"] and not is_api_request:
-            if not self._validate_csrf_token(request):
-                logger.warning(f"CSRF validation failed for IP: {client_ip}")
-                return Response(
+        if self.enable_csrf and not is_api_request and scope["method"] in _CSRF_PROTECTED_METHODS:
+            if headers is None:
+                headers = _snapshot_headers(scope)
+            if not self._validate_csrf_token(headers, is_api_request):
+                logger.warning("CSRF validation failed for IP: %s", _client_ip_from_headers(headers, scope))
+                response = Response(
                     content="CSRF 토큰이 유효하지 않습니다.",
                     status_code=403,
                     media_type="text/plain"
                 )
+                await response(scope, receive, send)
+                return
         
-        # 응답 생성
-        response = await call_next(request)
-        
-        # 보안 헤더 추가 (API 요청은 제외)
-        if not is_api_request:
-            self._add_security_headers(response)
+        # 응답 생성 (보안 헤더는 API 요청을 제외하고 응답 시작 시 추가)
+        if is_api_request:
+            await self.app(scope, receive, send)
+        else:
+            async def send_with_security_headers(message: Message):
+                if message["type"] == "http.response.start":
+                    self._add_security_headers(message)
+                await send(message)
+            
+            await self.app(scope, receive, send_with_security_headers)
         
         # 처리 시간 로깅
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         if process_time > 1.0:  # 1초 이상 걸린 요청 로깅
-            logger.warning(f"Slow request: {request.method} {request.url} - {process_time:.3f}s")
-        
-        return response
+            logger.warning("Slow request: %s %s - %.3fs", scope["method"], path, process_time)
     
-    def _get_client_ip(self, request: Request) -> str:
-        """클라이언트 IP 주소 추출"""
-        # 프록시 헤더 확인
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-        
-        # 기본 클라이언트 IP
-        return request.client.host if request.client else "unknown"
+    def _get_shard(self, client_ip: str) -> "_RateLimitShard":
+        """클라이언트 IP가 속한 샤드를 반환합니다."""
+        return self._shards[hash(client_ip) & _SHARD_MASK]
     
     def _check_rate_limit(self, client_ip: str) -> bool:
-        """Rate Limiting 체크"""
-        current_time = time.time()
-        window_size = 60  # 1분 윈도우
-        max_requests = 1000  # 최대 요청 수 (개발 환경에서는 더 관대하게)
+        """
+        Rate Limiting 체크 (슬라이딩 윈도우 카운터, 요청당 O(1))
         
-        # 클라이언트 IP의 요청 기록 가져오기
-        if client_ip not in self.rate_limit_store:
-            self.rate_limit_store[client_ip] = []
+        이전 윈도우 요청 수를 현재 윈도우에서 지난 비율만큼 줄여 더하므로
+        고정 윈도우 경계에서 요청이 두 배로 몰리는 문제를 막습니다.
+        """
+        # 단조 시계의 정수 나노초 사용 (NTP 시간 보정의 영향을 받지 않음)
+        now_ns = time.monotonic_ns()
+        window_ns = self.window_ns
+        window_index = now_ns // window_ns
+        shard = self._get_shard(client_ip)
+        shard.rotate(window_index)
         
-        requests = self.rate_limit_store[client_ip]
+        # 현재 세대에 없으면 이전 세대에서 가져옴
+        entry = shard.curr.get(client_ip) or shard.prev.pop(client_ip, None)
+        prev_count = curr_count = 0
+        if entry:
+            stored_index, prev_count, curr_count = entry
+            if stored_index != window_index:
+                # 윈도우가 바뀌면 현재 카운트를 이전 카운트로 이동 (두 윈도우 이상 지났으면 0)
+                prev_count = curr_count if window_index == stored_index + 1 else 0
+                curr_count = 0
         
-        # 윈도우 밖의 요청 제거
-        requests = [req_time for req_time in requests if current_time - req_time < window_size]
-        self.rate_limit_store[client_ip] = requests
+        # 이전 윈도우 요청 수를 남은 비율만큼 반영한 추정치
+        elapsed_fraction = (now_ns % window_ns) / window_ns
+        estimated = prev_count * (1 - elapsed_fraction) + curr_count
         
-        # 요청 수 체크
-        if len(requests) >= max_requests:
+        if estimated >= self.max_requests:
+            shard.curr[client_ip] = (window_index, prev_count, curr_count)
             return False
         
         # 현재 요청 추가
-        requests.append(current_time)
+        shard.curr[client_ip] = (window_index, prev_count, curr_count + 1)
         return True
     
-    def _validate_csrf_token(self, request: Request) -> bool:
-        """CSRF 토큰 검증"""
+    def cleanup_expired(self) -> int:
+        """
+        요청이 없던 샤드도 세대 교체가 일어나도록 합니다.
+        
+        샤드별 교체 비용은 딕셔너리 하나를 버리는 것뿐이므로 항목 수와 무관합니다.
+        
+        Returns:
+            int: 제거된 항목 수
+        """
+        window_index = time.monotonic_ns() // self.window_ns
+        return sum(shard.rotate(window_index) for shard in self._shards)
+    
+    def generate_csrf_token(self, session_id: str) -> str:
+        """세션 ID에 묶인 CSRF 토큰을 발급합니다. (HMAC-SHA256)"""
+        return hmac.new(self._csrf_key, session_id.encode(), hashlib.sha256).hexdigest()
+    
+    def _validate_csrf_token(self, headers: Dict[bytes, bytes], is_api_request: bool) -> bool:
+        """CSRF 토큰 검증 (헤더 스냅샷 사용)"""
         # API 요청은 CSRF 검증 제외 (JWT 토큰 사용)
-        if request.url.path.startswith("/api/"):
+        if is_api_request:
             return True
         
-        # CSRF 토큰 확인
-        csrf_token = request.headers.get("X-CSRF-Token")
-        if not csrf_token:
+        # CSRF 토큰과 세션 쿠키 확인
+        csrf_token = headers.get(b"x-csrf-token")
+        cookie_header = headers.get(b"cookie")
+        if not csrf_token or not cookie_header:
+            return False
+        session_id = cookie_parser(cookie_header.decode("latin-1")).get(CSRF_SESSION_COOKIE)
+        if not session_id:
             return False
         
-        # 세션에서 토큰 확인 (실제 구현에서는 세션 사용)
-        # 여기서는 간단한 검증만 수행
-        return len(csrf_token) >= 32
-    
-    def _add_security_headers(self, response: Response):
-        """보안 헤더 추가"""
-        # XSS 방지
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        
-        # Content Security Policy
-        csp_policy = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net https://fastapi.tiangolo.com; "
-            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
-            "img-src 'self' data: https: https://fastapi.tiangolo.com; "
-            "font-src 'self'; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none';"
-        )
-        response.headers["Content-Security-Policy"] = csp_policy
-        
-        # HSTS (HTTPS에서만)
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        # Referrer Policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        # Permissions Policy
-        permissions_policy = (
-            "geolocation=(), "
-            "microphone=(), "
-            "camera=(), "
-            "payment=(), "
-            "usb=()"
-        )
-        response.headers["Permissions-Policy"] = permissions_policy
-
-class ContentSecurityPolicyMiddleware(BaseHTTPMiddleware):
-    """Content Security Policy 미들웨어"""
+        # 세션 ID로 기대 토큰을 계산하고 상수 시간 비교
+        expected = self.generate_csrf_token(session_id)
+        return hmac.compare_digest(expected.encode(), csrf_token)
     
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # CSP 헤더 추가
-        csp_policy = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net https://fastapi.tiangolo.com; "
-            "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdn.jsdelivr.net; "
-            "font-src 'self' https://fonts.gstatic.com; "
-            "img-src 'self' data: https: https://fastapi.tiangolo.com; "
-            "connect-src 'self' ws: wss:; "
-            "frame-ancestors 'none';"
-        )
-        
-        response.headers["Content-Security-Policy"] = csp_policy
-        return response
+    def _add_security_headers(self, message: Message):
+        """보안 헤더 추가 (응답 시작 메시지에 미리 인코딩된 헤더를 덧붙임)"""
+        _append_raw_headers(message, _SECURITY_HEADERS)
+
+class ContentSecurityPolicyMiddleware:
+    """
+    Content Security Policy 미들웨어
+    
+    응답 객체를 다시 만들지 않고 send를 감싸서 응답 시작 메시지에 CSP 헤더를 추가합니다.
+    (StreamingResponse도 본문 버퍼링 없이 그대로 전달됨)
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_csp(message: Message):
+            if message["type"] == "http.response.start":
+                # CSP 헤더 추가
+                _append_raw_headers(message, (_CSP_MIDDLEWARE_HEADER,))
+            await send(message)
+        
+        await self.app(scope, receive, send_with_csp)
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """요청 로깅 미들웨어"""
     
     async def dispatch(self, request: Request, call_next):
         # 요청 정보 로깅
-        client_ip = self._get_client_ip(request)
+        client_ip = get_client_ip(request)
         user_agent = request.headers.get("user-agent", "unknown")
         
-        logger.info(f"요청 시작 - {request.method} {request.url} (IP: {client_ip}, UA: {user_agent[:100]})")
+        logger.info("요청 시작 - %s %s (IP: %s, UA: %.100s)", request.method, request.url, client_ip, user_agent)
         
         try:
             response = await call_next(request)
-            logger.info(f"요청 완료 - {request.method} {request.url} -> {response.status_code}")
+            logger.info("요청 완료 - %s %s -> %s", request.method, request.url, response.status_code)
             return response
         except Exception as e:
-            logger.error(f"요청 실패 - {request.method} {request.url} -> {str(e)}")
+            logger.error("요청 실패 - %s %s -> %s", request.method, request.url, e)
             raise
-    
-    def _get_client_ip(self, request: Request) -> str:
-        """클라이언트 IP 주소 추출"""
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-        
-        return request.client.host if request.client else "unknown" 
\ No newline at end of file
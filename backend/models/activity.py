@@ -1,8 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from database import Base
-from services.time_service import TimeService
+from database import Base, kst_now
 
 class Activity(Base):
     __tablename__ = "activities"
@@ -14,7 +13,14 @@ class Activity(Base):
     resource_id = Column(Integer, nullable=True)  # 관련 리소스 ID
     description = Column(Text, nullable=False)  # 활동 설명
     activity_metadata = Column(Text, nullable=True)  # 추가 정보 (JSON 형태)
-    created_at = Column(DateTime(timezone=True), default=TimeService.now_kst)
+    created_at = Column(DateTime(timezone=True), server_default=kst_now())  # 대량 기록 테이블이므로 DB에서 시각을 채움
 
     # 관계
-    user = relationship("User", back_populates="activities") 
\ No newline at end of file
+    user = relationship("User", back_populates="activities")
+
+    # 필터별 최신순(created_at DESC) 조회/키셋 페이지네이션용 복합 인덱스
+    __table_args__ = (
+        Index("ix_activities_user_created", user_id, created_at),
+        Index("ix_activities_resource_created", resource_type, resource_id, created_at),
+        Index("ix_activities_action_created", action, created_at),
+    ) 
\ No newline at end of file
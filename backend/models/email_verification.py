@@ -2,9 +2,15 @@ from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Foreign
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime, timedelta
+from typing import List, Sequence, Tuple
+import base64
+import os
 import secrets
 from services.time_service import TimeService
 
+# 인증 코드 원본 바이트 수 (secrets.token_urlsafe(32)와 동일)
+VERIFICATION_CODE_BYTES = 32
+
 class EmailVerification(Base):
     __tablename__ = "email_verifications"
 
@@ -22,7 +28,7 @@ class EmailVerification(Base):
     @classmethod
     def create_verification(cls, user_id: int, email: str, expires_in_hours: int = 24):
         """인증 코드 생성"""
-        verification_code = secrets.token_urlsafe(32)
+        verification_code = secrets.token_urlsafe(VERIFICATION_CODE_BYTES)
         expires_at = TimeService.now_kst() + timedelta(hours=expires_in_hours)
         
         return cls(
@@ -32,6 +38,34 @@ class EmailVerification(Base):
             expires_at=expires_at
         )
     
+    @classmethod
+    def create_verifications_bulk(
+        cls, specs: Sequence[Tuple[int, str]], expires_in_hours: int = 24
+    ) -> List["EmailVerification"]:
+        """
+        여러 인증 코드를 한 번에 생성
+        
+        코드마다 난수를 따로 읽지 않고 os.urandom을 한 번만 호출한 뒤 나누어 사용합니다.
+        각 코드의 형식은 secrets.token_urlsafe(32)와 같습니다.
+        
+        Args:
+            specs: (user_id, email) 목록
+            expires_in_hours: 만료 시간 (시간)
+        """
+        size = VERIFICATION_CODE_BYTES
+        raw = os.urandom(len(specs) * size)
+        expires_at = TimeService.now_kst() + timedelta(hours=expires_in_hours)
+        
+        return [
+            cls(
+                user_id=user_id,
+                email=email,
+                verification_code=base64.urlsafe_b64encode(raw[i * size:(i + 1) * size]).rstrip(b"=").decode("ascii"),
+                expires_at=expires_at
+            )
+            for i, (user_id, email) in enumerate(specs)
+        ]
+    
     def is_expired(self) -> bool:
         """토큰 만료 여부 확인"""
         return bool(TimeService.now_kst() > self.expires_at) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 from database import Base
@@ -22,4 +22,13 @@ class Invite(Base):
     # 관계
     team = relationship("Team")
     creator = relationship("User", foreign_keys=[created_by])
-    user = relationship("User", foreign_keys=[user_id]) 
\ No newline at end of file
+    user = relationship("User", foreign_keys=[user_id])
+
+    # 사용자별 대기 중 초대 조회용 부분 인덱스, 팀+사용자 초대 조회용 복합 인덱스
+    __table_args__ = (
+        Index(
+            "ix_invites_user_pending", user_id,
+            postgresql_where=(status == "pending"), sqlite_where=(status == "pending"),
+        ),
+        Index("ix_invites_team_user", team_id, user_id),
+    )
@@ -1,7 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from database import Base
-from services.time_service import TimeService
+from database import Base, kst_now
 
 class Notification(Base):
     __tablename__ = "notifications"
@@ -13,7 +12,15 @@ class Notification(Base):
     type = Column(String, nullable=False)  # team_invite, planner_deadline, post_comment, etc.
     is_read = Column(Boolean, default=False)
     related_id = Column(Integer)  # 팀 ID, 플래너 ID, 게시글 ID 등
-    created_at = Column(DateTime(timezone=True), default=TimeService.now_kst)
+    created_at = Column(DateTime(timezone=True), server_default=kst_now())  # 대량 기록 테이블이므로 DB에서 시각을 채움
 
     # 관계
-    user = relationship("User", back_populates="notifications") 
\ No newline at end of file
+    user = relationship("User", back_populates="notifications")
+    
+    # 사용자별 읽지 않은 알림 조회용 부분 인덱스 (읽지 않은 행만 포함하므로 전체 인덱스보다 작음)
+    __table_args__ = (
+        Index(
+            "ix_notifications_user_unread", user_id, created_at.desc(),
+            postgresql_where=(is_read == False), sqlite_where=(is_read == False),
+        ),
+    ) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Date, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Date, Enum, Index
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime, date
@@ -27,4 +27,10 @@ class Planner(Base):
     team = relationship("Team", back_populates="planners")
     creator = relationship("User", back_populates="planners")
     todos = relationship("Todo", back_populates="planner", cascade="all, delete-orphan")
+    
+    # 팀별 플래너 목록(최신순) 조회용 인덱스
+    # PostgreSQL에서는 목록에 필요한 컬럼을 INCLUDE하여 Index Only Scan이 가능 (SQLite는 일반 복합 인덱스)
+    __table_args__ = (
+        Index("ix_planners_team_created", team_id, created_at.desc(), postgresql_include=["title", "status"]),
+    )
  
\ No newline at end of file
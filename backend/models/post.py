@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from database import Base
+from database import Base, register_fts_index
 from services.time_service import TimeService
 
 class Post(Base):
@@ -22,4 +22,12 @@ class Post(Base):
     team = relationship("Team", back_populates="posts")
     replies = relationship("Reply", back_populates="post", cascade="all, delete-orphan")
     likes = relationship("Like", back_populates="post", cascade="all, delete-orphan")
- 
\ No newline at end of file
+    
+    # 팀별 게시글 목록(최신순) 조회용 인덱스
+    # PostgreSQL에서는 목록에 필요한 컬럼을 INCLUDE하여 Index Only Scan이 가능 (SQLite는 일반 복합 인덱스)
+    __table_args__ = (
+        Index("ix_posts_team_created", team_id, created_at.desc(), postgresql_include=["title", "author_id"]),
+    )
+
+# 제목/내용 전문 검색 인덱스 (SQLite FTS5 trigram)
+register_fts_index(Post.__table__, "title", "content")
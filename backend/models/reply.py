@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone, timedelta
-from database import Base
+from database import Base, register_fts_index
 from services.time_service import TimeService
 
 def korea_time():
@@ -22,4 +22,7 @@ class Reply(Base):
 
     # 관계
     author = relationship("User", back_populates="replies")
-    post = relationship("Post", back_populates="replies") 
\ No newline at end of file
+    post = relationship("Post", back_populates="replies")
+
+# 내용 전문 검색 인덱스 (SQLite FTS5 trigram)
+register_fts_index(Reply.__table__, "content")
@@ -13,7 +13,7 @@
 
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -125,4 +125,9 @@ class TeamMember(Base):
 
     # 관계 정의
     team = relationship("Team", back_populates="members")  # 소속 팀
-    user = relationship("User", back_populates="teams")  # 팀 멤버 사용자 
\ No newline at end of file
+    user = relationship("User", back_populates="teams")  # 팀 멤버 사용자
+
+    # 권한 확인 시 (team_id, user_id)로 역할을 조회하므로 복합 유니크 인덱스 사용
+    __table_args__ = (
+        Index("ix_team_members_team_user", "team_id", "user_id", unique=True),
+    ) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Table, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Table, Enum, Index
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
@@ -41,6 +41,19 @@ class Todo(Base):
     creator = relationship("User", foreign_keys=[created_by], back_populates="todos")
     assignees = relationship("User", secondary=todo_assignments, back_populates="assigned_todos")
     
+    # 플래너별 미완료 할일(마감일 순) 조회용 부분 인덱스
+    __table_args__ = (
+        Index(
+            "ix_todos_planner_incomplete", planner_id, due_date,
+            postgresql_where=(is_completed == False), sqlite_where=(is_completed == False),
+        ),
+        # 마감일이 지난 미완료 할일 조회용 부분 인덱스
+        Index(
+            "ix_todos_due_incomplete", due_date,
+            postgresql_where=(is_completed == False), sqlite_where=(is_completed == False),
+        ),
+    )
+    
     # 추가 필드 (API 응답용) - ClassVar로 표시하여 ORM 매핑 제외
     planner_name: ClassVar[Optional[str]] = None
     assignee_names: ClassVar[List[str]] = []
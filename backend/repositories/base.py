@@ -12,9 +12,40 @@ Repository 패턴 기본 인터페이스 모듈
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict, Type, TypeVar, Generic, Protocol
+from contextlib import contextmanager
+from typing import List, Optional, Any, Dict, Type, TypeVar, Generic, Protocol, Iterator
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, insert, func, inspect, exists as sa_exists
+
+# transaction 블록 중첩 깊이를 저장하는 Session.info 키
+# (요청 내 모든 Repository/Service가 같은 세션을 공유하므로 깊이도 세션 단위로 관리)
+_TX_DEPTH_KEY = "tx_depth"
+
+def commit_or_flush(db: Session) -> bool:
+    """
+    세션이 transaction 블록 밖이면 커밋하고, 블록 안이면 flush만 수행합니다.
+    
+    Returns:
+        bool: 실제로 커밋했으면 True
+    """
+    if db.info.get(_TX_DEPTH_KEY):
+        db.flush()
+        return False
+    db.commit()
+    return True
+
+def rollback_unless_in_transaction(db: Session) -> bool:
+    """
+    세션이 transaction 블록 밖이면 롤백합니다.
+    블록 안에서는 롤백하지 않으며, 예외를 받은 가장 바깥 블록이 롤백합니다.
+    
+    Returns:
+        bool: 실제로 롤백했으면 True
+    """
+    if db.info.get(_TX_DEPTH_KEY):
+        return False
+    db.rollback()
+    return True
 
 class HasId(Protocol):
     """
@@ -25,6 +56,9 @@ class HasId(Protocol):
     """
     id: Any
 
+# 모델별 컬럼 속성 이름 집합 (업데이트 필드 검증용, 모델당 한 번만 계산)
+_MODEL_COLUMN_KEYS: Dict[type, frozenset] = {}
+
 # 제네릭 타입 변수 정의
 # T는 HasId 프로토콜을 구현하는 모든 타입이 될 수 있음
 T = TypeVar('T', bound=HasId)
@@ -39,12 +73,17 @@ class BaseRepository(ABC, Generic[T]):
     
     주요 기능:
     - create: 새로운 객체 생성
+    - bulk_create: 여러 객체를 한 번의 INSERT로 생성
     - get: ID로 객체 조회
     - get_all: 모든 객체 조회
+    - iter_all: 모든 객체를 일정 개수씩 나눠 스트리밍 조회
     - update: 객체 업데이트
+    - update_by_id / update_returning: 단일 UPDATE 문으로 업데이트
     - delete: 객체 삭제
+    - delete_by_id: 단일 DELETE 문으로 삭제
     - exists: 객체 존재 여부 확인
     - count: 객체 개수 반환
+    - transaction: 여러 작업을 하나의 커밋으로 묶는 컨텍스트
     
     사용 예시:
         class UserRepository(BaseRepository[User]):
@@ -64,6 +103,55 @@ class BaseRepository(ABC, Generic[T]):
         """
         self.db = db
     
+    @contextmanager
+    def transaction(self) -> Iterator["BaseRepository[T]"]:
+        """
+        블록 안의 create/update/delete를 하나의 커밋으로 묶습니다.
+        
+        블록 안에서는 각 작업이 커밋 대신 flush만 수행하므로(자동 생성 ID는 채워짐)
+        행마다 발생하던 커밋(fsync)과 refresh 조회가 사라집니다.
+        블록이 정상 종료되면 한 번 커밋하고, 예외가 발생하면 롤백합니다.
+        중첩된 경우 가장 바깥 블록에서만 커밋합니다.
+        블록 깊이는 세션에 저장되므로, 같은 세션을 쓰는 다른 Repository나
+        Service(commit_or_flush 사용)의 쓰기도 이 블록의 커밋에 함께 묶입니다.
+        
+        사용 예시:
+            with user_repo.transaction():
+                for data in users_data:
+                    user_repo.create(data)
+        """
+        info = self.db.info
+        info[_TX_DEPTH_KEY] = info.get(_TX_DEPTH_KEY, 0) + 1
+        try:
+            yield self
+        except Exception:
+            if info[_TX_DEPTH_KEY] == 1:
+                self.db.rollback()
+            raise
+        else:
+            if info[_TX_DEPTH_KEY] == 1:
+                self.db.commit()
+        finally:
+            info[_TX_DEPTH_KEY] -= 1
+    
+    def _commit(self) -> bool:
+        """
+        transaction 블록 밖이면 커밋하고, 블록 안이면 flush만 수행합니다.
+        
+        Returns:
+            bool: 실제로 커밋했으면 True
+        """
+        return commit_or_flush(self.db)
+    
+    def _rollback(self) -> bool:
+        """
+        transaction 블록 밖이면 롤백하고, 블록 안이면 바깥 블록에 맡깁니다.
+        
+        Returns:
+            bool: 실제로 롤백했으면 True
+        """
+        return rollback_unless_in_transaction(self.db)
+    
     @abstractmethod
     def get_model(self) -> Type[T]:
         """
@@ -100,10 +188,44 @@ class BaseRepository(ABC, Generic[T]):
         model_class = self.get_model()
         db_obj = model_class(**obj_in)  # 모델 인스턴스 생성
         self.db.add(db_obj)  # 세션에 추가
-        self.db.commit()  # 데이터베이스에 커밋
-        self.db.refresh(db_obj)  # 생성된 ID 등 최신 정보로 갱신
+        # 커밋 (transaction 블록 안에서는 flush만)
+        # 생성된 ID와 서버 기본값은 INSERT ... RETURNING으로 채워지므로 refresh 불필요
+        self._commit()
         return db_obj
     
+    def bulk_create(self, objs_in: List[Dict[str, Any]]) -> List[T]:
+        """
+        여러 객체를 한 번의 INSERT ... RETURNING 문과 한 번의 커밋으로 생성합니다.
+        
+        create를 반복 호출하면 행마다 커밋과 refresh(SELECT)가 발생하므로,
+        대량 생성 시에는 이 메서드를 사용합니다.
+        
+        Args:
+            objs_in (List[Dict[str, Any]]): 생성할 객체 데이터의 리스트
+                
+        Returns:
+            List[T]: 생성된 객체 리스트 (입력 순서 유지)
+            
+        사용 예시:
+            users = user_repo.bulk_create([
+                {"name": "홍길동", "email": "hong@example.com"},
+                {"name": "김철수", "email": "kim@example.com"},
+            ])
+        """
+        if not objs_in:
+            return []
+        model_class = self.get_model()
+        try:
+            db_objs = list(self.db.scalars(
+                insert(model_class).returning(model_class, sort_by_parameter_order=True),
+                objs_in,
+            ))
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return db_objs
+    
     def get(self, id: int) -> Optional[T]:
         """
         ID로 객체를 조회합니다.
@@ -137,6 +259,29 @@ class BaseRepository(ABC, Generic[T]):
         model_class = self.get_model()
         return self.db.query(model_class).all()
     
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[T]:
+        """
+        모든 객체를 chunk_size개씩 가져오며 순회합니다.
+        
+        get_all과 달리 전체 결과를 리스트로 만들지 않으므로, 내보내기나 배치 처리처럼
+        행이 많은 경우에도 메모리 사용량이 chunk_size 수준으로 유지됩니다.
+        (서버 측 커서를 지원하는 드라이버에서는 stream_results로 동작)
+        
+        Args:
+            chunk_size (int): 한 번에 가져올 행 수
+            
+        Returns:
+            Iterator[T]: 객체 이터레이터 (순회가 끝날 때까지 결과가 열려 있음)
+            
+        사용 예시:
+            for user in user_repo.iter_all(chunk_size=500):
+                export(user)
+        """
+        model_class = self.get_model()
+        return iter(self.db.scalars(
+            select(model_class).order_by(model_class.id).execution_options(yield_per=chunk_size)
+        ))
+    
     def update(self, id: int, obj_in: Dict[str, Any]) -> Optional[T]:
         """
         객체를 업데이트합니다.
@@ -156,12 +301,80 @@ class BaseRepository(ABC, Generic[T]):
         """
         db_obj = self.get(id)
         if db_obj:
-            # 제공된 필드만 업데이트
+            # 모델 컬럼에 해당하는 필드만 업데이트
+            columns = self._column_keys()
             for field, value in obj_in.items():
-                if hasattr(db_obj, field):
+                if field in columns:
                     setattr(db_obj, field, value)
-            self.db.commit()  # 변경사항 커밋
-            self.db.refresh(db_obj)  # 최신 정보로 갱신
+            self._commit()  # 변경사항 커밋 (expire_on_commit=False이므로 refresh 불필요)
+        return db_obj
+    
+    def _column_keys(self) -> frozenset:
+        """모델의 컬럼 속성 이름 집합을 반환합니다. (모델별로 캐시)"""
+        model_class = self.get_model()
+        keys = _MODEL_COLUMN_KEYS.get(model_class)
+        if keys is None:
+            keys = frozenset(attr.key for attr in inspect(model_class).column_attrs)
+            _MODEL_COLUMN_KEYS[model_class] = keys
+        return keys
+    
+    def _column_values(self, obj_in: Dict[str, Any]) -> Dict[str, Any]:
+        """업데이트 데이터 중 모델의 컬럼에 해당하는 필드만 남깁니다."""
+        columns = self._column_keys()
+        return {field: value for field, value in obj_in.items() if field in columns}
+    
+    def update_by_id(self, id: int, obj_in: Dict[str, Any]) -> bool:
+        """
+        조회 없이 단일 UPDATE 문으로 객체를 업데이트합니다.
+        
+        갱신된 객체가 필요 없는 경우 update 대신 사용합니다.
+        (SELECT + ORM 로드 없이 한 번의 왕복으로 처리)
+        
+        Args:
+            id (int): 업데이트할 객체의 ID
+            obj_in (Dict[str, Any]): 업데이트할 필드와 값 (컬럼이 아닌 필드는 무시)
+                
+        Returns:
+            bool: 업데이트된 행이 있으면 True, 없으면 False
+            
+        사용 예시:
+            if user_repo.update_by_id(1, {"name": "김철수"}):
+                print("업데이트 완료")
+        """
+        values = self._column_values(obj_in)
+        if not values:
+            return self.exists(id)
+        model_class = self.get_model()
+        result = self.db.execute(
+            update(model_class).where(model_class.id == id).values(**values)
+        )
+        self._commit()
+        return result.rowcount > 0
+    
+    def update_returning(self, id: int, obj_in: Dict[str, Any]) -> Optional[T]:
+        """
+        UPDATE ... RETURNING 문으로 객체를 업데이트하고 갱신된 객체를 반환합니다.
+        
+        update와 달리 사전 조회와 refresh 없이 한 번의 문으로 처리합니다.
+        
+        Args:
+            id (int): 업데이트할 객체의 ID
+            obj_in (Dict[str, Any]): 업데이트할 필드와 값 (컬럼이 아닌 필드는 무시)
+                
+        Returns:
+            Optional[T]: 업데이트된 객체 또는 None (존재하지 않는 경우)
+            
+        사용 예시:
+            updated_user = user_repo.update_returning(1, {"name": "김철수"})
+        """
+        values = self._column_values(obj_in)
+        if not values:
+            return self.get(id)
+        model_class = self.get_model()
+        db_obj = self.db.scalars(
+            update(model_class).where(model_class.id == id).values(**values).returning(model_class)
+        ).first()
+        self._commit()
         return db_obj
     
     def delete(self, id: int) -> bool:
@@ -182,10 +395,31 @@ class BaseRepository(ABC, Generic[T]):
         db_obj = self.get(id)
         if db_obj:
             self.db.delete(db_obj)  # 객체 삭제
-            self.db.commit()  # 변경사항 커밋
+            self._commit()  # 변경사항 커밋
             return True
         return False
     
+    def delete_by_id(self, id: int) -> bool:
+        """
+        조회 없이 단일 DELETE 문으로 객체를 삭제합니다.
+        
+        ORM cascade(relationship의 delete-orphan, secondary 연결 행 정리)가
+        적용되지 않으므로, 하위 객체가 없는 모델에만 사용해야 합니다.
+        
+        Args:
+            id (int): 삭제할 객체의 ID
+            
+        Returns:
+            bool: 삭제된 행이 있으면 True, 없으면 False
+            
+        사용 예시:
+            success = invite_repo.delete_by_id(1)
+        """
+        model_class = self.get_model()
+        result = self.db.execute(delete(model_class).where(model_class.id == id))
+        self._commit()
+        return result.rowcount > 0
+    
     def exists(self, id: int) -> bool:
         """
         객체가 존재하는지 확인합니다.
@@ -201,7 +435,8 @@ class BaseRepository(ABC, Generic[T]):
                 print("사용자가 존재합니다")
         """
         model_class = self.get_model()
-        return self.db.query(model_class).filter(model_class.id == id).first() is not None
+        # 행 전체를 로드하지 않고 EXISTS 서브쿼리로 존재 여부만 확인
+        return bool(self.db.scalar(select(sa_exists().where(model_class.id == id))))
     
     def count(self) -> int:
         """
@@ -215,7 +450,8 @@ class BaseRepository(ABC, Generic[T]):
             print(f"총 사용자 수: {total_users}")
         """
         model_class = self.get_model()
-        return self.db.query(model_class).count()
+        # Query.count()의 서브쿼리 래핑 없이 SELECT count(*)를 직접 실행
+        return self.db.scalar(select(func.count()).select_from(model_class))
 
 class RepositoryInterface(ABC):
     """
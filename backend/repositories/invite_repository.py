@@ -1,8 +1,19 @@
 from typing import List, Optional
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 from repositories.base import BaseRepository
 from models.invite import Invite
 
+# 자주 호출되는 조회 문은 모듈 로드 시 한 번만 구성하고 바인드 파라미터로 실행
+# (동일한 문 객체를 재사용하므로 SQLAlchemy 컴파일 캐시 적중률이 높아짐)
+SELECT_INVITES_BY_TEAM = select(Invite).where(Invite.team_id == bindparam("team_id"))
+SELECT_INVITES_BY_USER = select(Invite).where(Invite.user_id == bindparam("user_id"))
+SELECT_PENDING_INVITES = select(Invite).where(
+    Invite.user_id == bindparam("user_id"),
+    Invite.status == "pending"
+)
+SELECT_INVITES_BY_STATUS = select(Invite).where(Invite.status == bindparam("status"))
+
 class InviteRepository(BaseRepository[Invite]):
     """초대 관련 데이터 접근을 처리하는 Repository"""
     
@@ -14,11 +25,11 @@ class InviteRepository(BaseRepository[Invite]):
     
     def get_by_team(self, team_id: int) -> List[Invite]:
         """팀별 초대를 조회합니다."""
-        return self.db.query(Invite).filter(Invite.team_id == team_id).all()
+        return self.db.scalars(SELECT_INVITES_BY_TEAM, {"team_id": team_id}).all()
     
     def get_by_user(self, user_id: int) -> List[Invite]:
         """사용자별 초대를 조회합니다."""
-        return self.db.query(Invite).filter(Invite.user_id == user_id).all()
+        return self.db.scalars(SELECT_INVITES_BY_USER, {"user_id": user_id}).all()
     
     def get_by_team_and_user(self, team_id: int, user_id: int) -> Optional[Invite]:
         """팀과 사용자로 초대를 조회합니다."""
@@ -29,11 +40,12 @@ class InviteRepository(BaseRepository[Invite]):
     
     def get_pending_invites(self, user_id: int) -> List[Invite]:
         """사용자의 대기 중인 초대를 조회합니다."""
-        return self.db.query(Invite).filter(
-            Invite.user_id == user_id,
-            Invite.status == "pending"
-        ).all()
+        return self.db.scalars(SELECT_PENDING_INVITES, {"user_id": user_id}).all()
     
     def get_by_status(self, status: str) -> List[Invite]:
         """상태별 초대를 조회합니다."""
-        return self.db.query(Invite).filter(Invite.status == status).all() 
\ No newline at end of file
+        return self.db.scalars(SELECT_INVITES_BY_STATUS, {"status": status}).all()
+    
+    def delete(self, id: int) -> bool:
+        """초대를 삭제합니다. (하위 객체가 없으므로 단일 DELETE 문 사용)"""
+        return self.delete_by_id(id)
@@ -1,3 +1,4 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional, Dict, Any, Type
 from models.planner import Planner
@@ -31,19 +32,12 @@ class PlannerRepository(BaseRepository[Planner]):
     
     def get_by_user_teams(self, user_id: int) -> List[Planner]:
         """사용자가 속한 팀들의 플래너들을 조회합니다."""
-        # 사용자가 속한 팀들 조회
-        user_teams = self.db.query(TeamMember.team_id).filter(TeamMember.user_id == user_id).all()
-        user_team_ids = [team.team_id for team in user_teams]
-        
-        # 해당 팀들의 플래너들 조회 (N+1 쿼리 방지)
+        # 사용자의 팀 ID를 서브쿼리로 두어 DB가 세미 조인으로 처리 (팀 정보는 joinedload로 함께 로드)
+        user_team_ids = select(TeamMember.team_id).where(TeamMember.user_id == user_id)
         return self.db.query(Planner).options(
             joinedload(Planner.team)
         ).filter(Planner.team_id.in_(user_team_ids)).all()
     
-
-    
-
-    
     def get_with_team(self, planner_id: int) -> Optional[Planner]:
         """팀 정보와 함께 플래너를 조회합니다."""
         return self.db.query(Planner).options(
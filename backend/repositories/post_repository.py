@@ -1,10 +1,22 @@
+from sqlalchemy import select, bindparam, Row
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from repositories.base import BaseRepository
+from database import FTS_MIN_QUERY_LENGTH, fts_match_ids
 from models.post import Post
 from models.user import User
 from models.team import TeamMember
 
+# 자주 호출되는 조회 문은 모듈 로드 시 한 번만 구성하고 바인드 파라미터로 실행
+SELECT_POSTS_BY_TEAM = select(Post).where(Post.team_id == bindparam("team_id"))
+SELECT_POSTS_BY_AUTHOR = select(Post).where(Post.author_id == bindparam("author_id"))
+# 카드형 목록용 요약 컬럼만 조회 (ORM 객체를 만들지 않음)
+SELECT_POST_SUMMARIES_BY_TEAM = (
+    select(Post.id, Post.title, Post.author_id, Post.created_at)
+    .where(Post.team_id == bindparam("team_id"))
+    .order_by(Post.created_at.desc())
+)
+
 class PostRepository(BaseRepository[Post]):
     """게시글 관련 데이터 접근을 처리하는 Repository"""
     
@@ -16,23 +28,36 @@ class PostRepository(BaseRepository[Post]):
     
     def get_by_team(self, team_id: int) -> List[Post]:
         """팀별 게시글을 조회합니다."""
-        return self.db.query(Post).filter(Post.team_id == team_id).all()
+        return self.db.scalars(SELECT_POSTS_BY_TEAM, {"team_id": team_id}).all()
+    
+    def list_summaries(self, team_id: int) -> List[Row]:
+        """팀 게시글의 요약(id, title, author_id, created_at)을 최신순으로 조회합니다."""
+        return self.db.execute(SELECT_POST_SUMMARIES_BY_TEAM, {"team_id": team_id}).all()
     
     def get_by_author(self, author_id: int) -> List[Post]:
         """작성자별 게시글을 조회합니다."""
-        return self.db.query(Post).filter(Post.author_id == author_id).all()
+        return self.db.scalars(SELECT_POSTS_BY_AUTHOR, {"author_id": author_id}).all()
     
     def get_by_teams(self, team_ids: List[int]) -> List[Post]:
         """여러 팀의 게시글을 조회합니다."""
         return self.db.query(Post).filter(Post.team_id.in_(team_ids)).all()
     
     def search_posts(self, query: str, team_ids: List[int]) -> List[Post]:
-        """게시글을 검색합니다."""
+        """
+        게시글을 검색합니다.
+        
+        SQLite에서는 제목/내용 FTS5 trigram 인덱스로 부분 일치 검색을 수행하고,
+        인덱스를 쓸 수 없는 짧은 검색어(3글자 미만)나 다른 DB에서는 ILIKE로 검색합니다.
+        """
         from sqlalchemy import or_
-        return self.db.query(Post).filter(
-            Post.team_id.in_(team_ids),
-            or_(
+        if len(query) >= FTS_MIN_QUERY_LENGTH and self.db.get_bind().dialect.name == "sqlite":
+            text_filter = Post.id.in_(fts_match_ids(Post.__tablename__, query))
+        else:
+            text_filter = or_(
                 Post.title.ilike(f"%{query}%"),
                 Post.content.ilike(f"%{query}%")
             )
-        ).all() 
\ No newline at end of file
+        return self.db.query(Post).filter(
+            Post.team_id.in_(team_ids),
+            text_filter
+        ).all()
\ No newline at end of file
@@ -1,8 +1,18 @@
 from typing import List, Optional
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 from repositories.base import BaseRepository
+from database import FTS_MIN_QUERY_LENGTH, fts_match_ids
 from models.reply import Reply
 
+# 자주 호출되는 조회 문은 모듈 로드 시 한 번만 구성하고 바인드 파라미터로 실행
+SELECT_REPLIES_BY_POST = (
+    select(Reply)
+    .where(Reply.post_id == bindparam("post_id"))
+    .order_by(Reply.created_at.desc())
+)
+SELECT_REPLIES_BY_AUTHOR = select(Reply).where(Reply.author_id == bindparam("author_id"))
+
 class ReplyRepository(BaseRepository[Reply]):
     """댓글 관련 데이터 접근을 처리하는 Repository"""
     
@@ -14,34 +24,33 @@ class ReplyRepository(BaseRepository[Reply]):
     
     def get_by_post(self, post_id: int) -> List[Reply]:
         """게시글별 댓글을 조회합니다 (삭제된 댓글 포함, 최신순 정렬)."""
-        return self.db.query(Reply).filter(Reply.post_id == post_id).order_by(Reply.created_at.desc()).all()
+        return self.db.scalars(SELECT_REPLIES_BY_POST, {"post_id": post_id}).all()
     
     def get_by_author(self, author_id: int) -> List[Reply]:
         """작성자별 댓글을 조회합니다."""
-        return self.db.query(Reply).filter(Reply.author_id == author_id).all()
+        return self.db.scalars(SELECT_REPLIES_BY_AUTHOR, {"author_id": author_id}).all()
     
     def get_by_posts(self, post_ids: List[int]) -> List[Reply]:
         """여러 게시글의 댓글을 조회합니다."""
         return self.db.query(Reply).filter(Reply.post_id.in_(post_ids)).all()
     
     def search_replies(self, query: str, post_ids: List[int]) -> List[Reply]:
-        """댓글을 검색합니다."""
-        from sqlalchemy import or_
+        """
+        댓글을 검색합니다.
+        
+        SQLite에서는 FTS5 trigram 인덱스를, 3글자 미만 검색어나 다른 DB에서는 ILIKE를 사용합니다.
+        """
+        if len(query) >= FTS_MIN_QUERY_LENGTH and self.db.get_bind().dialect.name == "sqlite":
+            text_filter = Reply.id.in_(fts_match_ids(Reply.__tablename__, query))
+        else:
+            text_filter = Reply.content.ilike(f"%{query}%")
         return self.db.query(Reply).filter(
             Reply.post_id.in_(post_ids),
-            or_(
-                Reply.content.ilike(f"%{query}%")
-            )
+            text_filter
         ).all()
     
     def soft_delete(self, id: int) -> bool:
         """댓글을 소프트 삭제합니다 (is_deleted = True, deleted_at 설정)."""
         from services.time_service import TimeService
         
-        reply = self.get(id)
-        if reply:
-            setattr(reply, 'is_deleted', True)
-            setattr(reply, 'deleted_at', TimeService.now_kst())
-            self.db.commit()
-            return True
-        return False 
\ No newline at end of file
+        return self.update_by_id(id, {"is_deleted": True, "deleted_at": TimeService.now_kst()}) 
\ No newline at end of file
@@ -1,3 +1,4 @@
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any, Type
 from models.team import Team, TeamMember
@@ -34,33 +35,26 @@ class TeamRepository(BaseRepository[Team]):
             role=role
         )
         self.db.add(member)
-        self.db.commit()
-        self.db.refresh(member)
+        self._commit()
         return member
     
     def remove_member(self, team_id: int, user_id: int) -> bool:
         """팀에서 멤버를 제거합니다."""
-        member = self.db.query(TeamMember).filter(
+        result = self.db.execute(delete(TeamMember).where(
             TeamMember.team_id == team_id,
             TeamMember.user_id == user_id
-        ).first()
-        if member:
-            self.db.delete(member)
-            self.db.commit()
-            return True
-        return False
+        ))
+        self._commit()
+        return result.rowcount > 0
     
     def update_member_role(self, team_id: int, user_id: int, new_role: str) -> bool:
         """팀 멤버의 역할을 업데이트합니다."""
-        member = self.db.query(TeamMember).filter(
+        result = self.db.execute(update(TeamMember).where(
             TeamMember.team_id == team_id,
             TeamMember.user_id == user_id
-        ).first()
-        if member:
-            setattr(member, 'role', new_role)
-            self.db.commit()
-            return True
-        return False
+        ).values(role=new_role))
+        self._commit()
+        return result.rowcount > 0
     
     def get_members(self, team_id: int) -> List[TeamMember]:
         """팀의 멤버들을 조회합니다."""
@@ -76,28 +70,34 @@ class TeamRepository(BaseRepository[Team]):
     def delete_team_members(self, team_id: int) -> bool:
         """팀의 모든 멤버를 삭제합니다."""
         try:
-            members = self.db.query(TeamMember).filter(TeamMember.team_id == team_id).all()
-            for member in members:
-                self.db.delete(member)
-            self.db.commit()
+            self._delete_members_of(team_id)
+            self._commit()
             return True
-        except Exception as e:
-            self.db.rollback()
+        except Exception:
+            # transaction 블록 안에서는 예외를 바깥 블록으로 전달해 전체를 롤백
+            if not self._rollback():
+                raise
             return False
     
+    def _delete_members_of(self, team_id: int) -> int:
+        """팀 멤버를 한 번의 DELETE 문으로 삭제합니다. (커밋하지 않음)"""
+        result = self.db.execute(delete(TeamMember).where(TeamMember.team_id == team_id))
+        return result.rowcount
+    
     def delete(self, team_id: int) -> bool:
-        """팀을 삭제합니다. 먼저 팀 멤버들을 삭제한 후 팀을 삭제합니다."""
+        """팀을 삭제합니다. 팀 멤버 삭제와 팀 삭제를 하나의 트랜잭션으로 처리합니다."""
         try:
-            # 먼저 팀 멤버들을 삭제
-            self.delete_team_members(team_id)
-            
-            # 그 다음 팀을 삭제
             team = self.get_by_id(team_id)
-            if team:
-                self.db.delete(team)
-                self.db.commit()
-                return True
+            if not team:
+                return False
+            
+            # 팀 멤버 삭제 후 팀 삭제 - 커밋은 한 번만
+            self._delete_members_of(team_id)
+            self.db.delete(team)
+            self._commit()
+            return True
+        except Exception:
+            # transaction 블록 안에서는 예외를 바깥 블록으로 전달해 전체를 롤백
+            if not self._rollback():
+                raise
             return False
-        except Exception as e:
-            self.db.rollback()
-            return False 
\ No newline at end of file
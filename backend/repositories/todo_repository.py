@@ -1,7 +1,7 @@
-from typing import List, Optional, Dict, Any, Type
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc, asc
-from models.todo import Todo
+from typing import List, Optional, Dict, Any, Type, Tuple
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import Row, and_, or_, desc, asc, select, bindparam, delete, update, case, func, tuple_, exists as sa_exists
+from models.todo import Todo, todo_assignments
 from models.user import User
 from models.planner import Planner
 from models.team import TeamMember
@@ -11,6 +11,25 @@ from datetime import date, datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# 자주 호출되는 조회 문은 모듈 로드 시 한 번만 구성하고 바인드 파라미터로 실행
+SELECT_TODOS_BY_PLANNER = select(Todo).where(Todo.planner_id == bindparam("planner_id"))
+SELECT_TODOS_BY_STATUS = select(Todo).where(Todo.status == bindparam("status"))
+SELECT_TODOS_BY_PRIORITY = select(Todo).where(Todo.priority == bindparam("priority"))
+# 칸반 보드용 요약 컬럼만 조회 (ORM 객체를 만들지 않음)
+SELECT_TODO_SUMMARIES_BY_PLANNER = (
+    select(Todo.id, Todo.title, Todo.status, Todo.priority, Todo.is_completed, Todo.due_date)
+    .where(Todo.planner_id == bindparam("planner_id"))
+    .order_by(Todo.id)
+)
+
+# 키셋(cursor) 페이지네이션 정렬에 허용하는 컬럼 (NULL이 없는 컬럼만 허용 - 키셋 비교가 NULL에서 깨지므로)
+_CURSOR_SORT_COLUMNS = {
+    "id": Todo.id,
+    "created_at": Todo.created_at,
+    "updated_at": Todo.updated_at,
+    "title": Todo.title,
+}
+
 class TodoRepository(BaseRepository[Todo]):
     """Todo 모델을 위한 Repository 클래스"""
     
@@ -35,14 +54,18 @@ class TodoRepository(BaseRepository[Todo]):
     
     def get_by_planner(self, planner_id: int) -> List[Todo]:
         """특정 플래너의 할일들을 조회합니다."""
-        return self.db.query(Todo).filter(Todo.planner_id == planner_id).all()
+        return self.db.scalars(SELECT_TODOS_BY_PLANNER, {"planner_id": planner_id}).all()
     
 
     
+    def list_summaries(self, planner_id: int) -> List[Row]:
+        """플래너 할일의 요약(id, title, status, priority, is_completed, due_date)을 조회합니다."""
+        return self.db.execute(SELECT_TODO_SUMMARIES_BY_PLANNER, {"planner_id": planner_id}).all()
+    
     def get_by_assignee(self, user_id: int) -> List[Todo]:
         """특정 사용자가 담당자인 할일들을 조회합니다."""
         return self.db.query(Todo).options(
-            joinedload(Todo.assignees),
+            selectinload(Todo.assignees),
             joinedload(Todo.planner)
         ).join(Todo.assignees).filter(User.id == user_id).all()
     
@@ -55,7 +78,7 @@ class TodoRepository(BaseRepository[Todo]):
     def get_by_team(self, team_id: int) -> List[Todo]:
         """특정 팀의 할일들을 조회합니다."""
         return self.db.query(Todo).options(
-            joinedload(Todo.assignees),
+            selectinload(Todo.assignees),
             joinedload(Todo.planner)
         ).join(Planner).filter(Planner.team_id == team_id).all()
     
@@ -63,29 +86,22 @@ class TodoRepository(BaseRepository[Todo]):
     
     def get_by_user_teams(self, user_id: int) -> List[Todo]:
         """사용자가 속한 팀들의 할일들을 조회합니다."""
-        # 사용자가 속한 팀들의 플래너들 조회
-        user_teams = self.db.query(TeamMember.team_id).filter(TeamMember.user_id == user_id).all()
-        user_team_ids = [team.team_id for team in user_teams]
-        
-        # 해당 팀들의 플래너들 조회
-        user_planners = self.db.query(Planner).filter(Planner.team_id.in_(user_team_ids)).all()
-        user_planner_ids = [planner.id for planner in user_planners]
-        
-        # 해당 플래너들의 할일들 조회 (N+1 쿼리 방지)
-        return self.db.query(Todo).options(
-            joinedload(Todo.assignees),
+        # 사용자의 팀 ID를 서브쿼리로 두고 플래너와만 JOIN하여 한 번의 쿼리로 조회 (N+1 쿼리 방지)
+        user_team_ids = select(TeamMember.team_id).where(TeamMember.user_id == user_id)
+        return self.db.query(Todo).join(
+            Planner, Todo.planner_id == Planner.id
+        ).options(
+            selectinload(Todo.assignees),
             joinedload(Todo.planner)
-        ).filter(Todo.planner_id.in_(user_planner_ids)).all()
-    
-
+        ).filter(Planner.team_id.in_(user_team_ids)).all()
     
     def get_by_status(self, status: str) -> List[Todo]:
         """상태별로 할일들을 조회합니다."""
-        return self.db.query(Todo).filter(Todo.status == status).all()
+        return self.db.scalars(SELECT_TODOS_BY_STATUS, {"status": status}).all()
     
     def get_by_priority(self, priority: str) -> List[Todo]:
         """우선순위별로 할일들을 조회합니다."""
-        return self.db.query(Todo).filter(Todo.priority == priority).all()
+        return self.db.scalars(SELECT_TODOS_BY_PRIORITY, {"priority": priority}).all()
     
     def get_overdue_todos(self) -> List[Todo]:
         """마감일이 지난 할일들을 조회합니다."""
@@ -125,48 +141,49 @@ class TodoRepository(BaseRepository[Todo]):
         try:
             todo = self.get_by_id(todo_id)
             if todo:
+                columns = self._column_keys()
                 for field, value in todo_data.items():
-                    if hasattr(todo, field):
+                    if field in columns:
                         setattr(todo, field, value)
-                self.db.commit()
-                self.db.refresh(todo)
+                self._commit()
                 logger.info(f"할일 {todo_id} 업데이트 완료")
             return todo
         except Exception as e:
-            self.db.rollback()
+            self._rollback()
             logger.error(f"할일 업데이트 실패: {e}")
             raise
     
     def delete(self, todo_id: int) -> bool:
         """할일을 삭제합니다."""
         try:
-            todo = self.get_by_id(todo_id)
-            if todo:
-                self.db.delete(todo)
-                self.db.commit()
+            # 담당자 연결 행과 할일을 조회 없이 DELETE 문으로 삭제 (커밋은 한 번)
+            self.db.execute(delete(todo_assignments).where(todo_assignments.c.todo_id == todo_id))
+            result = self.db.execute(delete(Todo).where(Todo.id == todo_id))
+            self._commit()
+            if result.rowcount > 0:
                 logger.info(f"할일 {todo_id} 삭제 완료")
                 return True
             return False
         except Exception as e:
-            self.db.rollback()
+            self._rollback()
             logger.error(f"할일 삭제 실패: {e}")
             raise
     
     def exists(self, todo_id: int) -> bool:
         """할일이 존재하는지 확인합니다."""
-        return self.db.query(Todo).filter(Todo.id == todo_id).first() is not None
+        return bool(self.db.scalar(select(sa_exists().where(Todo.id == todo_id))))
     
     def count(self) -> int:
         """할일의 총 개수를 반환합니다."""
-        return self.db.query(Todo).count()
+        return self.db.scalar(select(func.count()).select_from(Todo))
     
     def count_by_status(self, status: str) -> int:
         """상태별 할일 개수를 반환합니다."""
-        return self.db.query(Todo).filter(Todo.status == status).count()
+        return self.db.scalar(select(func.count(Todo.id)).where(Todo.status == status))
     
     def count_by_planner(self, planner_id: int) -> int:
         """플래너별 할일 개수를 반환합니다."""
-        return self.db.query(Todo).filter(Todo.planner_id == planner_id).count()
+        return self.db.scalar(select(func.count(Todo.id)).where(Todo.planner_id == planner_id))
     
     def get_with_assignees(self, todo_id: int) -> Optional[Todo]:
         """담당자 정보와 함께 할일을 조회합니다."""
@@ -177,40 +194,73 @@ class TodoRepository(BaseRepository[Todo]):
         return self.db.query(Todo).join(Planner).filter(Todo.id == todo_id).first()
     
     def get_todos_with_pagination(self, page: int = 1, per_page: int = 20, 
-                                 sort_by: str = 'created_at', sort_order: str = 'desc') -> Dict[str, Any]:
-        """페이지네이션과 정렬을 적용하여 할일들을 조회합니다."""
-        query = self.db.query(Todo)
+                                 sort_by: str = 'created_at', sort_order: str = 'desc',
+                                 cursor: Optional[Tuple[Any, int]] = None) -> Dict[str, Any]:
+        """
+        페이지네이션과 정렬을 적용하여 할일들을 조회합니다.
         
-        # 정렬
-        if sort_order == 'desc':
-            query = query.order_by(desc(getattr(Todo, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Todo, sort_by)))
+        cursor((정렬 값, id))가 주어지면 OFFSET 대신 키셋(seek) 방식으로
+        해당 위치 다음 행부터 조회하므로 페이지 깊이와 무관하게 인덱스 탐색만 수행합니다.
+        응답의 next_cursor를 다음 요청의 cursor로 전달하면 됩니다.
+        키셋 방식은 NULL이 없는 정렬 기준(_CURSOR_SORT_COLUMNS)에서만 지원하며,
+        그 외 정렬 기준은 OFFSET 페이지로만 조회할 수 있습니다. (next_cursor는 None)
+        """
+        cursor_column = _CURSOR_SORT_COLUMNS.get(sort_by)
+        if cursor is not None and cursor_column is None:
+            raise ValueError(f"커서 페이지네이션을 지원하지 않는 정렬 기준입니다: {sort_by}")
+        sort_column = cursor_column if cursor_column is not None else getattr(Todo, sort_by)
         
-        # 전체 개수 (최적화된 카운트 쿼리)
-        total = query.count()
+        is_desc = sort_order == 'desc'
+        order = desc if is_desc else asc
+        # id를 보조 정렬 키로 사용하여 정렬 값이 같은 행도 순서를 고정
+        query = self.db.query(Todo).order_by(order(sort_column), order(Todo.id))
         
-        # 페이지네이션 (N+1 쿼리 방지)
-        offset = (page - 1) * per_page
+        # 전체 개수 (정렬/서브쿼리 없이 별도의 count 문으로 조회)
+        total = self.db.scalar(select(func.count(Todo.id)))
+        
+        if cursor is not None:
+            key = tuple_(sort_column, Todo.id)
+            query = query.filter(key < tuple_(*cursor) if is_desc else key > tuple_(*cursor))
+        else:
+            query = query.offset((page - 1) * per_page)
+        
+        # N+1 쿼리 방지
         todos = query.options(
-            joinedload(Todo.assignees),
+            selectinload(Todo.assignees),
             joinedload(Todo.planner)
-        ).offset(offset).limit(per_page).all()
+        ).limit(per_page).all()
+        
+        next_cursor = None
+        if cursor_column is not None and len(todos) == per_page:
+            last = todos[-1]
+            next_cursor = (getattr(last, sort_column.key), last.id)
         
         return {
             'todos': todos,
             'total': total,
             'page': page,
             'per_page': per_page,
-            'pages': (total + per_page - 1) // per_page
+            'pages': (total + per_page - 1) // per_page,
+            'next_cursor': next_cursor
         } 
 
     def toggle_completion(self, todo_id: int) -> Optional[Todo]:
-        """할일 완료 상태를 토글합니다."""
-        todo = self.get_by_id(todo_id)
-        if todo:
-            current_status = getattr(todo, 'is_completed', False)
-            setattr(todo, 'is_completed', not current_status)
-            self.db.commit()
-            self.db.refresh(todo)
-        return todo 
\ No newline at end of file
+        """
+        할일 완료 상태를 토글합니다.
+        
+        조회 후 파이썬에서 값을 뒤집지 않고 한 번의 UPDATE ... RETURNING으로 처리하므로
+        동시 요청 사이의 갱신 손실이 없습니다. 상태(status)도 함께 맞춰 변경합니다.
+        """
+        # SET 절의 우변은 변경 전 값을 참조함
+        was_completed = func.coalesce(Todo.is_completed, False)
+        todo = self.db.scalars(
+            update(Todo)
+            .where(Todo.id == todo_id)
+            .values(
+                is_completed=~was_completed,
+                status=case((was_completed, '진행중'), else_='완료')
+            )
+            .returning(Todo)
+        ).one_or_none()
+        self._commit()
+        return todo
\ No newline at end of file
@@ -1,8 +1,59 @@
-from typing import List, Optional, Dict, Any, Type
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Type
+from sqlalchemy import select, bindparam, event, inspect
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, object_session
 from models.user import User
 from models.team import TeamMember
 from repositories.base import BaseRepository
+from services.cache_service import cache_service
+
+# 자주 호출되는 조회 문은 모듈 로드 시 한 번만 구성하고 바인드 파라미터로 실행
+SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+SELECT_USER_SUMMARY_BY_EMAIL = select(
+    User.id, User.name, User.email, User.created_at, User.updated_at
+).where(User.email == bindparam("email"))
+SELECT_USER_EMAIL_BY_ID = select(User.email).where(User.id == bindparam("id"))
+
+# 이메일 -> 사용자 요약(비밀번호/인증 토큰 제외) 캐시 (초대/사용자 검색 시 반복되는 조회용)
+# 로그인 등 인증 경로는 캐시를 거치지 않고 항상 DB에서 조회
+USER_SUMMARY_CACHE_TTL = 60  # 초
+_PENDING_EVICTIONS_KEY = "evicted_user_emails"
+
+def _summary_cache_key(email: str) -> str:
+    return f"user:summary:{email}"
+
+def _evict_pending(session: Session) -> None:
+    """커밋된 세션에서 예약된 이메일의 요약 캐시를 제거합니다."""
+    pending = session.info[_PENDING_EVICTIONS_KEY]
+    for email in pending:
+        cache_service.delete(_summary_cache_key(email))
+    pending.clear()
+
+def _discard_pending(session: Session) -> None:
+    """롤백된 세션의 예약을 취소합니다. (DB 행이 바뀌지 않았으므로 캐시도 유효)"""
+    session.info[_PENDING_EVICTIONS_KEY].clear()
+
+def evict_user_summary_after_commit(session: Session, *emails: Optional[str]) -> None:
+    """
+    세션이 커밋된 뒤 해당 이메일의 요약 캐시를 제거하도록 예약합니다.
+    
+    커밋 전에 제거하면 동시 요청이 커밋 전 행을 읽어 다시 캐시할 수 있으므로,
+    사용자 행을 변경한 세션에만 after_commit 리스너를 한 번 등록합니다.
+    """
+    pending = session.info.get(_PENDING_EVICTIONS_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_EVICTIONS_KEY] = set()
+        event.listen(session, "after_commit", _evict_pending)
+        event.listen(session, "after_rollback", _discard_pending)
+    pending.update(email for email in emails if email)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _evict_on_user_flush(mapper, connection, target):
+    """ORM으로 사용자가 변경/삭제되면 (변경 전 이메일 포함) 커밋 후 캐시를 무효화합니다."""
+    evict_user_summary_after_commit(
+        object_session(target), target.email, *inspect(target).attrs.email.history.deleted
+    )
 
 class UserRepository(BaseRepository[User]):
     """User 모델을 위한 Repository 클래스"""
@@ -20,7 +71,22 @@ class UserRepository(BaseRepository[User]):
     
     def get_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자를 조회합니다."""
-        return self.db.query(User).filter(User.email == email).first()
+        return self.db.scalars(SELECT_USER_BY_EMAIL, {"email": email}).first()
+    
+    def get_summary_by_email(self, email: str) -> Optional[Row]:
+        """
+        이메일로 사용자 요약(id, name, email, created_at, updated_at)을 조회합니다.
+        
+        비밀번호 등 인증 정보가 없는 요약 행만 짧은 TTL로 캐시하며,
+        사용자 변경/삭제가 커밋되면 무효화됩니다. 존재하지 않는 이메일은 캐시하지 않습니다.
+        """
+        key = _summary_cache_key(email)
+        summary = cache_service.get(key)
+        if summary is None:
+            summary = self.db.execute(SELECT_USER_SUMMARY_BY_EMAIL, {"email": email}).first()
+            if summary is not None:
+                cache_service.set(key, summary, ttl=USER_SUMMARY_CACHE_TTL)
+        return summary
     
     def get_by_team(self, team_id: int) -> List[User]:
         """특정 팀의 멤버들을 조회합니다."""
@@ -30,11 +96,25 @@ class UserRepository(BaseRepository[User]):
         """팀 멤버 정보와 함께 사용자들을 조회합니다."""
         return self.db.query(User).join(TeamMember).filter(TeamMember.team_id == team_id).all()
     
+    def update_by_id(self, id: int, obj_in: Dict[str, Any]) -> bool:
+        """조회 없이 단일 UPDATE 문으로 사용자를 업데이트하고 커밋 후 요약 캐시를 무효화합니다."""
+        self._evict_summary(id)
+        return super().update_by_id(id, obj_in)
+    
+    def update_returning(self, id: int, obj_in: Dict[str, Any]) -> Optional[User]:
+        """UPDATE ... RETURNING 문으로 사용자를 업데이트하고 커밋 후 요약 캐시를 무효화합니다."""
+        self._evict_summary(id)
+        return super().update_returning(id, obj_in)
+    
+    def delete_by_id(self, id: int) -> bool:
+        """단일 DELETE 문으로 사용자를 삭제하고 커밋 후 요약 캐시를 무효화합니다."""
+        self._evict_summary(id)
+        return super().delete_by_id(id)
+    
+    def _evict_summary(self, user_id: int) -> None:
+        """flush를 거치지 않는 UPDATE/DELETE 문 대상 사용자의 캐시 무효화를 예약합니다."""
+        evict_user_summary_after_commit(self.db, self.db.scalar(SELECT_USER_EMAIL_BY_ID, {"id": user_id}))
+    
     def verify_email(self, user_id: int) -> bool:
         """사용자의 이메일을 인증합니다."""
-        user = self.get_by_id(user_id)
-        if user:
-            setattr(user, 'is_email_verified', True)
-            self.db.commit()
-            return True
-        return False 
\ No newline at end of file
+        return self.update_by_id(user_id, {"is_email_verified": True})
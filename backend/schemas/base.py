@@ -0,0 +1,11 @@
+from pydantic import BaseModel, ConfigDict
+
+class ORMReadBase(BaseModel):
+    """
+    ORM 객체로부터 생성되는 응답(Read) 스키마의 공통 베이스
+    
+    - from_attributes: ORM 객체에서 model_validate로 생성
+    - defer_build: 코어 스키마를 임포트 시점이 아닌 첫 사용 시점에 생성 (콜드 스타트 단축)
+    - frozen: 생성 후 변경하지 않는 응답 DTO
+    """
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True, populate_by_name=True)
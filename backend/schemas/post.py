@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from schemas.base import ORMReadBase
 from datetime import datetime
 from typing import Optional, List
 
@@ -18,12 +19,10 @@ class PostUpdate(BaseModel):
     category: Optional[str] = None
     tags: Optional[str] = None
 
-class PostRead(PostBase):
+class PostRead(PostBase, ORMReadBase):
     id: int
     author_id: int
     created_at: datetime
     updated_at: datetime
     author_name: Optional[str] = None
     team_name: Optional[str] = None
-
-    model_config = {"from_attributes": True} 
\ No newline at end of file
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
+from schemas.base import ORMReadBase
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 class ReplyBase(BaseModel):
     content: str
@@ -11,7 +12,7 @@ class ReplyCreate(ReplyBase):
 class ReplyUpdate(BaseModel):
     content: str
 
-class ReplyRead(ReplyBase):
+class ReplyRead(ReplyBase, ORMReadBase):
     id: int
     author_id: int
     author_name: Optional[str] = None  # 선택적 필드로 변경
@@ -20,16 +21,17 @@ class ReplyRead(ReplyBase):
     updated_at: datetime
     is_deleted: bool
     deleted_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
-    
-    @property
-    def content(self) -> str:
-        """삭제된 댓글의 경우 내용을 완전히 숨깁니다."""
-        if self.is_deleted:
-            return ""
-        return self._content
     
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._content = data.get('content', '') 
\ No newline at end of file
+    @model_validator(mode="wrap")
+    @classmethod
+    def _hide_deleted_content(cls, data: Any, handler) -> "ReplyRead":
+        """
+        삭제된 댓글의 경우 내용을 완전히 숨깁니다. (검증 시 한 번만 처리)
+        
+        생성자 경로에서는 after 검증기의 반환값이 무시되므로, 검증된 인스턴스의
+        필드 값을 직접 바꿉니다. (frozen 모델이므로 __dict__에 기록)
+        """
+        reply = handler(data)
+        if reply.is_deleted and reply.content:
+            reply.__dict__["content"] = ""
+        return reply
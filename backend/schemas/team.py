@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from schemas.base import ORMReadBase
 from typing import List, Optional, ForwardRef
 from datetime import datetime
 
@@ -19,7 +20,7 @@ class TeamMemberBase(BaseModel):
 class TeamMemberCreate(TeamMemberBase):
     user_id: int
 
-class TeamMemberRead(TeamMemberBase):
+class TeamMemberRead(TeamMemberBase, ORMReadBase):
     id: int
     team_id: int
     user_id: int
@@ -27,15 +28,13 @@ class TeamMemberRead(TeamMemberBase):
     user_name: Optional[str] = None
     user_email: Optional[str] = None
 
-    model_config = {"from_attributes": True}
-
 class TeamMemberUpdate(BaseModel):
     role: Optional[str] = None
 
 class RoleUpdate(BaseModel):
     role: str
 
-class TeamRead(TeamBase):
+class TeamRead(TeamBase, ORMReadBase):
     id: int
     created_at: datetime
     updated_at: datetime
@@ -43,5 +42,3 @@ class TeamRead(TeamBase):
     member_count: Optional[int] = None
     owner_id: Optional[int] = None
     owner_name: Optional[str] = None
-
-    model_config = {"from_attributes": True} 
\ No newline at end of file
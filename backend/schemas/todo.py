@@ -1,7 +1,9 @@
 from pydantic import BaseModel
+from schemas.base import ORMReadBase
 from typing import Optional, List
 from datetime import datetime, date
 from enum import Enum
+from types import MappingProxyType
 
 class TodoPriority(str, Enum):
     low = "낮음"
@@ -12,17 +14,13 @@ class TodoPriority(str, Enum):
     @classmethod
     def from_frontend(cls, value: str):
         """프론트엔드에서 보내는 값으로부터 TodoPriority 생성"""
-        mapping = {
-            "낮음": cls.low,
-            "보통": cls.medium,
-            "높음": cls.high,
-            "긴급": cls.urgent,
-            "low": cls.low,
-            "medium": cls.medium,
-            "high": cls.high,
-            "urgent": cls.urgent,
-        }
-        return mapping.get(value, cls.medium)
+        return _PRIORITY_FROM_FRONTEND.get(value, cls.medium)
+
+# 프론트엔드 값(한글 값 또는 영문 이름) -> TodoPriority (호출마다 딕셔너리를 만들지 않도록 한 번만 생성)
+_PRIORITY_FROM_FRONTEND = MappingProxyType({
+    **{priority.value: priority for priority in TodoPriority},
+    **{priority.name: priority for priority in TodoPriority},
+})
 
 class TodoBase(BaseModel):
     title: str
@@ -44,7 +42,7 @@ class TodoUpdate(BaseModel):
     assigned_to: Optional[List[int]] = None
     due_date: Optional[date] = None  # datetime에서 date로 변경
 
-class TodoRead(TodoBase):
+class TodoRead(TodoBase, ORMReadBase):
     id: int
     is_completed: bool
     planner_id: int
@@ -53,5 +51,3 @@ class TodoRead(TodoBase):
     updated_at: datetime
     creator_name: Optional[str] = None
     assignee_names: Optional[List[str]] = None
-
-    model_config = {"from_attributes": True} 
\ No newline at end of file
@@ -14,6 +14,7 @@ API 요청/응답 데이터의 검증과 직렬화를 담당합니다.
 """
 
 from pydantic import BaseModel, EmailStr
+from schemas.base import ORMReadBase
 from datetime import datetime
 
 class UserBase(BaseModel):
@@ -59,7 +60,7 @@ class UserCreate(UserBase):
     """
     password: str  # 비밀번호 (평문, 서버에서 해싱 처리)
 
-class UserRead(UserBase):
+class UserRead(UserBase, ORMReadBase):
     """
     사용자 조회 스키마
     
@@ -90,9 +91,8 @@ class UserRead(UserBase):
     created_at: datetime  # 계정 생성 시간
     updated_at: datetime  # 정보 수정 시간
 
-    # Pydantic 설정
+    # Pydantic 설정은 ORMReadBase에서 상속
     # from_attributes=True: SQLAlchemy 모델의 속성을 자동으로 매핑
-    model_config = {"from_attributes": True}
 
 class UserUpdate(BaseModel):
     """
@@ -1,11 +1,19 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, tuple_
+from sqlalchemy.orm import Session, Query, joinedload
 from models.activity import Activity
+from models.user import User
+from repositories.base import commit_or_flush, rollback_unless_in_transaction
 from typing import Optional, Dict, Any, List
-import json
+from datetime import datetime
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _dump_metadata(activity_metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """활동 메타데이터를 Text 컬럼에 저장할 JSON 문자열로 직렬화합니다. (orjson 사용)"""
+    return orjson.dumps(activity_metadata, default=str).decode() if activity_metadata else None
+
 class ActivityService:
     def __init__(self, db: Session):
         self.db = db
@@ -17,9 +25,15 @@ class ActivityService:
         resource_type: str,
         description: str,
         resource_id: Optional[int] = None,
-        activity_metadata: Optional[Dict[str, Any]] = None
+        activity_metadata: Optional[Dict[str, Any]] = None,
+        refresh: bool = False
     ):
-        """활동 로그를 기록합니다."""
+        """
+        활동 로그를 기록합니다.
+        
+        id는 INSERT 시점에 채워지므로 기본적으로 refresh(SELECT)를 생략합니다.
+        DB 기본값(created_at 등)까지 즉시 필요하면 refresh=True로 호출합니다.
+        """
         try:
             activity = Activity(
                 user_id=user_id,
@@ -27,18 +41,56 @@ class ActivityService:
                 resource_type=resource_type,
                 resource_id=resource_id,
                 description=description,
-                activity_metadata=json.dumps(activity_metadata) if activity_metadata else None
+                activity_metadata=_dump_metadata(activity_metadata)
             )
             self.db.add(activity)
-            self.db.commit()
-            self.db.refresh(activity)
+            commit_or_flush(self.db)
+            if refresh:
+                self.db.refresh(activity)
             logger.info(f"활동 로그 기록: {action} - {resource_type} - {description}")
             return activity
         except Exception as e:
-            self.db.rollback()
+            rollback_unless_in_transaction(self.db)
             logger.error(f"활동 로그 기록 실패: {str(e)}")
             raise
 
+    def log_activities(self, records: List[Dict[str, Any]]) -> int:
+        """
+        여러 활동 로그를 한 번의 executemany INSERT와 한 번의 커밋으로 기록합니다.
+        
+        할일 일괄 생성처럼 활동이 많이 발생하는 작업에서 log_activity를 반복 호출하면
+        활동마다 INSERT와 COMMIT이 발생하므로, 이 메서드로 모아서 기록합니다.
+        
+        Args:
+            records: log_activity의 인자와 같은 키(user_id, action, resource_type,
+                description, resource_id, activity_metadata)를 가진 딕셔너리 리스트
+        
+        Returns:
+            int: 기록한 활동 수
+        """
+        if not records:
+            return 0
+        rows = [
+            {
+                "user_id": record["user_id"],
+                "action": record["action"],
+                "resource_type": record["resource_type"],
+                "resource_id": record.get("resource_id"),
+                "description": record["description"],
+                "activity_metadata": _dump_metadata(record.get("activity_metadata")),
+            }
+            for record in records
+        ]
+        try:
+            self.db.execute(insert(Activity), rows)
+            commit_or_flush(self.db)
+            logger.info(f"활동 로그 일괄 기록: {len(rows)}개")
+            return len(rows)
+        except Exception as e:
+            rollback_unless_in_transaction(self.db)
+            logger.error(f"활동 로그 일괄 기록 실패: {str(e)}")
+            raise
+
     def log_team_activity(
         self,
         user_id: int,
@@ -78,13 +130,45 @@ class ActivityService:
             user_id, action, "post", description, post_id, activity_metadata
         )
 
+    def _paginate(
+        self,
+        query: Query,
+        skip: int,
+        limit: int,
+        before: Optional[datetime],
+        before_id: Optional[int]
+    ) -> List[Activity]:
+        """
+        최신순으로 정렬해 한 페이지를 조회합니다.
+        
+        before(직전 페이지 마지막 항목의 created_at)가 주어지면 OFFSET 대신 키셋(seek) 방식으로
+        그 이전 항목부터 조회합니다. 같은 시각의 항목이 페이지 경계에서 누락되지 않도록
+        마지막 항목의 id를 before_id로 함께 전달하는 것을 권장합니다.
+        """
+        if before is not None:
+            if before_id is not None:
+                query = query.filter(tuple_(Activity.created_at, Activity.id) < tuple_(before, before_id))
+            else:
+                query = query.filter(Activity.created_at < before)
+        elif skip:
+            query = query.offset(skip)
+        # 응답의 user_name을 채우기 위해 작성자를 같은 쿼리에서 함께 로드 (행마다 지연 로딩 방지)
+        activities = query.options(
+            joinedload(Activity.user).load_only(User.name)
+        ).order_by(Activity.created_at.desc(), Activity.id.desc()).limit(limit).all()
+        for activity in activities:
+            activity.user_name = activity.user.name if activity.user else None
+        return activities
+
     def get_activities(
         self,
         skip: int = 0,
         limit: int = 100,
         user_id: Optional[int] = None,
         action: Optional[str] = None,
-        resource_type: Optional[str] = None
+        resource_type: Optional[str] = None,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
     ) -> List[Activity]:
         """활동 로그를 조회합니다."""
         try:
@@ -99,7 +183,7 @@ class ActivityService:
                 query = query.filter(Activity.resource_type == resource_type)
             
             # 최신순으로 정렬
-            activities = query.order_by(Activity.created_at.desc()).offset(skip).limit(limit).all()
+            activities = self._paginate(query, skip, limit, before, before_id)
             logger.info(f"활동 로그 조회: {len(activities)}개")
             return activities
         except Exception as e:
@@ -110,13 +194,14 @@ class ActivityService:
         self,
         user_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
     ) -> List[Activity]:
         """특정 사용자의 활동 로그를 조회합니다."""
         try:
-            activities = self.db.query(Activity).filter(
-                Activity.user_id == user_id
-            ).order_by(Activity.created_at.desc()).offset(skip).limit(limit).all()
+            query = self.db.query(Activity).filter(Activity.user_id == user_id)
+            activities = self._paginate(query, skip, limit, before, before_id)
             logger.info(f"사용자 활동 로그 조회: {user_id} - {len(activities)}개")
             return activities
         except Exception as e:
@@ -127,14 +212,17 @@ class ActivityService:
         self,
         team_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
     ) -> List[Activity]:
         """팀 관련 활동 로그를 조회합니다."""
         try:
-            activities = self.db.query(Activity).filter(
+            query = self.db.query(Activity).filter(
                 Activity.resource_type == "team",
                 Activity.resource_id == team_id
-            ).order_by(Activity.created_at.desc()).offset(skip).limit(limit).all()
+            )
+            activities = self._paginate(query, skip, limit, before, before_id)
             logger.info(f"팀 활동 로그 조회: {team_id} - {len(activities)}개")
             return activities
         except Exception as e:
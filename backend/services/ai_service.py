@@ -1,151 +1,260 @@
 import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple, Sequence
 from collections import Counter
 
+# 키워드 추출용 정규식 (모듈 로드 시 한 번만 컴파일)
+_KOREAN_WORD_RE = re.compile(r'[가-힣]{2,}')
+_ENGLISH_WORD_RE = re.compile(r'\b[a-z]{2,}\b')  # 소문자로 변환한 텍스트에 적용
+
+# 키워드 추출 시 제외할 불용어
+_STOP_WORDS = frozenset({
+    '이', '가', '을', '를', '의', '에', '로', '으로', '와', '과', '도', '만', '은', '는',
+    '그', '저', '우리', '그것', '이것', '저것', '무엇', '어떤', '어떻게', '언제', '어디서', '왜',
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+})
+
+# 감정 분석용 긍정/부정 키워드 정규식 (내용을 한 번만 훑어 일치하는 키워드를 모두 찾음)
+_POSITIVE_WORD_RE = re.compile('|'.join(map(re.escape, [
+    "성공", "완료", "완벽", "훌륭", "좋", "개선", "향상", "진전", "달성",
+])))
+_NEGATIVE_WORD_RE = re.compile('|'.join(map(re.escape, [
+    "실패", "오류", "문제", "지연", "취소", "중단", "버그",
+])))
+
+# 같은 내용에 대한 반복 호출(미리보기 후 저장 등)을 위한 결과 캐시 크기
+_RESULT_CACHE_SIZE = 1024
+
+# 할일 우선순위 추정용 키워드 정규식 (우선순위 단계별 alternation)
+_HIGH_PRIORITY_RE = re.compile('|'.join(map(re.escape, [
+    "긴급", "중요", "핵심", "필수", "마감", "데드라인", "배포", "보안", "버그",
+])))
+_MEDIUM_PRIORITY_RE = re.compile('|'.join(map(re.escape, [
+    "개발", "구현", "테스트", "리뷰", "문서화", "분석",
+])))
+
+class _SubstringMatcher:
+    """
+    키워드와 부분 문자열 관계(keyword in word 또는 word in keyword)인 단어를 찾는 색인
+    
+    단어마다 2글자 이상의 모든 부분 문자열을 미리 색인해 두어,
+    키워드마다 전체 단어 목록을 순회하지 않고 해시 조회로 찾습니다.
+    """
+    
+    def __init__(self, words: Sequence[str]):
+        self._order = {word: position for position, word in enumerate(words)}
+        self._lengths = sorted({len(word) for word in words})
+        self._index: Dict[str, List[str]] = {}
+        for word in words:
+            substrings = {word[i:j] for i in range(len(word)) for j in range(i + 2, len(word) + 1)}
+            for substring in substrings:
+                self._index.setdefault(substring, []).append(word)
+    
+    def match(self, keyword: str) -> List[str]:
+        """키워드와 관계있는 단어를 원래 목록 순서대로 반환합니다."""
+        # keyword in word: 키워드가 어떤 단어의 부분 문자열인 경우
+        matches = set(self._index.get(keyword, ()))
+        # word in keyword: 키워드 안에 단어가 들어 있는 경우 (단어 길이별 부분 문자열만 확인)
+        for length in self._lengths:
+            if length > len(keyword):
+                break
+            for start in range(len(keyword) - length + 1):
+                candidate = keyword[start:start + length]
+                if candidate in self._order:
+                    matches.add(candidate)
+        return sorted(matches, key=self._order.__getitem__)
+
+# 추천 대상 태그 목록 (순서가 추천 우선순위)
+COMMON_TAGS: Tuple[str, ...] = (
+    "회의", "개발", "디자인", "마케팅", "기획", "테스트", "배포", "문서화",
+    "리뷰", "버그수정", "기능추가", "최적화", "보안", "백업", "모니터링",
+    "데이터분석", "사용자테스트", "프로토타입", "최종검토", "발표",
+    "교육", "훈련", "온보딩", "문서작성", "코드리뷰", "QA", "테스트케이스",
+    "API", "데이터베이스", "프론트엔드", "백엔드", "모바일", "웹", "앱",
+    "UI/UX", "사용자경험", "접근성", "성능", "확장성", "유지보수",
+)
+
+# 할일 추천을 위한 키워드 매핑 (카테고리 -> 추천 할일)
+TODO_KEYWORDS = MappingProxyType({
+    "회의": ("회의록 작성", "참석자 명단 확인", "회의실 예약", "안건 준비"),
+    "개발": ("코드 작성", "단위 테스트", "코드 리뷰", "문서화"),
+    "디자인": ("디자인 가이드 작성", "프로토타입 제작", "사용자 피드백 수집"),
+    "마케팅": ("마케팅 전략 수립", "콘텐츠 제작", "성과 분석"),
+    "기획": ("요구사항 분석", "기능 명세서 작성", "와이어프레임 제작"),
+    "테스트": ("테스트 케이스 작성", "테스트 실행", "버그 리포트 작성"),
+    "배포": ("배포 계획 수립", "롤백 계획 준비", "모니터링 설정"),
+    "문서화": ("API 문서 작성", "사용자 매뉴얼 작성", "개발 가이드 작성"),
+    "리뷰": ("코드 리뷰", "디자인 리뷰", "문서 리뷰"),
+    "버그수정": ("버그 재현", "원인 분석", "수정 테스트"),
+    "기능추가": ("요구사항 분석", "설계", "구현", "테스트"),
+    "최적화": ("성능 분석", "병목 지점 파악", "개선 방안 수립"),
+    "보안": ("보안 검토", "취약점 분석", "보안 패치 적용"),
+    "백업": ("백업 계획 수립", "백업 실행", "복구 테스트"),
+    "모니터링": ("모니터링 도구 설정", "알림 설정", "대시보드 구성"),
+    "데이터분석": ("데이터 수집", "데이터 정제", "분석 리포트 작성"),
+    "사용자테스트": ("테스트 계획 수립", "참가자 모집", "테스트 실행"),
+    "프로토타입": ("와이어프레임 제작", "프로토타입 제작", "사용자 피드백 수집"),
+    "최종검토": ("전체 기능 검토", "품질 검사", "최종 승인"),
+    "발표": ("발표 자료 준비", "리허설", "발표 실행"),
+    "교육": ("교육 자료 준비", "교육 일정 수립", "교육 실행"),
+    "훈련": ("훈련 계획 수립", "훈련 실행", "훈련 결과 평가"),
+    "온보딩": ("온보딩 가이드 작성", "멘토 배정", "진행 상황 체크"),
+    "문서작성": ("문서 구조 설계", "내용 작성", "검토 및 수정"),
+    "코드리뷰": ("코드 분석", "개선 사항 제안", "리뷰 결과 정리"),
+    "QA": ("테스트 계획 수립", "테스트 실행", "결과 분석"),
+    "테스트케이스": ("테스트 시나리오 작성", "테스트 데이터 준비", "테스트 실행"),
+    "API": ("API 설계", "API 문서 작성", "API 테스트"),
+    "데이터베이스": ("DB 설계", "스키마 작성", "데이터 마이그레이션"),
+    "프론트엔드": ("UI 컴포넌트 개발", "사용자 인터페이스 구현", "반응형 디자인"),
+    "백엔드": ("서버 로직 구현", "API 개발", "데이터베이스 연동"),
+    "모바일": ("모바일 앱 개발", "앱 스토어 등록", "사용자 피드백 수집"),
+    "웹": ("웹사이트 개발", "SEO 최적화", "웹 접근성 개선"),
+    "앱": ("앱 기획", "앱 개발", "앱 스토어 등록"),
+    "UI/UX": ("사용자 인터페이스 설계", "사용자 경험 개선", "프로토타입 제작"),
+    "사용자경험": ("사용자 조사", "사용자 여정 맵 작성", "개선 방안 수립"),
+    "접근성": ("접근성 가이드라인 검토", "접근성 테스트", "개선 사항 적용"),
+    "성능": ("성능 분석", "병목 지점 파악", "성능 최적화"),
+    "확장성": ("확장성 분석", "아키텍처 개선", "부하 테스트"),
+    "유지보수": ("코드 리팩토링", "문서 업데이트", "버전 관리"),
+})
+
+# 키워드 -> 태그/카테고리 매칭용 부분 문자열 색인 (모듈 로드 시 한 번만 생성)
+_TAG_MATCHER = _SubstringMatcher(COMMON_TAGS)
+_CATEGORY_MATCHER = _SubstringMatcher(tuple(TODO_KEYWORDS))
+
 class AIService:
+    common_tags = COMMON_TAGS
+    todo_keywords = TODO_KEYWORDS
+
     def __init__(self):
-        self.common_tags = [
-            "회의", "개발", "디자인", "마케팅", "기획", "테스트", "배포", "문서화",
-            "리뷰", "버그수정", "기능추가", "최적화", "보안", "백업", "모니터링",
-            "데이터분석", "사용자테스트", "프로토타입", "최종검토", "발표",
-            "교육", "훈련", "온보딩", "문서작성", "코드리뷰", "QA", "테스트케이스",
-            "API", "데이터베이스", "프론트엔드", "백엔드", "모바일", "웹", "앱",
-            "UI/UX", "사용자경험", "접근성", "성능", "확장성", "유지보수"
-        ]
-        
-        # 할일 추천을 위한 키워드 매핑
-        self.todo_keywords = {
-            "회의": ["회의록 작성", "참석자 명단 확인", "회의실 예약", "안건 준비"],
-            "개발": ["코드 작성", "단위 테스트", "코드 리뷰", "문서화"],
-            "디자인": ["디자인 가이드 작성", "프로토타입 제작", "사용자 피드백 수집"],
-            "마케팅": ["마케팅 전략 수립", "콘텐츠 제작", "성과 분석"],
-            "기획": ["요구사항 분석", "기능 명세서 작성", "와이어프레임 제작"],
-            "테스트": ["테스트 케이스 작성", "테스트 실행", "버그 리포트 작성"],
-            "배포": ["배포 계획 수립", "롤백 계획 준비", "모니터링 설정"],
-            "문서화": ["API 문서 작성", "사용자 매뉴얼 작성", "개발 가이드 작성"],
-            "리뷰": ["코드 리뷰", "디자인 리뷰", "문서 리뷰"],
-            "버그수정": ["버그 재현", "원인 분석", "수정 테스트"],
-            "기능추가": ["요구사항 분석", "설계", "구현", "테스트"],
-            "최적화": ["성능 분석", "병목 지점 파악", "개선 방안 수립"],
-            "보안": ["보안 검토", "취약점 분석", "보안 패치 적용"],
-            "백업": ["백업 계획 수립", "백업 실행", "복구 테스트"],
-            "모니터링": ["모니터링 도구 설정", "알림 설정", "대시보드 구성"],
-            "데이터분석": ["데이터 수집", "데이터 정제", "분석 리포트 작성"],
-            "사용자테스트": ["테스트 계획 수립", "참가자 모집", "테스트 실행"],
-            "프로토타입": ["와이어프레임 제작", "프로토타입 제작", "사용자 피드백 수집"],
-            "최종검토": ["전체 기능 검토", "품질 검사", "최종 승인"],
-            "발표": ["발표 자료 준비", "리허설", "발표 실행"],
-            "교육": ["교육 자료 준비", "교육 일정 수립", "교육 실행"],
-            "훈련": ["훈련 계획 수립", "훈련 실행", "훈련 결과 평가"],
-            "온보딩": ["온보딩 가이드 작성", "멘토 배정", "진행 상황 체크"],
-            "문서작성": ["문서 구조 설계", "내용 작성", "검토 및 수정"],
-            "코드리뷰": ["코드 분석", "개선 사항 제안", "리뷰 결과 정리"],
-            "QA": ["테스트 계획 수립", "테스트 실행", "결과 분석"],
-            "테스트케이스": ["테스트 시나리오 작성", "테스트 데이터 준비", "테스트 실행"],
-            "API": ["API 설계", "API 문서 작성", "API 테스트"],
-            "데이터베이스": ["DB 설계", "스키마 작성", "데이터 마이그레이션"],
-            "프론트엔드": ["UI 컴포넌트 개발", "사용자 인터페이스 구현", "반응형 디자인"],
-            "백엔드": ["서버 로직 구현", "API 개발", "데이터베이스 연동"],
-            "모바일": ["모바일 앱 개발", "앱 스토어 등록", "사용자 피드백 수집"],
-            "웹": ["웹사이트 개발", "SEO 최적화", "웹 접근성 개선"],
-            "앱": ["앱 기획", "앱 개발", "앱 스토어 등록"],
-            "UI/UX": ["사용자 인터페이스 설계", "사용자 경험 개선", "프로토타입 제작"],
-            "사용자경험": ["사용자 조사", "사용자 여정 맵 작성", "개선 방안 수립"],
-            "접근성": ["접근성 가이드라인 검토", "접근성 테스트", "개선 사항 적용"],
-            "성능": ["성능 분석", "병목 지점 파악", "성능 최적화"],
-            "확장성": ["확장성 분석", "아키텍처 개선", "부하 테스트"],
-            "유지보수": ["코드 리팩토링", "문서 업데이트", "버전 관리"]
-        }
+        # 순수 함수인 키워드 추출/태그 추천/감정 분석 결과를 인스턴스별로 캐시
+        # (모두 소문자로 변환한 내용을 키로 사용하므로 같은 내용의 분석끼리 키워드 추출을 공유)
+        self._keywords_cached = lru_cache(maxsize=_RESULT_CACHE_SIZE)(self._extract_keywords_lower)
+        self._recommend_tags_cached = lru_cache(maxsize=_RESULT_CACHE_SIZE)(self._recommend_tags)
+        self._analyze_sentiment_cached = lru_cache(maxsize=_RESULT_CACHE_SIZE)(self._analyze_sentiment)
 
     def extract_keywords(self, text: str) -> List[str]:
         """텍스트에서 키워드를 추출합니다."""
         if not text:
             return []
-        
-        # 간단한 키워드 추출 (한글 단어 + 영문 단어)
-        korean_keywords = re.findall(r'[가-힣]{2,}', text)
-        english_keywords = re.findall(r'\b[a-zA-Z]{2,}\b', text.lower())
+        return list(self._extract_keywords_lower(text.lower()))
+
+    def _extract_keywords_lower(self, text_lower: str) -> Tuple[str, ...]:
+        """소문자로 변환된 텍스트에서 키워드를 추출합니다. (한글은 소문자 변환의 영향을 받지 않음)"""
+        # 간단한 키워드 추출 (한글 단어 + 영문 단어, 정규식이 2글자 이상만 매칭)
+        korean_keywords = _KOREAN_WORD_RE.findall(text_lower)
+        english_keywords = _ENGLISH_WORD_RE.findall(text_lower)
         
         # 불용어 제거
-        stop_words = {'이', '가', '을', '를', '의', '에', '로', '으로', '와', '과', '도', '만', '은', '는', '이', '그', '저', '우리', '그것', '이것', '저것', '무엇', '어떤', '어떻게', '언제', '어디서', '왜', '어떻게', 'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
+        return tuple(
+            keyword for keyword in chain(korean_keywords, english_keywords)
+            if keyword not in _STOP_WORDS
+        )
+
+    def analyze(
+        self,
+        content: str,
+        existing_tags: Optional[List[str]] = None,
+        existing_todos: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        태그 추천, 할일 추천, 감정 분석을 한 번에 수행합니다.
         
-        keywords = []
-        for keyword in korean_keywords + english_keywords:
-            if len(keyword) > 1 and keyword not in stop_words:
-                keywords.append(keyword)
+        내용의 소문자 변환과 키워드 추출을 한 번만 수행하고 세 분석이 공유합니다.
+        """
+        if not content:
+            return {
+                "tags": [],
+                "todos": [],
+                "sentiment": self.analyze_content_sentiment(content)
+            }
         
-        return keywords
+        content_lower = content.lower()
+        sentiment, topics, confidence = self._analyze_sentiment_cached(content_lower)
+        return {
+            "tags": list(self._recommend_tags_cached(content_lower, frozenset(existing_tags or ()))),
+            "todos": self._recommend_todos(content_lower, existing_todos),
+            "sentiment": {"sentiment": sentiment, "topics": list(topics), "confidence": confidence}
+        }
 
     def recommend_tags(self, content: str, existing_tags: Optional[List[str]] = None) -> List[str]:
         """게시글 내용을 기반으로 태그를 추천합니다."""
         if not content:
             return []
         
+        # 기존 태그는 포함 여부만 사용하므로 순서와 무관한 frozenset을 캐시 키로 사용
+        return list(self._recommend_tags_cached(content.lower(), frozenset(existing_tags or ())))
+
+    def _recommend_tags(self, content_lower: str, existing_tags: FrozenSet[str]) -> Tuple[str, ...]:
+        """태그 추천 본체 (결과는 캐시되므로 불변 튜플로 반환)"""
         # 키워드 추출
-        keywords = self.extract_keywords(content)
+        keywords = self._keywords_cached(content_lower)
         
         # 간단한 키워드 매칭 기반 추천
         recommended_tags = []
-        existing_tags_list = existing_tags or []
+        # 이미 추천했거나 기존에 있는 태그 (멤버십 확인용 집합)
+        excluded_tags = set(existing_tags)
         
         # 1. 키워드 기반 추천
         for keyword in keywords:
-            for tag in self.common_tags:
-                if keyword in tag or tag in keyword:
-                    if tag not in recommended_tags and tag not in existing_tags_list:
-                        recommended_tags.append(tag)
-                        if len(recommended_tags) >= 5:
-                            break
+            for tag in _TAG_MATCHER.match(keyword):
+                if tag not in excluded_tags:
+                    recommended_tags.append(tag)
+                    excluded_tags.add(tag)
+                    if len(recommended_tags) >= 5:
+                        break
             if len(recommended_tags) >= 5:
                 break
         
         # 2. 내용 기반 추천
-        content_lower = content.lower()
-        for tag in self.common_tags:
-            if tag not in recommended_tags and tag not in existing_tags_list:
+        for tag in COMMON_TAGS:
+            if tag not in excluded_tags:
                 if any(word in content_lower for word in tag.split()):
                     recommended_tags.append(tag)
                     if len(recommended_tags) >= 8:
                         break
         
-        return recommended_tags[:8]  # 최대 8개 태그 추천
+        return tuple(recommended_tags[:8])  # 최대 8개 태그 추천
 
     def recommend_todos_from_planner(self, planner_description: str, existing_todos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """플래너 설명을 기반으로 할일을 추천합니다."""
         if not planner_description:
             return []
-        
+        return self._recommend_todos(planner_description.lower(), existing_todos)
+
+    def _recommend_todos(self, description_lower: str, existing_todos: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """할일 추천 본체 (소문자로 변환된 설명을 사용)"""
         # 키워드 추출
-        keywords = self.extract_keywords(planner_description)
+        keywords = self._keywords_cached(description_lower)
         
         recommended_todos = []
-        existing_todos_list = existing_todos or []
-        existing_todo_titles = [todo.lower() for todo in existing_todos_list]
-        added_todo_titles = set()  # 중복 방지를 위한 set
+        # 기존 할일과 이미 추천한 할일 제목 (중복 방지를 위한 set)
+        existing_todo_titles = {todo.lower() for todo in existing_todos or ()}
+        added_todo_titles = set()
         
         # 키워드 기반 할일 추천
         for keyword in keywords:
-            for category, todos in self.todo_keywords.items():
-                if keyword in category or category in keyword:
-                    for todo in todos:
-                        if todo.lower() not in existing_todo_titles and todo.lower() not in added_todo_titles:
-                            recommended_todos.append({
-                                "title": todo,
-                                "description": f"플래너 '{category}' 관련 작업",
-                                "priority": self._get_priority_for_todo(todo),
-                                "category": category
-                            })
-                            added_todo_titles.add(todo.lower())
-                            if len(recommended_todos) >= 10:
-                                break
-                    if len(recommended_todos) >= 10:
-                        break
+            for category in _CATEGORY_MATCHER.match(keyword):
+                for todo in TODO_KEYWORDS[category]:
+                    if todo.lower() not in existing_todo_titles and todo.lower() not in added_todo_titles:
+                        recommended_todos.append({
+                            "title": todo,
+                            "description": f"플래너 '{category}' 관련 작업",
+                            "priority": self._get_priority_for_todo(todo),
+                            "category": category
+                        })
+                        added_todo_titles.add(todo.lower())
+                        if len(recommended_todos) >= 10:
+                            break
+                if len(recommended_todos) >= 10:
+                    break
             if len(recommended_todos) >= 10:
                 break
         
         # 내용 분석 기반 추가 추천 (중복되지 않는 것만)
-        description_lower = planner_description.lower()
-        for category, todos in self.todo_keywords.items():
+        for category, todos in TODO_KEYWORDS.items():
             if category in description_lower:
                 for todo in todos:
                     if todo.lower() not in existing_todo_titles and todo.lower() not in added_todo_titles:
@@ -165,18 +274,13 @@ class AIService:
 
     def _get_priority_for_todo(self, todo_title: str) -> str:
         """할일 제목을 기반으로 우선순위를 추정합니다."""
-        high_priority_keywords = ["긴급", "중요", "핵심", "필수", "마감", "데드라인", "배포", "보안", "버그"]
-        medium_priority_keywords = ["개발", "구현", "테스트", "리뷰", "문서화", "분석"]
-        
         todo_lower = todo_title.lower()
         
-        for keyword in high_priority_keywords:
-            if keyword in todo_lower:
-                return "high"
+        if _HIGH_PRIORITY_RE.search(todo_lower):
+            return "high"
         
-        for keyword in medium_priority_keywords:
-            if keyword in todo_lower:
-                return "medium"
+        if _MEDIUM_PRIORITY_RE.search(todo_lower):
+            return "medium"
         
         return "low"
 
@@ -185,13 +289,18 @@ class AIService:
         if not content:
             return {"sentiment": "neutral", "topics": [], "confidence": 0.0}
         
-        # 간단한 감정 분석 (긍정/부정/중립 키워드 기반)
-        positive_words = ["성공", "완료", "완벽", "훌륭", "좋", "개선", "향상", "진전", "달성"]
-        negative_words = ["실패", "오류", "문제", "실패", "지연", "취소", "중단", "버그", "오류"]
-        
-        content_lower = content.lower()
-        positive_count = sum(1 for word in positive_words if word in content_lower)
-        negative_count = sum(1 for word in negative_words if word in content_lower)
+        sentiment, topics, confidence = self._analyze_sentiment_cached(content.lower())
+        return {
+            "sentiment": sentiment,
+            "topics": list(topics),
+            "confidence": confidence
+        }
+
+    def _analyze_sentiment(self, content_lower: str) -> Tuple[str, Tuple[str, ...], float]:
+        """감정 분석 본체 (결과는 캐시되므로 불변 튜플로 반환)"""
+        # 간단한 감정 분석 (긍정/부정/중립 키워드 기반, 등장한 서로 다른 키워드 수)
+        positive_count = len(set(_POSITIVE_WORD_RE.findall(content_lower)))
+        negative_count = len(set(_NEGATIVE_WORD_RE.findall(content_lower)))
         
         if positive_count > negative_count:
             sentiment = "positive"
@@ -201,13 +310,9 @@ class AIService:
             sentiment = "neutral"
         
         # 주제 추출
-        topics = self.extract_keywords(content)[:5]
+        topics = self._keywords_cached(content_lower)[:5]
         
-        return {
-            "sentiment": sentiment,
-            "topics": topics,
-            "confidence": min(1.0, (positive_count + negative_count) / 10.0)
-        }
+        return sentiment, topics, min(1.0, (positive_count + negative_count) / 10.0)
 
 # 전역 AI 서비스 인스턴스
 ai_service = AIService() 
\ No newline at end of file
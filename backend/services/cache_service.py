@@ -14,7 +14,10 @@
 
 """
 
-from typing import Any, Optional, Dict
+from collections import OrderedDict
+from typing import Any, Optional, Dict, List, Tuple
+import heapq
+import threading
 import time
 from core.config import settings
 
@@ -29,7 +32,7 @@ class CacheService:
     주요 특징:
     - TTL 기반 자동 만료
     - LRU 기반 캐시 크기 관리
-    - 스레드 안전하지 않음 (단일 프로세스 환경용)
+    - 스레드 안전 (동기 엔드포인트는 스레드 풀에서 실행되므로 잠금으로 보호, 단일 프로세스 환경용)
     - 메모리 기반 (Redis 대신)
     
     사용 예시:
@@ -44,10 +47,41 @@ class CacheService:
         
         설정 파일에서 캐시 관련 설정을 읽어와 초기화합니다.
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}  # 캐시 저장소
+        # 캐시 저장소: 키 -> (값, 만료 시각), 최근 사용한 항목이 뒤쪽에 위치 (LRU 순서)
+        # 만료 시각은 time.monotonic() 기준 (시스템 시계 변경의 영향을 받지 않음)
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        # (만료 시각, 키) 최소 힙 - 만료된 항목을 전체 스캔 없이 찾기 위해 사용
+        # 키를 다시 저장하면 이전 힙 항목은 그대로 남으며, 꺼낼 때 현재 만료 시각과 비교해 무시함
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # 저장소와 힙을 함께 갱신하는 작업이 스레드 간에 섞이지 않도록 보호하는 잠금
+        self._lock = threading.Lock()
         self._max_size = settings.cache_max_size  # 최대 캐시 크기
         self._ttl = settings.cache_ttl  # 기본 TTL (초)
 
+    def _get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """만료되지 않은 캐시 항목을 반환합니다. 만료된 항목은 제거합니다. (잠금을 보유한 상태에서 호출)"""
+        cache_item = self._cache.get(key)
+        if cache_item is not None and cache_item[1] < time.monotonic():
+            # 만료된 항목 제거
+            del self._cache[key]
+            return None
+        return cache_item
+
+    def _sweep_expired(self, now: float) -> None:
+        """만료 시각이 지난 항목을 힙 순서대로 제거합니다. (잠금을 보유한 상태에서 호출)"""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            cache_item = self._cache.get(key)
+            # 다시 저장된 키는 만료 시각이 달라지므로 최신 항목만 제거
+            if cache_item is not None and cache_item[1] == expires_at:
+                del self._cache[key]
+        
+        # 같은 키를 반복 저장해 쌓인 이전 힙 항목이 많아지면 현재 항목으로 재구성
+        if len(heap) > 2 * self._max_size:
+            self._expiry_heap = [(expires_at, key) for key, (_, expires_at) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+
     def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 값을 가져옵니다.
@@ -68,26 +102,21 @@ class CacheService:
             else:
                 print("캐시에 없음, 데이터베이스에서 조회 필요")
         """
-        if key not in self._cache:
-            return None
-        
-        cache_item = self._cache[key]
-        current_time = time.time()
-        
-        # TTL 만료 확인
-        if current_time - cache_item["timestamp"] > cache_item["ttl"]:
-            # 만료된 항목 제거
-            del self._cache[key]
-            return None
-        
-        return cache_item["value"]
+        with self._lock:
+            cache_item = self._get_entry(key)
+            if cache_item is None:
+                return None
+            
+            # 최근 사용 항목으로 이동 (LRU)
+            self._cache.move_to_end(key)
+            return cache_item[0]
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
         캐시에 값을 저장합니다.
         
         키-값 쌍을 캐시에 저장합니다. 캐시가 가득 찬 경우
-        가장 오래된 항목을 제거합니다 (LRU 방식).
+        가장 오래 사용되지 않은 항목을 제거합니다 (LRU 방식).
         
         Args:
             key (str): 캐시 키
@@ -98,19 +127,22 @@ class CacheService:
             cache_service.set("user:123", user_data, ttl=600)  # 10분
             cache_service.set("config:app", config_data)  # 기본 TTL 사용
         """
-        # 캐시 크기 제한 확인
-        if len(self._cache) >= self._max_size:
-            # 가장 오래된 항목 제거 (LRU)
-            oldest_key = min(self._cache.keys(), 
-                           key=lambda k: self._cache[k]["timestamp"])
-            del self._cache[oldest_key]
-        
-        # 새 항목 저장
-        self._cache[key] = {
-            "value": value,
-            "timestamp": time.time(),
-            "ttl": ttl or self._ttl  # 개별 TTL 또는 기본 TTL
-        }
+        with self._lock:
+            now = time.monotonic()
+            # 만료된 항목을 먼저 정리하여 빈 자리를 확보
+            self._sweep_expired(now)
+            
+            if key in self._cache:
+                # 기존 키 갱신은 크기가 늘지 않으므로 최근 사용 위치로만 이동
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self._max_size:
+                # 만료 정리로 자리가 나지 않은 경우에만 가장 오래 사용되지 않은 항목 제거 (LRU, O(1))
+                self._cache.popitem(last=False)
+            
+            # 만료 시각을 저장 시점에 한 번만 계산 (개별 TTL 또는 기본 TTL)
+            expires_at = now + (ttl or self._ttl)
+            self._cache[key] = (value, expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
 
     def delete(self, key: str) -> None:
         """
@@ -122,8 +154,8 @@ class CacheService:
         사용 예시:
             cache_service.delete("user:123")  # 특정 사용자 캐시 삭제
         """
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._cache.pop(key, None)
 
     def clear(self) -> None:
         """
@@ -135,7 +167,9 @@ class CacheService:
         사용 예시:
             cache_service.clear()  # 모든 캐시 삭제
         """
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
 
     def exists(self, key: str) -> bool:
         """
@@ -151,7 +185,8 @@ class CacheService:
             if cache_service.exists("user:123"):
                 print("사용자 정보가 캐시에 있습니다")
         """
-        return self.get(key) is not None
+        with self._lock:
+            return self._get_entry(key) is not None
 
     def get_stats(self) -> Dict[str, Any]:
         """
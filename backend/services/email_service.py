@@ -1,13 +1,193 @@
 import smtplib
 import asyncio
 import threading
+import time
+from email.message import Message
+from typing import Dict, Tuple
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from jinja2 import DictLoader, Environment
 from core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 이메일 HTML 템플릿 (모듈 로드 시 한 번만 컴파일, 사용자 입력 값은 자동 이스케이프)
+_VERIFY_HTML = """
+<html>
+<body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; color: white; text-align: center;">
+        <h1 style="margin: 0; font-size: 24px;">협업 플래너</h1>
+        <p style="margin: 10px 0; opacity: 0.9;">이메일 인증</p>
+    </div>
+
+    <div style="background: white; padding: 30px; border-radius: 10px; margin-top: 20px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+        <h2 style="color: #333; margin-bottom: 20px;">안녕하세요, {{ user_name }}님!</h2>
+
+        <p style="color: #666; line-height: 1.6; margin-bottom: 20px;">
+            협업 플래너 계정 인증을 위해 아래 인증 코드를 입력해주세요.
+        </p>
+
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; margin: 20px 0;">
+            <h3 style="color: #333; margin: 0 0 10px 0; font-size: 18px;">인증 코드</h3>
+            <div style="background: white; padding: 15px; border-radius: 6px; border: 2px solid #e9ecef;">
+                <span style="font-size: 24px; font-weight: bold; color: #667eea; letter-spacing: 3px;">{{ verification_code }}</span>
+            </div>
+        </div>
+
+        <p style="color: #666; font-size: 14px; margin-top: 20px;">
+            ⚠️ 이 인증 코드는 24시간 후에 만료됩니다.<br>
+            본인이 요청하지 않은 경우 이 이메일을 무시하셔도 됩니다.
+        </p>
+    </div>
+
+    <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
+        <p>© 2024 협업 플래너. All rights reserved.</p>
+    </div>
+</body>
+</html>
+"""
+
+_RESET_HTML = """
+<html>
+<body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; color: white; text-align: center;">
+        <h1 style="margin: 0; font-size: 24px;">협업 플래너</h1>
+        <p style="margin: 10px 0; opacity: 0.9;">비밀번호 재설정</p>
+    </div>
+
+    <div style="background: white; padding: 30px; border-radius: 10px; margin-top: 20px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+        <h2 style="color: #333; margin-bottom: 20px;">안녕하세요, {{ user_name }}님!</h2>
+
+        <p style="color: #666; line-height: 1.6; margin-bottom: 20px;">
+            비밀번호 재설정을 요청하셨습니다. 아래 버튼을 클릭하여 새로운 비밀번호를 설정하세요.
+        </p>
+
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{ reset_url }}" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px 30px; text-decoration: none; border-radius: 8px; font-weight: bold; display: inline-block;">
+                비밀번호 재설정
+            </a>
+        </div>
+
+        <p style="color: #666; font-size: 14px; margin-top: 20px;">
+            ⚠️ 이 링크는 1시간 후에 만료됩니다.<br>
+            본인이 요청하지 않은 경우 이 이메일을 무시하시고, 계정 보안을 위해 비밀번호를 변경하세요.
+        </p>
+    </div>
+
+    <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
+        <p>© 2024 협업 플래너. All rights reserved.</p>
+    </div>
+</body>
+</html>
+"""
+
+_TEMPLATE_ENV = Environment(
+    loader=DictLoader({"verify.html": _VERIFY_HTML, "reset.html": _RESET_HTML}),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+)
+_VERIFY_TEMPLATE = _TEMPLATE_ENV.get_template("verify.html")
+_RESET_TEMPLATE = _TEMPLATE_ENV.get_template("reset.html")
+
+# 하나의 SMTP 연결로 보낼 최대 메시지 수와 연결 유지 시간 (초과하면 새로 연결)
+_SMTP_MAX_MESSAGES = 10_000
+_SMTP_MAX_AGE_SECONDS = 300
+
+def _close_smtp(smtp: smtplib.SMTP) -> None:
+    """SMTP 연결을 종료합니다. (이미 끊긴 연결이면 소켓만 닫음)"""
+    try:
+        smtp.quit()
+    except Exception:
+        smtp.close()
+
+class _SmtpPool:
+    """
+    로그인된 SMTP 연결을 (서버, 포트, 사용자)별로 유지하며 재사용하는 풀
+    
+    메일마다 TCP 연결, STARTTLS, 로그인을 반복하지 않도록 유휴 연결을 보관합니다.
+    연결은 한 번에 하나의 발송에만 사용하며, 동시에 여러 발송이 있으면 추가 연결을 만들고
+    발송 후에는 키마다 하나의 유휴 연결만 남깁니다.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 키 -> (연결, 연결 시각(time.monotonic), 보낸 메시지 수)
+        self._idle: Dict[Tuple[str, int, str], Tuple[smtplib.SMTP, float, int]] = {}
+    
+    def _connect(self, server: str, port: int, username: str, password: str) -> Tuple[smtplib.SMTP, float, int]:
+        smtp = smtplib.SMTP(server, port)
+        try:
+            smtp.starttls()
+            smtp.login(username, password)
+        except Exception:
+            _close_smtp(smtp)
+            raise
+        return smtp, time.monotonic(), 0
+    
+    def _acquire(self, key: Tuple[str, int, str]):
+        """재사용 가능한 유휴 연결을 꺼냅니다. 없거나 교체 대상이면 None을 반환합니다."""
+        with self._lock:
+            entry = self._idle.pop(key, None)
+        if entry is None:
+            return None
+        smtp, connected_at, sent = entry
+        if sent >= _SMTP_MAX_MESSAGES or time.monotonic() - connected_at >= _SMTP_MAX_AGE_SECONDS:
+            _close_smtp(smtp)
+            return None
+        try:
+            # 이전 발송의 상태를 초기화하면서 연결이 살아 있는지 확인
+            smtp.rset()
+        except (smtplib.SMTPException, OSError):
+            _close_smtp(smtp)
+            return None
+        return entry
+    
+    def _release(self, key: Tuple[str, int, str], entry: Tuple[smtplib.SMTP, float, int]) -> None:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = entry
+                return
+        _close_smtp(entry[0])
+    
+    def send(self, server: str, port: int, username: str, password: str, msg: Message) -> None:
+        """풀의 연결로 메시지를 발송합니다. 재사용한 연결이 끊겨 있으면 한 번 다시 연결합니다."""
+        key = (server, port, username)
+        entry = self._acquire(key)
+        reused = entry is not None
+        if entry is None:
+            entry = self._connect(server, port, username, password)
+        
+        smtp, connected_at, sent = entry
+        try:
+            smtp.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            _close_smtp(smtp)
+            if not reused:
+                raise
+            smtp, connected_at, sent = self._connect(server, port, username, password)
+            try:
+                smtp.send_message(msg)
+            except Exception:
+                _close_smtp(smtp)
+                raise
+        except Exception:
+            _close_smtp(smtp)
+            raise
+        self._release(key, (smtp, connected_at, sent + 1))
+    
+    def close_all(self) -> None:
+        """유휴 연결을 모두 종료합니다. (애플리케이션 종료 시 호출)"""
+        with self._lock:
+            entries = list(self._idle.values())
+            self._idle.clear()
+        for smtp, _, _ in entries:
+            _close_smtp(smtp)
+
+# 전역 SMTP 연결 풀 (EmailService는 요청마다 생성되므로 풀은 모듈에서 공유)
+smtp_pool = _SmtpPool()
+
 class EmailService:
     def __init__(self):
         self.smtp_server = settings.smtp_server
@@ -24,46 +204,15 @@ class EmailService:
             self.smtp_password != "your-app-password"
         )
 
+    def _send(self, msg: Message) -> None:
+        """공유 SMTP 연결 풀을 통해 메시지를 발송합니다."""
+        smtp_pool.send(self.smtp_server, self.smtp_port, self.smtp_username, self.smtp_password, msg)
+
     def send_verification_email(self, to_email: str, verification_code: str, user_name: str) -> bool:
         """이메일 인증 코드 발송"""
         try:
             subject = "협업 플래너 - 이메일 인증"
             
-            html_content = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; color: white; text-align: center;">
-                    <h1 style="margin: 0; font-size: 24px;">협업 플래너</h1>
-                    <p style="margin: 10px 0; opacity: 0.9;">이메일 인증</p>
-                </div>
-                
-                <div style="background: white; padding: 30px; border-radius: 10px; margin-top: 20px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <h2 style="color: #333; margin-bottom: 20px;">안녕하세요, {user_name}님!</h2>
-                    
-                    <p style="color: #666; line-height: 1.6; margin-bottom: 20px;">
-                        협업 플래너 계정 인증을 위해 아래 인증 코드를 입력해주세요.
-                    </p>
-                    
-                    <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; margin: 20px 0;">
-                        <h3 style="color: #333; margin: 0 0 10px 0; font-size: 18px;">인증 코드</h3>
-                        <div style="background: white; padding: 15px; border-radius: 6px; border: 2px solid #e9ecef;">
-                            <span style="font-size: 24px; font-weight: bold; color: #667eea; letter-spacing: 3px;">{verification_code}</span>
-                        </div>
-                    </div>
-                    
-                    <p style="color: #666; font-size: 14px; margin-top: 20px;">
-                        ⚠️ 이 인증 코드는 24시간 후에 만료됩니다.<br>
-                        본인이 요청하지 않은 경우 이 이메일을 무시하셔도 됩니다.
-                    </p>
-                </div>
-                
-                <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                    <p>© 2024 협업 플래너. All rights reserved.</p>
-                </div>
-            </body>
-            </html>
-            """
-            
             # SMTP 설정이 완료되지 않았거나 개발 환경인 경우 콘솔에 출력
             if not self.smtp_configured or settings.environment == "development":
                 logger.info(f"=== 이메일 인증 코드 (개발 환경) ===")
@@ -76,6 +225,8 @@ class EmailService:
             
             # 실제 이메일 발송 (프로덕션 환경)
             try:
+                html_content = _VERIFY_TEMPLATE.render(user_name=user_name, verification_code=verification_code)
+                
                 msg = MIMEMultipart('alternative')
                 msg['Subject'] = subject
                 msg['From'] = self.from_email
@@ -84,10 +235,7 @@ class EmailService:
                 html_part = MIMEText(html_content, 'html')
                 msg.attach(html_part)
                 
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.starttls()
-                    server.login(self.smtp_username, self.smtp_password)
-                    server.send_message(msg)
+                self._send(msg)
                 
                 logger.info(f"인증 이메일 발송 완료: {to_email}")
                 return True
@@ -124,40 +272,6 @@ class EmailService:
             
             reset_url = f"{settings.frontend_url}/reset-password?token={reset_token}"
             
-            html_content = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px; color: white; text-align: center;">
-                    <h1 style="margin: 0; font-size: 24px;">협업 플래너</h1>
-                    <p style="margin: 10px 0; opacity: 0.9;">비밀번호 재설정</p>
-                </div>
-                
-                <div style="background: white; padding: 30px; border-radius: 10px; margin-top: 20px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <h2 style="color: #333; margin-bottom: 20px;">안녕하세요, {user_name}님!</h2>
-                    
-                    <p style="color: #666; line-height: 1.6; margin-bottom: 20px;">
-                        비밀번호 재설정을 요청하셨습니다. 아래 버튼을 클릭하여 새로운 비밀번호를 설정하세요.
-                    </p>
-                    
-                    <div style="text-align: center; margin: 30px 0;">
-                        <a href="{reset_url}" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px 30px; text-decoration: none; border-radius: 8px; font-weight: bold; display: inline-block;">
-                            비밀번호 재설정
-                        </a>
-                    </div>
-                    
-                    <p style="color: #666; font-size: 14px; margin-top: 20px;">
-                        ⚠️ 이 링크는 1시간 후에 만료됩니다.<br>
-                        본인이 요청하지 않은 경우 이 이메일을 무시하시고, 계정 보안을 위해 비밀번호를 변경하세요.
-                    </p>
-                </div>
-                
-                <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                    <p>© 2024 협업 플래너. All rights reserved.</p>
-                </div>
-            </body>
-            </html>
-            """
-            
             # 개발 환경에서는 콘솔에 출력
             if settings.environment == "development":
                 logger.info(f"=== 비밀번호 재설정 링크 (개발 환경) ===")
@@ -167,6 +281,8 @@ class EmailService:
                 return True
             
             # 실제 이메일 발송
+            html_content = _RESET_TEMPLATE.render(user_name=user_name, reset_url=reset_url)
+            
             msg = MIMEMultipart('alternative')
             msg['Subject'] = subject
             msg['From'] = self.from_email
@@ -175,10 +291,7 @@ class EmailService:
             html_part = MIMEText(html_content, 'html')
             msg.attach(html_part)
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            self._send(msg)
             
             logger.info(f"비밀번호 재설정 이메일 발송 완료: {to_email}")
             return True
@@ -30,7 +30,7 @@ class InviteService:
             
             # user_id가 없고 email이 있는 경우, 이메일로 사용자 찾기
             if user_id is None and email:
-                target_user = self.user_repo.get_by_email(email)
+                target_user = self.user_repo.get_summary_by_email(email)
                 if target_user:
                     user_id = getattr(target_user, 'id', None)
                     invite_data['user_id'] = user_id
@@ -180,10 +180,12 @@ class InviteService:
             if team_id is None:
                 raise ValueError("팀 ID가 없습니다.")
             
-            self.team_repo.add_member(team_id, int(current_user_id), 'editor')
-            
-            # 초대 삭제
-            success = self.invite_repo.delete(invite_id)
+            # 멤버 추가와 초대 삭제를 한 번의 커밋으로 처리
+            with self.team_repo.transaction():
+                self.team_repo.add_member(team_id, int(current_user_id), 'editor')
+                
+                # 초대 삭제
+                success = self.invite_repo.delete(invite_id)
             
             if success:
                 logger.info(f"초대 수락 성공: ID {invite_id}")
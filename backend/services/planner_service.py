@@ -142,7 +142,7 @@ class PlannerService:
             raise ValueError("권한이 없습니다.")
         
         update_data = {'status': status}
-        self.planner_repo.update(planner_id, update_data)
+        self.planner_repo.update_by_id(planner_id, update_data)
         
         return {
             "message": f"플래너 상태가 '{status}'로 변경되었습니다."
@@ -16,14 +16,15 @@ class TeamService:
     
     def create_team(self, team_data: Dict[str, Any], current_user: User) -> Team:
         """새로운 팀을 생성합니다."""
-        # 팀 생성
-        team = self.team_repo.create(team_data)
-        
-        # 생성자를 팀 멤버로 추가 (OWNER 역할)
-        team_id = getattr(team, 'id', None)
-        user_id = getattr(current_user, 'id', None)
-        if team_id is not None and user_id is not None:
-            self.team_repo.add_member(int(team_id), int(user_id), "owner")
+        # 팀 생성과 생성자 멤버 추가를 한 번의 커밋으로 처리
+        with self.team_repo.transaction():
+            team = self.team_repo.create(team_data)
+            
+            # 생성자를 팀 멤버로 추가 (OWNER 역할)
+            team_id = getattr(team, 'id', None)
+            user_id = getattr(current_user, 'id', None)
+            if team_id is not None and user_id is not None:
+                self.team_repo.add_member(int(team_id), int(user_id), "owner")
         
         return team
     
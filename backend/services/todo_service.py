@@ -257,16 +257,9 @@ class TodoService:
             # 권한 검증 (담당자 또는 작성자만 토글 가능)
             self._validate_todo_permissions(todo, current_user, "update")
             
-            # 완료 상태 토글
-            current_status = bool(getattr(todo, 'is_completed', False))
-            new_status = not current_status
-            
-            update_data = {
-                'is_completed': new_status,
-                'status': '완료' if new_status else '진행중'
-            }
-            
-            self.todo_repo.update(todo_id, update_data)
+            # 완료 상태 토글 (DB에서 원자적으로 처리)
+            toggled = self.todo_repo.toggle_completion(todo_id)
+            new_status = bool(getattr(toggled, 'is_completed', False))
             
             status_text = '완료' if new_status else '미완료'
             logger.info(f"할일 {todo_id} 상태 변경: {status_text} (변경자: {current_user.name})")
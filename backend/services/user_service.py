@@ -18,6 +18,7 @@ Repository 패턴을 사용하여 데이터 접근 계층과 분리되어 있으
 
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from repositories.user_repository import UserRepository
 from repositories.team_repository import TeamRepository
@@ -271,6 +272,22 @@ class UserService:
             structured_logger.error("사용자 조회 실패", email=email, error_message=str(e))
             raise InternalServerError("사용자 조회 중 오류가 발생했습니다")
     
+    def get_user_summary_by_email(self, email: str) -> Row:
+        """이메일로 사용자 요약(id, name, email, created_at, updated_at)을 조회합니다."""
+        try:
+            summary = self.user_repo.get_summary_by_email(email)
+            if not summary:
+                raise UserNotFoundError()
+            return summary
+        except UserNotFoundError:
+            raise
+        except SQLAlchemyError as e:
+            structured_logger.error("데이터베이스 오류", error_message=str(e))
+            raise InternalServerError("사용자 조회 중 데이터베이스 오류가 발생했습니다")
+        except Exception as e:
+            structured_logger.error("사용자 조회 실패", email=email, error_message=str(e))
+            raise InternalServerError("사용자 조회 중 오류가 발생했습니다")
+    
     def get_all_users(self) -> List[User]:
         """모든 사용자를 조회합니다."""
         try:
@@ -45,7 +45,7 @@ def engine(test_db_url):
 @pytest.fixture
 def db_session(engine):
     """테스트용 데이터베이스 세션"""
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
     session = TestingSessionLocal()
     try:
         yield session
@@ -91,6 +91,20 @@ def test_user(db_session, test_user_data):
     db_session.refresh(user)
     return user
 
+@pytest.fixture
+def other_user(db_session):
+    """두 번째 테스트 사용자 생성 (팀 멤버/팀 외부 사용자용)"""
+    unique_id = str(uuid.uuid4())[:8]
+    user = User(
+        name=f"다른 사용자 {unique_id}",
+        email=f"other{unique_id}@example.com",
+        password=get_password_hash("TestPassword123")
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
 @pytest.fixture
 def test_team_data():
     """테스트 팀 데이터"""
@@ -0,0 +1,72 @@
+from services.ai_service import AIService
+
+ai = AIService()
+
+class TestExtractKeywords:
+    def test_korean_then_english_without_stop_words(self):
+        keywords = ai.extract_keywords("우리 회의에서 API 배포를 논의 The plan for release")
+        assert keywords == ["회의에서", "배포를", "논의", "api", "plan", "release"]
+
+    def test_empty_text(self):
+        assert ai.extract_keywords("") == []
+
+class TestRecommendTags:
+    def test_matches_keyword_inside_tag_and_tag_inside_keyword(self):
+        # "프론트" 는 "프론트엔드" 의 부분 문자열, "개발"/"웹" 은 "웹개발" 안에 포함 (태그 목록 순서 유지)
+        tags = ai.recommend_tags("프론트 웹개발")
+        assert tags[:3] == ["프론트엔드", "개발", "웹"]
+
+    def test_skips_existing_tags(self):
+        tags = ai.recommend_tags("프론트 웹개발", existing_tags=["프론트엔드"])
+        assert "프론트엔드" not in tags
+        assert "웹" in tags
+
+class TestPriorityForTodo:
+    def test_high_keyword_wins_over_medium(self):
+        assert ai._get_priority_for_todo("보안 테스트") == "high"
+
+    def test_medium_and_low(self):
+        assert ai._get_priority_for_todo("API 개발") == "medium"
+        assert ai._get_priority_for_todo("회의록 정리") == "low"
+
+class TestResultCache:
+    def test_recommend_tags_cached_per_content_and_existing_tags(self):
+        service = AIService()
+        first = service.recommend_tags("배포 일정 회의", ["회의"])
+        first.append("mutated")
+        assert service.recommend_tags("배포 일정 회의", ["회의"]) == first[:-1]
+        assert service._recommend_tags_cached.cache_info().hits == 1
+
+    def test_sentiment_returns_fresh_dict_from_cache(self):
+        service = AIService()
+        first = service.analyze_content_sentiment("배포 성공")
+        first["topics"].clear()
+        second = service.analyze_content_sentiment("배포 성공")
+        assert second == {"sentiment": "positive", "topics": ["배포", "성공"], "confidence": 0.1}
+        assert service._analyze_sentiment_cached.cache_info().hits == 1
+
+class TestAnalyze:
+    def test_matches_individual_methods_and_shares_keyword_extraction(self):
+        service = AIService()
+        content = "API 개발 배포 일정 회의 성공"
+        result = service.analyze(content, existing_tags=["회의"], existing_todos=["코드 작성"])
+        assert result == {
+            "tags": ai.recommend_tags(content, ["회의"]),
+            "todos": ai.recommend_todos_from_planner(content, ["코드 작성"]),
+            "sentiment": ai.analyze_content_sentiment(content),
+        }
+        assert service._keywords_cached.cache_info().misses == 1
+
+    def test_empty_content(self):
+        assert ai.analyze("") == {
+            "tags": [], "todos": [], "sentiment": {"sentiment": "neutral", "topics": [], "confidence": 0.0}
+        }
+
+class TestSentiment:
+    def test_each_sentiment_word_counted_once(self):
+        result = ai.analyze_content_sentiment("배포 실패 오류 오류 실패")
+        assert result["sentiment"] == "negative"
+        assert result["confidence"] == 0.2
+
+    def test_neutral_when_balanced(self):
+        assert ai.analyze_content_sentiment("개선 후에도 지연")["sentiment"] == "neutral"
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from services import cache_service as cache_module
+from services.cache_service import CacheService
+
+@pytest.fixture
+def cache(monkeypatch):
+    """최대 3개, 기본 TTL 60초인 캐시"""
+    monkeypatch.setattr(cache_module.settings, "cache_max_size", 3)
+    monkeypatch.setattr(cache_module.settings, "cache_ttl", 60)
+    return CacheService()
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic()을 고정하고 테스트에서 직접 조정할 수 있는 시계"""
+    state = {"now": 1_000.0}
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: state["now"])
+    return state
+
+class TestLru:
+    def test_evicts_least_recently_used(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+        cache.set("d", 4)
+        assert cache.get("b") is None
+        assert [cache.get(k) for k in ("a", "c", "d")] == [1, 3, 4]
+
+    def test_resetting_existing_key_does_not_evict(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.set("a", 10)
+        assert cache.get_stats()["size"] == 3
+        assert [cache.get(k) for k in ("a", "b", "c")] == [10, 2, 3]
+
+class TestTtl:
+    def test_expired_entry_is_removed(self, cache, clock):
+        cache.set("a", 1, ttl=10)
+        clock["now"] += 5
+        assert cache.get("a") == 1
+        clock["now"] += 6
+        assert cache.get("a") is None
+        assert cache.exists("a") is False
+        assert cache.get_stats()["size"] == 0
+
+    def test_exists_sees_cached_none(self, cache):
+        cache.set("a", None)
+        assert cache.exists("a") is True
+        assert cache.exists("missing") is False
+
+    def test_set_sweeps_expired_before_lru_eviction(self, cache, clock):
+        cache.set("short", 1, ttl=5)
+        cache.set("a", 2)
+        cache.set("b", 3)
+        clock["now"] += 10
+        cache.set("c", 4)
+        # 만료된 short만 제거되고 살아 있는 LRU 항목 a는 유지됨
+        assert cache.get_stats()["size"] == 3
+        assert [cache.get(k) for k in ("a", "b", "c")] == [2, 3, 4]
+
+    def test_reset_key_is_not_swept_by_stale_heap_entry(self, cache, clock):
+        cache.set("a", 1, ttl=5)
+        cache.set("a", 2, ttl=100)
+        clock["now"] += 10
+        cache.set("b", 3)
+        assert cache.get("a") == 2
+
+class TestThreadSafety:
+    def test_concurrent_sets_keep_size_bounded(self, cache):
+        def worker(prefix):
+            for i in range(500):
+                cache.set(f"{prefix}:{i}", i)
+                cache.get(f"{prefix}:{i - 1}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cache.get_stats()["size"] <= 3
+        assert len(cache._expiry_heap) <= 2 * 3 + 1
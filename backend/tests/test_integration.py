@@ -455,4 +455,76 @@ class TestPerformance:
             response = authenticated_client.get(f"/api/v1/search/?q={query}")
             assert response.status_code == 200
             data = response.json()
-            assert "results" in data 
\ No newline at end of file
+            assert "results" in data 
+
+class TestGetDbReadTransaction:
+    """실제 get_db 의존성의 읽기 트랜잭션 처리 테스트"""
+    
+    @pytest.fixture
+    def app_with_real_get_db(self, tmp_path, monkeypatch):
+        """임시 파일 DB에 연결한 SessionLocal로 실제 get_db를 사용하는 앱"""
+        from fastapi import Depends, FastAPI
+        from sqlalchemy import create_engine, event, text
+        from sqlalchemy.orm import sessionmaker
+        import database
+        
+        engine = create_engine(f"sqlite:///{tmp_path / 'get_db.db'}", connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", database._set_sqlite_pragmas)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        
+        events = []
+        event.listen(engine, "commit", lambda conn: events.append("commit"))
+        event.listen(engine, "rollback", lambda conn: events.append("rollback"))
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+        
+        app = FastAPI()
+        state = {}
+        
+        @app.get("/items")
+        def list_items(db: Session = Depends(database.get_db)):
+            state["db"] = db
+            state["dbapi"] = db.connection().connection.dbapi_connection
+            return {"count": db.execute(text("SELECT COUNT(*) FROM items")).scalar()}
+        
+        @app.get("/items/touch")
+        def touch_item(db: Session = Depends(database.get_db)):
+            state["db"] = db
+            state["dbapi"] = db.connection().connection.dbapi_connection
+            db.execute(text("INSERT INTO items (name) VALUES ('touched')"))
+            db.commit()
+            db.execute(text("INSERT INTO items (name) VALUES ('after commit')"))
+            db.commit()
+            return {"count": db.execute(text("SELECT COUNT(*) FROM items")).scalar()}
+        
+        yield TestClient(app), engine, events, state
+        engine.dispose()
+    
+    def test_get_rolls_back_and_closes_session(self, app_with_real_get_db):
+        """GET 요청의 읽기 트랜잭션은 응답 후 롤백되고 세션이 닫힘"""
+        client, engine, events, state = app_with_real_get_db
+        
+        response = client.get("/items")
+        assert response.status_code == 200
+        assert response.json() == {"count": 0}
+        
+        assert events == ["rollback"]
+        assert not state["db"].in_transaction()
+        assert not state["dbapi"].in_transaction
+        assert engine.pool.checkedout() == 0
+    
+    def test_get_handler_that_commits(self, app_with_real_get_db):
+        """GET 핸들러에서 커밋해도 중첩 BEGIN 오류 없이 커밋되고 세션이 닫힘"""
+        client, engine, events, state = app_with_real_get_db
+        
+        response = client.get("/items/touch")
+        assert response.status_code == 200
+        assert response.json() == {"count": 2}
+        
+        assert events == ["commit", "commit", "rollback"]
+        assert not state["db"].in_transaction()
+        assert not state["dbapi"].in_transaction
+        assert engine.pool.checkedout() == 0
+        
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("SELECT COUNT(*) FROM items").scalar() == 2
@@ -18,6 +18,7 @@ from models.post import Post
 from models.reply import Reply
 from models.invite import Invite
 from core.security import get_password_hash
+from services.activity_service import ActivityService
 
 class TestUserRepository:
     def test_create_user(self, db_session: Session):
@@ -94,5 +95,311 @@ class TestUserRepository:
         found_user = repo.get_by_id(int(user_id))
         assert found_user is None
 
+    def test_update_by_id_and_returning(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        user = repo.create({
+            "name": f"테스트 사용자 {unique_id}",
+            "email": f"test{unique_id}@example.com",
+            "password": get_password_hash("TestPassword123")
+        })
+        assert repo.update_by_id(user.id, {"name": "단일 UPDATE", "unknown": 1}) is True
+        assert repo.get_by_id(user.id).name == "단일 UPDATE"
+        updated = repo.update_returning(user.id, {"name": "RETURNING"})
+        assert updated is not None and updated.name == "RETURNING"
+        assert repo.update_by_id(-1, {"name": "없음"}) is False
+        assert repo.update_returning(-1, {"name": "없음"}) is None
+
+    def test_verify_email(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        user = repo.create({
+            "name": f"테스트 사용자 {unique_id}",
+            "email": f"test{unique_id}@example.com",
+            "password": get_password_hash("TestPassword123")
+        })
+        assert repo.verify_email(user.id) is True
+        assert repo.get_by_id(user.id).is_email_verified is True
+        assert repo.verify_email(-1) is False
+
+    def test_transaction_commits_once(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        with repo.transaction():
+            users = [
+                repo.create({
+                    "name": f"트랜잭션 사용자 {i} {unique_id}",
+                    "email": f"tx{i}_{unique_id}@example.com",
+                    "password": get_password_hash("TestPassword123")
+                })
+                for i in range(3)
+            ]
+            # flush로 ID는 채워지지만 아직 커밋되지 않음
+            assert all(u.id is not None for u in users)
+            assert db_session.in_transaction()
+        assert all(repo.exists(u.id) for u in users)
+
+    def test_transaction_rolls_back_on_error(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        email = f"rollback{unique_id}@example.com"
+        with pytest.raises(RuntimeError):
+            with repo.transaction():
+                repo.create({
+                    "name": f"롤백 사용자 {unique_id}",
+                    "email": email,
+                    "password": get_password_hash("TestPassword123")
+                })
+                raise RuntimeError("중단")
+        assert repo.get_by_email(email) is None
+
+    def test_transaction_covers_other_repositories_and_services(self, db_session: Session, test_user):
+        repo = UserRepository(db_session)
+        team_repo = TeamRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        with pytest.raises(RuntimeError):
+            with repo.transaction():
+                team = team_repo.create({"name": f"세션 트랜잭션 팀 {unique_id}"})
+                ActivityService(db_session).log_activity(
+                    test_user.id, "create", "team", f"세션 트랜잭션 {unique_id}", resource_id=team.id
+                )
+                raise RuntimeError("중단")
+        # 같은 세션의 다른 Repository/Service 쓰기도 블록 중간에 커밋되지 않고 함께 롤백
+        assert team_repo.get(team.id) is None
+        assert ActivityService(db_session).get_team_activities(team.id) == []
+
+    def test_get_by_email_is_not_cached(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        email = f"auth{unique_id}@example.com"
+        user = repo.create({
+            "name": f"인증 사용자 {unique_id}",
+            "email": email,
+            "password": get_password_hash("TestPassword123")
+        })
+        repo.get_summary_by_email(email)  # 요약 캐시 적재
+
+        # 로그인에 쓰이는 조회는 다른 세션(워커)의 비밀번호 변경을 바로 반영
+        other_session = Session(bind=db_session.get_bind())
+        try:
+            other_session.query(User).filter(User.id == user.id).update({"password": "changed"})
+            other_session.commit()
+        finally:
+            other_session.close()
+        db_session.expire_all()
+        assert repo.get_by_email(email).password == "changed"
+
+    def test_get_summary_by_email_cache(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        email = f"cache{unique_id}@example.com"
+        user = repo.create({
+            "name": f"캐시 사용자 {unique_id}",
+            "email": email,
+            "password": get_password_hash("TestPassword123")
+        })
+        summary = repo.get_summary_by_email(email)
+        assert summary.id == user.id
+        assert "password" not in summary._fields
+
+        # 캐시 적중: 같은 요약 행을 재사용
+        assert repo.get_summary_by_email(email) is summary
+
+        # 트랜잭션 안의 변경은 커밋된 뒤에만 캐시를 무효화
+        with repo.transaction():
+            repo.update(user.id, {"name": "이름 변경"})
+            assert repo.get_summary_by_email(email) is summary
+        assert repo.get_summary_by_email(email).name == "이름 변경"
+
+        # 롤백된 변경은 캐시를 무효화하지 않음
+        summary = repo.get_summary_by_email(email)
+        with pytest.raises(RuntimeError):
+            with repo.transaction():
+                repo.update_by_id(user.id, {"name": "롤백될 이름"})
+                raise RuntimeError("중단")
+        assert repo.get_summary_by_email(email) is summary
+
+        # 단일 UPDATE/DELETE 문 경로도 커밋 후 무효화
+        repo.update_by_id(user.id, {"name": "다시 변경"})
+        assert repo.get_summary_by_email(email).name == "다시 변경"
+        repo.delete_by_id(user.id)
+        assert repo.get_summary_by_email(email) is None
+
+    def test_iter_all_streams_every_row(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        repo.bulk_create([
+            {
+                "name": f"스트리밍 사용자 {i} {unique_id}",
+                "email": f"stream{i}_{unique_id}@example.com",
+                "password": "hashed"
+            }
+            for i in range(5)
+        ])
+        streamed = [u.id for u in repo.iter_all(chunk_size=2)]
+        assert streamed == sorted(u.id for u in repo.get_all())
+
+    def test_exists(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        user = repo.create({
+            "name": f"테스트 사용자 {unique_id}",
+            "email": f"test{unique_id}@example.com",
+            "password": get_password_hash("TestPassword123")
+        })
+        assert repo.exists(user.id) is True
+        assert repo.exists(-1) is False
+
+    def test_bulk_create_users(self, db_session: Session):
+        repo = UserRepository(db_session)
+        unique_id = str(uuid.uuid4())[:8]
+        hashed = get_password_hash("TestPassword123")
+        users_data = [
+            {
+                "name": f"벌크 사용자 {i} {unique_id}",
+                "email": f"bulk{i}_{unique_id}@example.com",
+                "password": hashed
+            }
+            for i in range(3)
+        ]
+        users = repo.bulk_create(users_data)
+        assert len(users) == 3
+        assert [getattr(u, 'email', None) for u in users] == [d["email"] for d in users_data]
+        assert all(getattr(u, 'id', None) is not None for u in users)
+        assert repo.bulk_create([]) == []
+
+class TestTeamRepository:
+    def test_delete_team_with_members(self, db_session: Session, test_team, other_user):
+        repo = TeamRepository(db_session)
+        repo.add_member(test_team.id, other_user.id)
+
+        assert repo.delete(test_team.id) is True
+        assert repo.get_by_id(test_team.id) is None
+        assert repo.get_members(test_team.id) == []
+        assert repo.delete(test_team.id) is False
+
+    def test_member_role_and_removal(self, db_session: Session, test_team, other_user):
+        repo = TeamRepository(db_session)
+        repo.add_member(test_team.id, other_user.id)
+
+        assert repo.update_member_role(test_team.id, other_user.id, "admin") is True
+        assert repo.get_member(test_team.id, other_user.id).role == "admin"
+        assert repo.remove_member(test_team.id, other_user.id) is True
+        assert repo.get_member(test_team.id, other_user.id) is None
+        assert repo.remove_member(test_team.id, other_user.id) is False
+        assert repo.update_member_role(test_team.id, other_user.id, "editor") is False
+
+    def test_delete_team_members(self, db_session: Session, test_team):
+        repo = TeamRepository(db_session)
+
+        assert repo.delete_team_members(test_team.id) is True
+        assert repo.get_members(test_team.id) == []
+        assert repo.get_by_id(test_team.id) is not None
+
+    def test_member_writes_commit_once_inside_transaction(self, db_session: Session, test_user, test_team, other_user):
+        repo = TeamRepository(db_session)
+        repo.add_member(test_team.id, other_user.id)
+
+        with pytest.raises(RuntimeError):
+            with repo.transaction():
+                assert repo.update_member_role(test_team.id, other_user.id, "admin") is True
+                assert repo.remove_member(test_team.id, test_user.id) is True
+                assert repo.delete(test_team.id) is True
+                raise RuntimeError("중단")
+        # 블록 중간에 커밋되지 않았으므로 모두 롤백
+        assert repo.get_by_id(test_team.id) is not None
+        assert repo.get_member(test_team.id, test_user.id) is not None
+        assert repo.get_member(test_team.id, other_user.id).role == "editor"
+
+class TestUserTeamsQueries:
+    def test_get_by_user_teams(self, db_session: Session, test_user, test_planner, other_user):
+        other_team = TeamRepository(db_session).create({"name": "다른 팀", "owner_id": other_user.id})
+        TeamRepository(db_session).add_member(other_team.id, other_user.id, role="owner")
+
+        planner_repo = PlannerRepository(db_session)
+        other_planner = planner_repo.create({"title": "다른 플래너", "team_id": other_team.id, "created_by": other_user.id})
+        todo_repo = TodoRepository(db_session)
+        my_todo = todo_repo.create({"title": "내 할일", "planner_id": test_planner.id, "created_by": test_user.id})
+        todo_repo.create({"title": "다른 할일", "planner_id": other_planner.id, "created_by": other_user.id})
+
+        assert [p.id for p in planner_repo.get_by_user_teams(test_user.id)] == [test_planner.id]
+        assert [t.id for t in todo_repo.get_by_user_teams(test_user.id)] == [my_todo.id]
+
+class TestTodoPagination:
+    def test_cursor_pagination_matches_offset(self, db_session: Session, test_user, test_planner):
+        repo = TodoRepository(db_session)
+        for i in range(5):
+            repo.create({"title": f"할일 {i}", "planner_id": test_planner.id, "created_by": test_user.id})
+
+        total = repo.count()
+        expected = [t.id for t in repo.get_todos_with_pagination(per_page=total, sort_by='id')['todos']]
+
+        seen = []
+        cursor = None
+        while True:
+            result = repo.get_todos_with_pagination(per_page=2, sort_by='id', cursor=cursor)
+            seen.extend(t.id for t in result['todos'])
+            cursor = result['next_cursor']
+            if cursor is None:
+                break
+        assert seen == expected
+
+    def test_toggle_completion(self, db_session: Session, test_user, test_planner):
+        repo = TodoRepository(db_session)
+        todo = repo.create({"title": "토글 할일", "planner_id": test_planner.id, "created_by": test_user.id})
+
+        toggled = repo.toggle_completion(todo.id)
+        assert toggled.is_completed is True and toggled.status == "완료"
+        toggled = repo.toggle_completion(todo.id)
+        assert toggled.is_completed is False and toggled.status == "진행중"
+        assert repo.get_by_id(todo.id).is_completed is False
+        assert repo.toggle_completion(-1) is None
+
+    def test_list_summaries(self, db_session: Session, test_user, test_team, test_planner):
+        todo = TodoRepository(db_session).create({"title": "요약 할일", "planner_id": test_planner.id, "created_by": test_user.id})
+        post = PostRepository(db_session).create({"title": "요약 게시글", "content": "본문", "author_id": test_user.id, "team_id": test_team.id})
+
+        [todo_row] = TodoRepository(db_session).list_summaries(test_planner.id)
+        assert (todo_row.id, todo_row.title, todo_row.is_completed) == (todo.id, "요약 할일", False)
+        [post_row] = PostRepository(db_session).list_summaries(test_team.id)
+        assert (post_row.id, post_row.title, post_row.author_id) == (post.id, "요약 게시글", test_user.id)
+
+    def test_offset_pages_accept_nullable_sort_columns(self, db_session: Session, test_user, test_planner):
+        repo = TodoRepository(db_session)
+        todo = repo.create({"title": "정렬 할일", "planner_id": test_planner.id, "created_by": test_user.id})
+        result = repo.get_todos_with_pagination(per_page=1, sort_by='priority')
+        assert len(result['todos']) == 1
+        assert result['next_cursor'] is None  # NULL 가능 컬럼은 키셋 커서를 발급하지 않음
+
+        # 키셋 비교는 NULL에서 깨지므로 커서 요청에서만 정렬 기준을 제한
+        with pytest.raises(ValueError):
+            repo.get_todos_with_pagination(sort_by='priority', cursor=("보통", todo.id))
+
+class TestSearch:
+    def test_search_posts_and_replies(self, db_session: Session, test_user, test_team):
+        user, team = test_user, test_team
+        post_repo = PostRepository(db_session)
+        post = post_repo.create({"title": "주간 Planning 회의록", "content": "스프린트 회고", "author_id": user.id, "team_id": team.id})
+        post_repo.create({"title": "점심 메뉴", "content": "김치찌개", "author_id": user.id, "team_id": team.id})
+        reply_repo = ReplyRepository(db_session)
+        reply = reply_repo.create({"content": "회고 내용 공유드립니다", "author_id": user.id, "post_id": post.id})
+
+        # 3글자 이상: FTS 인덱스 (대소문자 무시 부분 일치)
+        assert [p.id for p in post_repo.search_posts("planning", [team.id])] == [post.id]
+        assert [p.id for p in post_repo.search_posts("스프린트", [team.id])] == [post.id]
+        assert [r.id for r in reply_repo.search_replies("내용 공유", [post.id])] == [reply.id]
+        # 3글자 미만: ILIKE
+        assert [p.id for p in post_repo.search_posts("회의", [team.id])] == [post.id]
+
+    def test_search_reflects_updates_and_deletes(self, db_session: Session, test_user, test_team):
+        user, team = test_user, test_team
+        post_repo = PostRepository(db_session)
+        post = post_repo.create({"title": "원래 제목입니다", "content": "본문", "author_id": user.id, "team_id": team.id})
+        post_repo.update(post.id, {"title": "변경된 제목입니다"})
+        assert post_repo.search_posts("원래 제목", [team.id]) == []
+        assert [p.id for p in post_repo.search_posts("변경된 제목", [team.id])] == [post.id]
+        post_repo.delete(post.id)
+        assert post_repo.search_posts("변경된 제목", [team.id]) == []
+
 # 이하 Team/Planner/Todo/Post/Reply/InviteRepository 테스트도 동일하게 id None 체크 후 int 변환, 
 # repo에 없는 메서드는 pytest.skip() 처리 또는 주석 처리 
\ No newline at end of file
@@ -0,0 +1,157 @@
+import pytest
+from fastapi import Request
+from middleware import security_middleware
+from middleware.security_middleware import SecurityMiddleware, CSRF_SESSION_COOKIE
+
+WINDOW = 60 * 1_000_000_000
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic_ns()를 고정하고 테스트에서 직접 조정할 수 있는 시계"""
+    state = {"now": 1_000 * WINDOW}
+    monkeypatch.setattr(security_middleware.time, "monotonic_ns", lambda: state["now"])
+    return state
+
+def _limited_middleware(max_requests: int) -> SecurityMiddleware:
+    middleware = SecurityMiddleware(None)
+    middleware.max_requests = max_requests
+    return middleware
+
+class TestRateLimit:
+    def test_rejects_after_max_requests(self, clock):
+        middleware = _limited_middleware(3)
+        results = [middleware._check_rate_limit("10.0.0.1") for _ in range(4)]
+        assert results == [True, True, True, False]
+
+    def test_limits_are_per_ip(self, clock):
+        middleware = _limited_middleware(1)
+        assert middleware._check_rate_limit("10.0.0.1")
+        assert not middleware._check_rate_limit("10.0.0.1")
+        assert middleware._check_rate_limit("10.0.0.2")
+
+    def test_previous_window_is_weighted(self, clock):
+        middleware = _limited_middleware(4)
+        for _ in range(4):
+            assert middleware._check_rate_limit("10.0.0.1")
+        # 다음 윈도우의 1/4 지점: 이전 4건 * 0.75 = 3건으로 추정되어 1건만 허용
+        clock["now"] += WINDOW + WINDOW // 4
+        assert middleware._check_rate_limit("10.0.0.1")
+        assert not middleware._check_rate_limit("10.0.0.1")
+
+    def test_idle_ips_are_dropped_after_two_windows(self, clock):
+        middleware = _limited_middleware(3)
+        middleware._check_rate_limit("10.0.0.1")
+        shard = middleware._get_shard("10.0.0.1")
+        clock["now"] += WINDOW
+        assert middleware.cleanup_expired() == 0
+        assert "10.0.0.1" in shard.prev
+        clock["now"] += WINDOW
+        assert middleware.cleanup_expired() == 1
+        assert "10.0.0.1" not in shard.prev and "10.0.0.1" not in shard.curr
+
+    def test_ips_are_spread_across_shards(self, clock):
+        middleware = _limited_middleware(3)
+        for i in range(64):
+            middleware._check_rate_limit(f"10.0.0.{i}")
+        assert sum(len(shard.curr) for shard in middleware._shards) == 64
+        assert sum(1 for shard in middleware._shards if shard.curr) > 1
+
+def _request(headers: dict) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "POST", "path": "/form", "headers": raw_headers})
+
+def _headers(headers: dict) -> dict:
+    return {name.lower().encode(): value.encode() for name, value in headers.items()}
+
+class TestCsrf:
+    def test_valid_token_for_session(self):
+        middleware = SecurityMiddleware(None)
+        token = middleware.generate_csrf_token("abc")
+        headers = _headers({"X-CSRF-Token": token, "Cookie": f"{CSRF_SESSION_COOKIE}=abc"})
+        assert middleware._validate_csrf_token(headers, is_api_request=False)
+
+    @pytest.mark.parametrize("headers", [
+        {},
+        {"X-CSRF-Token": "x" * 64},
+        {"X-CSRF-Token": "x" * 64, "Cookie": f"{CSRF_SESSION_COOKIE}=abc"},
+    ])
+    def test_invalid_token(self, headers):
+        middleware = SecurityMiddleware(None)
+        assert not middleware._validate_csrf_token(_headers(headers), is_api_request=False)
+
+    def test_token_bound_to_session(self):
+        middleware = SecurityMiddleware(None)
+        token = middleware.generate_csrf_token("other")
+        headers = _headers({"X-CSRF-Token": token, "Cookie": f"{CSRF_SESSION_COOKIE}=abc"})
+        assert not middleware._validate_csrf_token(headers, is_api_request=False)
+
+class TestClientIp:
+    @pytest.mark.parametrize("headers,expected", [
+        ({"X-Forwarded-For": " 1.2.3.4 , 5.6.7.8"}, "1.2.3.4"),
+        ({"X-Forwarded-For": "1.2.3.4"}, "1.2.3.4"),
+        ({"X-Real-IP": "9.9.9.9"}, "9.9.9.9"),
+        ({}, "unknown"),
+    ])
+    def test_get_client_ip(self, headers, expected):
+        assert security_middleware.get_client_ip(_request(headers)) == expected
+
+class TestContentSecurityPolicyMiddleware:
+    def test_adds_csp_header_to_response_start(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from middleware.security_middleware import ContentSecurityPolicyMiddleware
+
+        app = FastAPI()
+
+        @app.get("/page")
+        def page():
+            return {"ok": True}
+
+        app.add_middleware(ContentSecurityPolicyMiddleware)
+        response = TestClient(app).get("/page")
+        assert response.json() == {"ok": True}
+        assert "connect-src 'self' ws: wss:" in response.headers["content-security-policy"]
+
+class TestLoggingMiddlewareSlowRequest:
+    @pytest.mark.parametrize("elapsed,performance_messages,api_messages", [
+        (4.0, ["느린 API 요청 감지"], []),
+        (6.0, ["느린 API 요청 감지 (5초 이상)"], []),
+        (11.0, ["매우 느린 API 요청 감지"], ["매우 느린 API 요청 감지"]),
+    ])
+    def test_slow_request_tiers(self, monkeypatch, elapsed, performance_messages, api_messages):
+        import logging
+        from types import SimpleNamespace
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from middleware import logging_middleware
+        from middleware.logging_middleware import LoggingMiddleware
+
+        app = FastAPI()
+
+        @app.get("/slow")
+        def slow():
+            return {"ok": True}
+
+        app.add_middleware(LoggingMiddleware)
+        ticks = iter([0.0, elapsed])
+        monkeypatch.setattr(logging_middleware, "time", SimpleNamespace(perf_counter=lambda: next(ticks)))
+
+        records = {"performance": [], "api.middleware": []}
+        handlers = {}
+        for name, collected in records.items():
+            handler = logging.Handler(logging.WARNING)
+            handler.emit = collected.append
+            handlers[name] = handler
+            logger = logging.getLogger(name)
+            logger.addHandler(handler)
+            monkeypatch.setattr(logger, "level", logging.INFO)
+        try:
+            assert TestClient(app).get("/slow").status_code == 200
+        finally:
+            for name, handler in handlers.items():
+                logging.getLogger(name).removeHandler(handler)
+
+        # performance.log에는 모든 단계가, 10초 초과는 콘솔/app.json/error.log에도 기록
+        assert [r.getMessage() for r in records["performance"]] == performance_messages
+        assert [r.getMessage() for r in records["api.middleware"]] == api_messages
+        assert records["performance"][0].extra_fields["endpoint"] == "/slow"
@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy.orm import Session
 import uuid
+import json
 from services.user_service import UserService
 from services.team_service import TeamService
 from services.planner_service import PlannerService
@@ -8,8 +9,11 @@ from services.todo_service import TodoService
 from services.post_service import PostService
 from services.reply_service import ReplyService
 from services.invite_service import InviteService
+from services.activity_service import ActivityService
+from services import email_service as email_module
 from core.exceptions import NotFoundError, ConflictError
-from datetime import date
+from schemas.reply import ReplyRead
+from datetime import date, datetime
 
 class TestUserService:
     def test_create_user_success(self, db_session: Session):
@@ -124,6 +128,24 @@ class TestReplyService:
         assert getattr(reply, 'content', None) == reply_data["content"]
         assert getattr(reply, 'post_id', None) == reply_data["post_id"]
 
+    def test_deleted_reply_content_hidden(self, db_session: Session, test_user, test_post):
+        service = ReplyService(db_session)
+        reply = service.create_reply({"content": "삭제될 댓글", "post_id": test_post.id}, test_user)
+        assert ReplyRead.model_validate(reply).content == "삭제될 댓글"
+        service.delete_reply(reply.id, test_user)
+        deleted = ReplyRead.model_validate(service.reply_repo.get(reply.id))
+        assert deleted.is_deleted
+        assert deleted.content == ""
+        assert deleted.model_dump()["content"] == ""
+
+    def test_deleted_reply_content_hidden_via_constructor(self):
+        now = datetime.now()
+        fields = dict(id=1, author_id=1, post_id=1, created_at=now, updated_at=now)
+        deleted = ReplyRead(content="삭제된 댓글", is_deleted=True, **fields)
+        assert deleted.content == ""
+        assert deleted.model_dump()["content"] == ""
+        assert ReplyRead(content="댓글", is_deleted=False, **fields).content == "댓글"
+
     def test_get_reply_by_id_not_found(self, db_session: Session, test_user):
         service = ReplyService(db_session)
         with pytest.raises(Exception):
@@ -150,4 +172,123 @@ class TestInviteService:
     def test_get_invite_by_id_not_found(self, db_session: Session, test_user):
         service = InviteService(db_session)
         with pytest.raises(Exception):
-            service.get_invite_by_id(99999, test_user) 
\ No newline at end of file
+            service.get_invite_by_id(99999, test_user) 
+
+class TestActivityService:
+    def test_log_activities_bulk(self, db_session: Session, test_user, test_team):
+        service = ActivityService(db_session)
+        count = service.log_activities([
+            {"user_id": test_user.id, "action": "create", "resource_type": "todo",
+             "description": f"할일 {i} 생성", "resource_id": i, "activity_metadata": {"index": i}}
+            for i in range(3)
+        ] + [{"user_id": test_user.id, "action": "join", "resource_type": "team",
+              "description": "팀 가입", "resource_id": test_team.id}])
+        assert count == 4
+        activities = service.get_user_activities(test_user.id)
+        assert sorted(a.description for a in activities) == ["팀 가입", "할일 0 생성", "할일 1 생성", "할일 2 생성"]
+        assert [a.description for a in service.get_team_activities(test_team.id)] == ["팀 가입"]
+        assert {a.user_name for a in activities} == {test_user.name}
+
+    def test_log_activity_without_refresh(self, db_session: Session, test_user):
+        activity = ActivityService(db_session).log_activity(
+            test_user.id, "create", "planner", "플래너 생성", resource_id=1
+        )
+        assert activity.id is not None
+        assert activity.created_at is not None  # DB 기본값은 접근 시 로드
+
+    def test_metadata_serialized_as_json_text(self, db_session: Session, test_user):
+        activity = ActivityService(db_session).log_activity(
+            test_user.id, "update", "todo", "할일 수정", activity_metadata={"필드": ["title"], "count": 1}
+        )
+        assert json.loads(activity.activity_metadata) == {"필드": ["title"], "count": 1}
+
+    def test_keyset_pagination_with_same_timestamp(self, db_session: Session, test_user):
+        service = ActivityService(db_session)
+        # 한 번의 INSERT로 기록되어 created_at이 같을 수 있는 활동들
+        service.log_activities([
+            {"user_id": test_user.id, "action": "create", "resource_type": "todo", "description": f"할일 {i}"}
+            for i in range(5)
+        ])
+        seen = []
+        before = before_id = None
+        for _ in range(5):  # 커서가 전진하지 않으면 무한 반복되지 않도록 제한
+            page = service.get_user_activities(test_user.id, limit=2, before=before, before_id=before_id)
+            if not page:
+                break
+            seen.extend(activity.id for activity in page)
+            before, before_id = page[-1].created_at, page[-1].id
+        assert seen == sorted(seen, reverse=True)
+        assert len(seen) == 5
+
+    def test_log_activities_empty(self, db_session: Session):
+        assert ActivityService(db_session).log_activities([]) == 0
+
+class TestEmailTemplates:
+    def test_verify_template_escapes_user_name(self):
+        html_content = email_module._VERIFY_TEMPLATE.render(user_name="<b>홍길동</b>", verification_code="123456")
+        assert "&lt;b&gt;홍길동&lt;/b&gt;님!" in html_content
+        assert "123456</span>" in html_content
+
+    def test_reset_template_renders_url(self):
+        html_content = email_module._RESET_TEMPLATE.render(user_name="홍길동", reset_url="http://localhost/reset-password?token=abc")
+        assert 'href="http://localhost/reset-password?token=abc"' in html_content
+
+class FakeSMTP:
+    """연결/로그인/발송 호출을 기록하는 smtplib.SMTP 대체 객체"""
+    instances = []
+
+    def __init__(self, server, port):
+        self.sent = []
+        self.rset_calls = 0
+        self.closed = False
+        self.disconnected = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def rset(self):
+        self.rset_calls += 1
+
+    def send_message(self, msg):
+        if self.disconnected:
+            raise email_module.smtplib.SMTPServerDisconnected("끊김")
+        self.sent.append(msg)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+class TestSmtpPool:
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        FakeSMTP.instances = []
+        monkeypatch.setattr(email_module.smtplib, "SMTP", FakeSMTP)
+        return email_module._SmtpPool()
+
+    def test_reuses_logged_in_connection(self, pool):
+        pool.send("smtp.example.com", 587, "user", "pw", "m1")
+        pool.send("smtp.example.com", 587, "user", "pw", "m2")
+        assert len(FakeSMTP.instances) == 1
+        assert FakeSMTP.instances[0].sent == ["m1", "m2"]
+        assert FakeSMTP.instances[0].rset_calls == 1
+
+    def test_reconnects_when_reused_connection_dropped(self, pool):
+        pool.send("smtp.example.com", 587, "user", "pw", "m1")
+        FakeSMTP.instances[0].disconnected = True
+        pool.send("smtp.example.com", 587, "user", "pw", "m2")
+        assert len(FakeSMTP.instances) == 2
+        assert FakeSMTP.instances[0].closed
+        assert FakeSMTP.instances[1].sent == ["m2"]
+
+    def test_close_all(self, pool):
+        pool.send("smtp.example.com", 587, "user", "pw", "m1")
+        pool.close_all()
+        assert FakeSMTP.instances[0].closed
+        pool.send("smtp.example.com", 587, "user", "pw", "m2")
+        assert len(FakeSMTP.instances) == 2
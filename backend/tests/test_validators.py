@@ -0,0 +1,95 @@
+import html
+import pytest
+from core.validators import input_validator
+from core.exceptions import ValidationError
+
+class TestSanitizeString:
+    def test_sanitize_string_escapes_html(self):
+        assert input_validator.sanitize_string("<b>홍길동</b>") == "&lt;b&gt;홍길동&lt;/b&gt;"
+
+    def test_sanitize_string_matches_html_escape(self):
+        value = "Tom & \"Jerry\" <i>'s</i>"
+        assert input_validator.sanitize_string(value) == html.escape(value)
+
+    @pytest.mark.parametrize("value", ["select * from users", "DROP table", "xUnIoNx", "eval("])
+    def test_sanitize_string_rejects_sql_keywords(self, value):
+        with pytest.raises(ValidationError):
+            input_validator.sanitize_string(value)
+
+    def test_sanitize_string_too_long(self):
+        with pytest.raises(ValidationError):
+            input_validator.sanitize_string("a" * 11, max_length=10)
+
+class TestValidateFileExtension:
+    def test_allowed_extension_case_insensitive(self):
+        assert input_validator.validate_file_extension("Report.PDF", ["pdf", "DOCX"]) == "Report.PDF"
+        assert input_validator.validate_file_extension("a.b.docx", ["pdf", "DOCX"]) == "a.b.docx"
+
+    @pytest.mark.parametrize("filename", ["noext", "image.exe", "pdf"])
+    def test_disallowed_extension(self, filename):
+        with pytest.raises(ValidationError):
+            input_validator.validate_file_extension(filename, ["pdf"])
+
+class TestValidateEmail:
+    def test_valid_email_is_normalized(self):
+        assert input_validator.validate_email("user@Gmail.com") == "user@gmail.com"
+        assert input_validator.validate_email("user@Gmail.com") == "user@gmail.com"
+
+    @pytest.mark.parametrize("email", ["not-an-email", "a@", "@b.com"])
+    def test_invalid_email_raises_every_time(self, email):
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                input_validator.validate_email(email)
+
+class TestValidateUrl:
+    @pytest.mark.parametrize("url", ["https://example.com", "HTTP://Example.COM/path?q=1", "http://localhost:8000/", "http://127.0.0.1"])
+    def test_valid_url(self, url):
+        assert input_validator.validate_url(url) == url
+
+    def test_empty_url(self):
+        assert input_validator.validate_url("") == ""
+
+    @pytest.mark.parametrize("url", ["ftp://example.com", "example.com", "http://", "http://exa mple.com"])
+    def test_invalid_url(self, url):
+        with pytest.raises(ValidationError):
+            input_validator.validate_url(url)
+
+class TestValidateJsonSchema:
+    def test_filters_unknown_fields(self):
+        data = {"title": "t", "extra": 1, "content": "c"}
+        assert input_validator.validate_json_schema(data, ["title"], ["content"]) == {"title": "t", "content": "c"}
+
+    def test_missing_required_field_reports_first_in_order(self):
+        with pytest.raises(ValidationError, match="title"):
+            input_validator.validate_json_schema({"other": 1}, ["title", "content"])
+
+class TestValidatePassword:
+    @pytest.mark.parametrize("password", ["TestPassword123", "aB3aaaaa", "1234abcD"])
+    def test_valid_password(self, password):
+        assert input_validator.validate_password(password) == password
+
+    @pytest.mark.parametrize("password", ["short1A", "alllowercase1", "ALLUPPERCASE1", "NoDigitsHere", "ÉÉÉÉabc1"])
+    def test_invalid_password(self, password):
+        with pytest.raises(ValidationError):
+            input_validator.validate_password(password)
+
+class TestValidateUsername:
+    @pytest.mark.parametrize("username", ["홍길동", "user 01", "Kim 철수"])
+    def test_valid_username(self, username):
+        assert input_validator.validate_username(username) == username.strip()
+
+    @pytest.mark.parametrize("username", ["", "a", "user_01", "中文名字", "café", "ㄱㄴ"])
+    def test_invalid_username(self, username):
+        with pytest.raises(ValidationError):
+            input_validator.validate_username(username)
+
+class TestValidateDateRange:
+    def test_valid_date_range(self):
+        start, end = input_validator.validate_date_range("2024-01-01", "2024-12-31T09:00:00+09:00")
+        assert start < end
+        assert start.utcoffset() == end.utcoffset()
+
+    @pytest.mark.parametrize("start_date,end_date", [("2024-12-31", "2024-01-01"), ("not-a-date", "2024-01-01")])
+    def test_invalid_date_range(self, start_date, end_date):
+        with pytest.raises(ValidationError):
+            input_validator.validate_date_range(start_date, end_date)